@@ -10,6 +10,7 @@ from .constants import (  # noqa: F401
     TARGET_FPS,
     Colors,
     GaugeDefaults,
+    GaugeId,
     Layouts,
     Units,
 )
@@ -12,50 +12,119 @@ import logging
 import sys
 from typing import Optional
 
-from PyQt5.QtCore import Qt, QTimer
-from PyQt5.QtGui import QColor, QFontDatabase, QIcon, QPalette
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QFontDatabase, QIcon, QPalette, QSurfaceFormat
 from PyQt5.QtWidgets import QApplication, QMainWindow, QWidget
 
 from ..data import CANDataSource, DataSource, MockDataSource
+from ..data._sim_kernels import warm_up as warm_up_sim_kernels
 from ..data.can_source import is_can_available
 from ..layouts import RaceLayout, SplashScreen
 from ..themes import get_theme_manager
 from ..utils import ValueSmoother
 from .config import Config
-from .constants import FONTS_DIR, ROBOTECHY_LOGO_PATH, SCREEN_HEIGHT, SCREEN_WIDTH
+from .constants import (
+    JAPANESE_ROBOT_ALT_TTF,
+    JAPANESE_ROBOT_TTF,
+    ROBOTECHY_LOGO_EXISTS,
+    ROBOTECHY_LOGO_STR,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def load_custom_fonts() -> str:
+def load_custom_fonts() -> QFont:
     """
     Load custom fonts from assets/fonts directory.
 
     Returns:
-        Name of loaded custom font, or "Roboto" as fallback.
+        Dashboard QFont using the custom family, or Roboto as fallback.
     """
-    # Try to load Japanese Robot font
-    japanese_robot = FONTS_DIR / "Japanese Robot.ttf"
-    if japanese_robot.exists():
-        font_id = QFontDatabase.addApplicationFont(str(japanese_robot))
-        if font_id >= 0:
-            families = QFontDatabase.applicationFontFamilies(font_id)
-            if families:
-                logger.info(f"Loaded custom font: {families[0]}")
-                return families[0]
+    family = "Roboto"
 
-    # Try alternative name
-    japanese_robot_alt = FONTS_DIR / "JapaneseRobot.ttf"
-    if japanese_robot_alt.exists():
-        font_id = QFontDatabase.addApplicationFont(str(japanese_robot_alt))
+    # Try the Japanese Robot font under both known file names. A missing
+    # file simply fails to register, so no separate exists() check is needed.
+    for font_path in (JAPANESE_ROBOT_TTF, JAPANESE_ROBOT_ALT_TTF):
+        font_id = QFontDatabase.addApplicationFont(font_path)
         if font_id >= 0:
             families = QFontDatabase.applicationFontFamilies(font_id)
             if families:
-                logger.info(f"Loaded custom font: {families[0]}")
-                return families[0]
+                family = families[0]
+                logger.info("Loaded custom font: %s", family)
+                break
+    else:
+        logger.info("Using default Roboto font")
+
+    font = QFont(family)
+    font.setStyleStrategy(
+        QFont.StyleStrategy(QFont.NoFontMerging | QFont.PreferAntialias)
+    )
+    return font
+
+
+def configure_opengl() -> None:
+    """
+    Request OpenGL ES rendering with vsync.
+
+    Must be called before the QApplication is created. Top-level
+    windows are then composited through the GPU and buffer swaps are
+    locked to the display refresh.
+    """
+    QApplication.setAttribute(Qt.AA_UseOpenGLES)
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
+    surface_format = QSurfaceFormat.defaultFormat()
+    surface_format.setRenderableType(QSurfaceFormat.OpenGLES)
+    surface_format.setSwapBehavior(QSurfaceFormat.DoubleBuffer)
+    surface_format.setSwapInterval(1)
+    QSurfaceFormat.setDefaultFormat(surface_format)
+    logger.info("OpenGL ES rendering enabled")
 
-    logger.info("Using default Roboto font")
-    return "Roboto"
+
+class _InitSignals(QObject):
+    """Signals for _InitWorker (QRunnable cannot emit signals itself)."""
+
+    # True if the CAN stack is usable
+    probed = pyqtSignal(bool)
+
+
+class _InitWorker(QRunnable):
+    """
+    Probe for CAN support off the GUI thread.
+
+    When the probe falls back to mock data, the simulation kernels are
+    warmed up here too so a first-boot JIT compile hides behind the splash.
+
+    Only the probe runs here; the data source QObject is created on the
+    GUI thread once the result arrives so its timers have the right
+    thread affinity.
+    """
+
+    def __init__(self, can_enabled: bool, use_mock: bool, signals: _InitSignals):
+        super().__init__()
+        self._can_enabled = can_enabled
+        self._use_mock = use_mock
+        self._signals = signals
+
+    def run(self) -> None:
+        """
+        Run the probe and report back via a queued signal.
+
+        Always reports, falling back to mock (False) if anything fails, so
+        the splash can hand off to the dashboard.
+        """
+        can_ready = False
+        try:
+            # Forced mock mode skips the probe and always needs the kernels
+            can_ready = not self._use_mock and self._can_enabled and is_can_available()
+            if not can_ready:
+                warm_up_sim_kernels()
+        except Exception:
+            logger.exception("Startup probe failed, falling back to mock data")
+            can_ready = False
+        self._signals.probed.emit(can_ready)
 
 
 class DashboardWindow(QMainWindow):
@@ -83,13 +152,16 @@ class DashboardWindow(QMainWindow):
         self.data_source = data_source
         self.smoother = ValueSmoother()
 
+        # Latest unrendered state; sources may emit faster than we repaint
+        self._pending_state = None
+
         # Window setup
         self.setWindowTitle("RoboDash")
         self.setFixedSize(SCREEN_WIDTH, SCREEN_HEIGHT)
 
         # Set window icon (for taskbar)
-        if ROBOTECHY_LOGO_PATH.exists():
-            self.setWindowIcon(QIcon(str(ROBOTECHY_LOGO_PATH)))
+        if ROBOTECHY_LOGO_EXISTS:
+            self.setWindowIcon(QIcon(ROBOTECHY_LOGO_STR))
 
         if config.display.frameless:
             self.setWindowFlags(Qt.FramelessWindowHint)
@@ -100,25 +172,46 @@ class DashboardWindow(QMainWindow):
         palette.setColor(QPalette.Window, QColor(10, 10, 10))
         palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
         self.setPalette(palette)
-        self.setStyleSheet("background-color: #0A0A0A;")
 
         # Create layout
         self.layout = RaceLayout(self)
         self.setCentralWidget(self.layout)
 
-        # Connect data source
+        # Connect data source. Every source emits on the GUI thread, so the
+        # default connection calls the slot directly.
         self.data_source.data_updated.connect(self._on_data_updated)
         self.data_source.connection_changed.connect(self._on_connection_changed)
 
+        # Let the source idle while the dashboard is hidden or minimized
+        self.layout.visibility_changed.connect(self.data_source.set_active)
+
+        # Render at the display rate, draining only the newest state
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setTimerType(Qt.PreciseTimer)
+        self._paint_timer.setInterval(max(1, 1000 // config.update_rate_hz))
+        self._paint_timer.timeout.connect(self._flush_state)
+        self._paint_timer.start()
+
         logger.info("DashboardWindow initialized")
 
     def _on_data_updated(self, state) -> None:
         """
         Handle incoming vehicle state updates.
 
+        Only stores the state; rendering happens in _flush_state().
+
         Args:
             state: New VehicleState from data source.
         """
+        self._pending_state = state
+
+    def _flush_state(self) -> None:
+        """Smooth and render the most recent pending state, if any."""
+        state = self._pending_state
+        if state is None:
+            return
+        self._pending_state = None
+
         # Apply smoothing
         smoothed = self.smoother.smooth_state(state)
 
@@ -132,9 +225,12 @@ class DashboardWindow(QMainWindow):
         Args:
             connected: New connection status.
         """
+        # A flaky bus can toggle this many times a second; skip the log
+        # record entirely when INFO is filtered out
         if connected:
             self.layout.hide_connection_warning()
-            logger.info("Data source connected")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Data source connected")
         else:
             self.layout.show_connection_warning()
             logger.warning("Data source disconnected")
@@ -150,6 +246,7 @@ class DashboardWindow(QMainWindow):
     def closeEvent(self, event) -> None:
         """Handle window close."""
         logger.info("Closing dashboard window")
+        self._paint_timer.stop()
         self.stop_data()
         self.layout.cleanup()
         event.accept()
@@ -200,6 +297,8 @@ class DashboardApp:
         self.splash: Optional[SplashScreen] = None
         self.window: Optional[DashboardWindow] = None
         self.data_source: Optional[DataSource] = None
+        self._init_signals: Optional[_InitSignals] = None
+        self._splash_done = False
 
     def run(self) -> int:
         """
@@ -208,18 +307,26 @@ class DashboardApp:
         Returns:
             Exit code.
         """
+        # GL attributes only take effect before QApplication exists
+        if self.config.display.opengl:
+            configure_opengl()
+
+        # Coalesce bursts of high-rate events instead of queueing each one
+        QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
+        QApplication.setAttribute(Qt.AA_CompressTabletEvents, True)
+
         # Create QApplication
         self.app = QApplication(sys.argv)
         self.app.setApplicationName("RoboDash")
         self.app.setApplicationVersion(self.config.app_version)
 
         # Load custom fonts
-        custom_font = load_custom_fonts()
-        self.app.setProperty("custom_font", custom_font)
+        # Widgets derive their per-size fonts from this shared QFont
+        self.app.setProperty("dashboard_font", load_custom_fonts())
 
         # Set application icon (for taskbar/dock)
-        if ROBOTECHY_LOGO_PATH.exists():
-            self.app.setWindowIcon(QIcon(str(ROBOTECHY_LOGO_PATH)))
+        if ROBOTECHY_LOGO_EXISTS:
+            self.app.setWindowIcon(QIcon(ROBOTECHY_LOGO_STR))
 
         # Apply theme
         theme_manager = get_theme_manager()
@@ -230,8 +337,12 @@ class DashboardApp:
         self.splash.finished.connect(self._on_splash_finished)
         self.splash.set_status("Initializing...")
 
-        # Initialize data source during splash
-        QTimer.singleShot(100, self._init_data_source)
+        # Probe for CAN on a pool thread so the splash keeps animating
+        self._init_signals = _InitSignals()
+        self._init_signals.probed.connect(self._init_data_source)
+        QThreadPool.globalInstance().start(
+            _InitWorker(self.config.can.enabled, self.use_mock, self._init_signals)
+        )
 
         # Start splash
         self.splash.start()
@@ -239,8 +350,13 @@ class DashboardApp:
         # Run event loop
         return self.app.exec_()
 
-    def _init_data_source(self) -> None:
-        """Initialize the data source."""
+    def _init_data_source(self, can_ready: bool) -> None:
+        """
+        Initialize the data source.
+
+        Args:
+            can_ready: Result of the background CAN probe.
+        """
         self.splash.set_status("Connecting to ECU...")
 
         if self.use_mock:
@@ -251,17 +367,18 @@ class DashboardApp:
             )
             if self.enable_sound:
                 self.splash.set_status("Simulation mode (with sound)")
-        elif self.config.can.enabled and is_can_available():
+        elif can_ready:
             try:
                 logger.info("Attempting CAN connection...")
                 self.data_source = CANDataSource(
                     channel=self.config.can.channel,
                     bitrate=self.config.can.bitrate,
                     base_id=self.config.can.base_id,
+                    timeout_ms=self.config.can.timeout_ms,
                 )
                 self.splash.set_status("CAN bus connected")
             except Exception as e:
-                logger.warning(f"CAN init failed: {e}, falling back to mock")
+                logger.warning("CAN init failed: %s, falling back to mock", e)
                 self.splash.set_status("Using simulation mode")
                 self.data_source = MockDataSource(
                     update_rate_hz=self.config.update_rate_hz,
@@ -275,8 +392,22 @@ class DashboardApp:
                 enable_sound=self.enable_sound,
             )
 
+        # Probe outlasted the splash; show the window now
+        if self._splash_done:
+            self._show_window()
+
     def _on_splash_finished(self) -> None:
         """Handle splash screen completion."""
+        self._splash_done = True
+
+        # Probe still running; _init_data_source will show the window
+        if self.data_source is None:
+            return
+
+        self._show_window()
+
+    def _show_window(self) -> None:
+        """Hide the splash and show the dashboard window."""
         logger.info("Splash finished, showing main window")
 
         # Hide splash
@@ -292,7 +423,7 @@ class DashboardApp:
             for screen in screens:
                 if screen != self.app.primaryScreen():
                     self.window.move(screen.geometry().topLeft())
-                    logger.info(f"Moved window to screen: {screen.name()}")
+                    logger.info("Moved window to screen: %s", screen.name())
                     break
 
         # Show window
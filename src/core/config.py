@@ -5,42 +5,141 @@ Handles loading, saving, and runtime access to user preferences
 and application settings.
 """
 
+import hashlib
 import logging
-from dataclasses import asdict, dataclass, field
+import pickle
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+# Prefer the libyaml-backed C loader/dumper; fall back to pure Python
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 from .constants import (
     CAN_BITRATE,
     CAN_CHANNEL,
     CAN_TIMEOUT_MS,
     DEFAULT_CONFIG_PATH,
     EMU_BASE_ID,
+    GAUGE_AFR_MAX,
+    GAUGE_AFR_MIN,
+    GAUGE_BATTERY_MAX,
+    GAUGE_BATTERY_MIN,
+    GAUGE_BATTERY_WARNING_HIGH,
+    GAUGE_BATTERY_WARNING_LOW,
+    GAUGE_BOOST_MAX,
+    GAUGE_BOOST_MIN,
+    GAUGE_BOOST_WARNING,
+    GAUGE_COOLANT_CRITICAL,
+    GAUGE_COOLANT_MAX,
+    GAUGE_COOLANT_MIN,
+    GAUGE_COOLANT_WARNING,
+    GAUGE_OIL_PRESSURE_MAX,
+    GAUGE_OIL_PRESSURE_MIN,
+    GAUGE_OIL_PRESSURE_WARNING_LOW,
+    GAUGE_OIL_TEMP_CRITICAL,
+    GAUGE_OIL_TEMP_MAX,
+    GAUGE_OIL_TEMP_MIN,
+    GAUGE_OIL_TEMP_WARNING,
+    GAUGE_RPM_MAX,
+    GAUGE_RPM_MIN,
+    GAUGE_RPM_REDLINE,
+    GAUGE_RPM_SHIFT_LIGHT,
+    GAUGE_SPEED_MAX_MPH,
+    GAUGE_SPEED_MIN,
+    LAYOUT_RACE,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     TARGET_FPS,
-    GaugeDefaults,
-    Layouts,
-    Units,
+    UNIT_PRESSURE_BAR,
+    UNIT_SPEED_MPH,
+    UNIT_TEMP_CELSIUS,
+    GaugeId,
 )
+from .slots import slotted
 
 logger = logging.getLogger(__name__)
 
+# Parsed configs are pickled to <config dir>/.cache so warm boots skip YAML.
+# Bump when the Config dataclass layout changes to invalidate old caches.
+CONFIG_CACHE_DIRNAME = ".cache"
+CONFIG_CACHE_VERSION = 5
 
-@dataclass
+
+def _apply(target: Any, src: Dict[str, Any], keys: Tuple[str, ...]) -> None:
+    """
+    Copy only the keys present in a YAML section onto a config object.
+
+    Absent keys keep the target's current (default) value.
+    """
+    for key in keys:
+        if key in src:
+            setattr(target, key, src[key])
+
+
+# A colored gauge zone: (start, end, color)
+Zone = Tuple[float, float, str]
+
+
+@slotted
+@dataclass(frozen=True)
 class GaugeConfig:
-    """Configuration for a single gauge."""
+    """
+    Configuration for a single gauge.
+
+    Immutable, so default entries can be shared between Config instances;
+    use dataclasses.replace() to derive a modified gauge.
+    """
 
     min: float
     max: float
     warning: Optional[float] = None
     critical: Optional[float] = None
     warning_low: Optional[float] = None
-    zones: List[Dict[str, Any]] = field(default_factory=list)
+    zones: Tuple[Zone, ...] = ()
 
+    @classmethod
+    def from_dict(cls, base: "GaugeConfig", data: Dict[str, Any]) -> "GaugeConfig":
+        """
+        Derive a gauge from a YAML section; absent keys keep base's values.
+
+        Args:
+            base: Gauge supplying the defaults.
+            data: YAML gauge section.
 
+        Returns:
+            New GaugeConfig (base itself if the section sets nothing).
+        """
+        changes = {key: data[key] for key in cls.__slots__ if key in data}
+        if "zones" in changes:
+            changes["zones"] = tuple(
+                (zone["start"], zone["end"], zone["color"]) for zone in data["zones"]
+            )
+        return replace(base, **changes) if changes else base
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for serialization."""
+        return {
+            "min": self.min,
+            "max": self.max,
+            "warning": self.warning,
+            "critical": self.critical,
+            "warning_low": self.warning_low,
+            "zones": [
+                {"start": start, "end": end, "color": color}
+                for start, end, color in self.zones
+            ],
+        }
+
+
+@slotted
 @dataclass
 class DisplayConfig:
     """Display settings."""
@@ -50,8 +149,21 @@ class DisplayConfig:
     fullscreen: bool = True
     frameless: bool = True
     orientation: int = 0
+    opengl: bool = False
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for serialization."""
+        return {
+            "width": self.width,
+            "height": self.height,
+            "fullscreen": self.fullscreen,
+            "frameless": self.frameless,
+            "orientation": self.orientation,
+            "opengl": self.opengl,
+        }
 
+
+@slotted
 @dataclass
 class CANConfig:
     """CAN bus settings."""
@@ -62,14 +174,33 @@ class CANConfig:
     base_id: int = EMU_BASE_ID
     timeout_ms: int = CAN_TIMEOUT_MS
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for serialization."""
+        return {
+            "enabled": self.enabled,
+            "channel": self.channel,
+            "bitrate": self.bitrate,
+            "base_id": self.base_id,
+            "timeout_ms": self.timeout_ms,
+        }
+
 
+@slotted
 @dataclass
 class UnitsConfig:
     """Unit preferences."""
 
-    speed: str = Units.SPEED_MPH  # UK default
-    temperature: str = Units.TEMP_CELSIUS
-    pressure: str = Units.PRESSURE_BAR
+    speed: str = UNIT_SPEED_MPH  # UK default
+    temperature: str = UNIT_TEMP_CELSIUS
+    pressure: str = UNIT_PRESSURE_BAR
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dict for serialization."""
+        return {
+            "speed": self.speed,
+            "temperature": self.temperature,
+            "pressure": self.pressure,
+        }
 
 
 @dataclass
@@ -78,6 +209,10 @@ class Config:
     Main application configuration.
 
     Handles loading from YAML files and provides defaults for all settings.
+
+    Gauges are a tuple indexed by GaugeId (config.gauges[GaugeId.RPM]).
+    Default entries are shared with the module-level _DEFAULT_GAUGES
+    template; GaugeConfig is frozen, so changes build a new tuple.
     """
 
     # Application
@@ -95,13 +230,13 @@ class Config:
     units: UnitsConfig = field(default_factory=UnitsConfig)
 
     # Layout
-    current_layout: str = Layouts.RACE
+    current_layout: str = LAYOUT_RACE
 
     # Theme
     theme: str = "robotechy_dark"
 
     # Gauge configurations
-    gauges: Dict[str, GaugeConfig] = field(default_factory=dict)
+    gauges: Tuple[GaugeConfig, ...] = ()
 
     # Splash screen
     splash_duration_ms: int = 2500
@@ -109,60 +244,61 @@ class Config:
     def __post_init__(self):
         """Initialize default gauge configurations if not provided."""
         if not self.gauges:
-            self.gauges = self._default_gauges()
+            self.gauges = _DEFAULT_GAUGES
 
     @staticmethod
-    def _default_gauges() -> Dict[str, GaugeConfig]:
-        """Create default gauge configurations."""
-        return {
+    def _default_gauges() -> Tuple[GaugeConfig, ...]:
+        """Create default gauge configurations in GaugeId order."""
+        by_name = {
             "rpm": GaugeConfig(
-                min=GaugeDefaults.RPM_MIN,
-                max=GaugeDefaults.RPM_MAX,
-                warning=GaugeDefaults.RPM_SHIFT_LIGHT,
-                critical=GaugeDefaults.RPM_REDLINE,
-                zones=[
-                    {"start": 0, "end": 6000, "color": "#9EFF11"},
-                    {"start": 6000, "end": 6800, "color": "#FFAA00"},
-                    {"start": 6800, "end": 8000, "color": "#FF0000"},
-                ],
+                min=GAUGE_RPM_MIN,
+                max=GAUGE_RPM_MAX,
+                warning=GAUGE_RPM_SHIFT_LIGHT,
+                critical=GAUGE_RPM_REDLINE,
+                zones=(
+                    (0, 6000, "#9EFF11"),
+                    (6000, 6800, "#FFAA00"),
+                    (6800, 8000, "#FF0000"),
+                ),
             ),
             "speed": GaugeConfig(
-                min=GaugeDefaults.SPEED_MIN,
-                max=GaugeDefaults.SPEED_MAX_MPH,  # Adjusted per unit selection
+                min=GAUGE_SPEED_MIN,
+                max=GAUGE_SPEED_MAX_MPH,  # Adjusted per unit selection
             ),
             "boost": GaugeConfig(
-                min=GaugeDefaults.BOOST_MIN,
-                max=GaugeDefaults.BOOST_MAX,
-                warning=GaugeDefaults.BOOST_WARNING,
+                min=GAUGE_BOOST_MIN,
+                max=GAUGE_BOOST_MAX,
+                warning=GAUGE_BOOST_WARNING,
             ),
             "coolant_temp": GaugeConfig(
-                min=GaugeDefaults.COOLANT_MIN,
-                max=GaugeDefaults.COOLANT_MAX,
-                warning=GaugeDefaults.COOLANT_WARNING,
-                critical=GaugeDefaults.COOLANT_CRITICAL,
+                min=GAUGE_COOLANT_MIN,
+                max=GAUGE_COOLANT_MAX,
+                warning=GAUGE_COOLANT_WARNING,
+                critical=GAUGE_COOLANT_CRITICAL,
             ),
             "oil_temp": GaugeConfig(
-                min=GaugeDefaults.OIL_TEMP_MIN,
-                max=GaugeDefaults.OIL_TEMP_MAX,
-                warning=GaugeDefaults.OIL_TEMP_WARNING,
-                critical=GaugeDefaults.OIL_TEMP_CRITICAL,
+                min=GAUGE_OIL_TEMP_MIN,
+                max=GAUGE_OIL_TEMP_MAX,
+                warning=GAUGE_OIL_TEMP_WARNING,
+                critical=GAUGE_OIL_TEMP_CRITICAL,
             ),
             "oil_pressure": GaugeConfig(
-                min=GaugeDefaults.OIL_PRESSURE_MIN,
-                max=GaugeDefaults.OIL_PRESSURE_MAX,
-                warning_low=GaugeDefaults.OIL_PRESSURE_WARNING_LOW,
+                min=GAUGE_OIL_PRESSURE_MIN,
+                max=GAUGE_OIL_PRESSURE_MAX,
+                warning_low=GAUGE_OIL_PRESSURE_WARNING_LOW,
             ),
             "afr": GaugeConfig(
-                min=GaugeDefaults.AFR_MIN,
-                max=GaugeDefaults.AFR_MAX,
+                min=GAUGE_AFR_MIN,
+                max=GAUGE_AFR_MAX,
             ),
             "battery": GaugeConfig(
-                min=GaugeDefaults.BATTERY_MIN,
-                max=GaugeDefaults.BATTERY_MAX,
-                warning_low=GaugeDefaults.BATTERY_WARNING_LOW,
-                warning=GaugeDefaults.BATTERY_WARNING_HIGH,
+                min=GAUGE_BATTERY_MIN,
+                max=GAUGE_BATTERY_MAX,
+                warning_low=GAUGE_BATTERY_WARNING_LOW,
+                warning=GAUGE_BATTERY_WARNING_HIGH,
             ),
         }
+        return tuple(by_name[gauge.name.lower()] for gauge in GaugeId)
 
     @classmethod
     def load(cls, path: Optional[Path] = None) -> "Config":
@@ -181,16 +317,71 @@ class Config:
             logger.warning(f"Config file not found at {config_path}, using defaults")
             return cls()
 
+        cache_path = cls._cache_path(config_path)
+        cached = cls._read_cache(cache_path)
+        if cached is not None:
+            return cached
+
         try:
             with open(config_path, "r") as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=_Loader) or {}
 
-            return cls._from_dict(data)
+            config = cls._from_dict(data)
 
         except Exception as e:
             logger.error(f"Failed to load config from {config_path}: {e}")
             return cls()
 
+        cls._write_cache(cache_path, config)
+        return config
+
+    @staticmethod
+    def _cache_path(config_path: Path) -> Path:
+        """
+        Get the pickle cache path for a config file.
+
+        The filename is keyed on the file's path, mtime and size, so any
+        edit to the YAML produces a new key and the stale cache is ignored.
+        """
+        stat = config_path.stat()
+        path_key = hashlib.sha1(str(config_path.resolve()).encode()).hexdigest()[:12]
+        return (
+            config_path.parent
+            / CONFIG_CACHE_DIRNAME
+            / (
+                f"{config_path.name}.{path_key}."
+                f"{stat.st_mtime_ns:x}-{stat.st_size:x}-v{CONFIG_CACHE_VERSION}.pickle"
+            )
+        )
+
+    @classmethod
+    def _read_cache(cls, cache_path: Path) -> Optional["Config"]:
+        """Load a cached Config, or None if missing or unreadable."""
+        try:
+            with open(cache_path, "rb") as f:
+                config = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache {cache_path}: {e}")
+            return None
+
+        return config if isinstance(config, cls) else None
+
+    @staticmethod
+    def _write_cache(cache_path: Path, config: "Config") -> None:
+        """Write a Config to the pickle cache, removing stale entries."""
+        prefix = cache_path.name.rsplit(".", 2)[0]
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in cache_path.parent.glob(f"{prefix}.*.pickle"):
+                stale.unlink()
+            with open(cache_path, "wb") as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            # Read-only filesystems are fine - we just parse YAML every boot
+            logger.debug(f"Could not write config cache {cache_path}: {e}")
+
     @classmethod
     def _from_dict(cls, data: Dict[str, Any]) -> "Config":
         """Create Config from dictionary (parsed YAML)."""
@@ -199,68 +390,49 @@ class Config:
         # Application settings
         if "app" in data:
             app = data["app"]
-            config.app_name = app.get("name", config.app_name)
-            config.app_version = app.get("version", config.app_version)
-            config.update_rate_hz = app.get("update_rate_hz", config.update_rate_hz)
-
-        # Display settings
+            if "name" in app:
+                config.app_name = app["name"]
+            if "version" in app:
+                config.app_version = app["version"]
+            if "update_rate_hz" in app:
+                config.update_rate_hz = app["update_rate_hz"]
+
+        # Display, CAN and unit sections are edited in place
         if "display" in data:
-            d = data["display"]
-            config.display = DisplayConfig(
-                width=d.get("width", SCREEN_WIDTH),
-                height=d.get("height", SCREEN_HEIGHT),
-                fullscreen=d.get("fullscreen", True),
-                frameless=d.get("frameless", True),
-                orientation=d.get("orientation", 0),
-            )
-
-        # CAN settings
+            _apply(config.display, data["display"], DisplayConfig.__slots__)
         if "can" in data:
-            c = data["can"]
-            config.can = CANConfig(
-                enabled=c.get("enabled", True),
-                channel=c.get("channel", CAN_CHANNEL),
-                bitrate=c.get("bitrate", CAN_BITRATE),
-                base_id=c.get("base_id", EMU_BASE_ID),
-                timeout_ms=c.get("timeout_ms", CAN_TIMEOUT_MS),
-            )
-
-        # Unit preferences
+            _apply(config.can, data["can"], CANConfig.__slots__)
         if "units" in data:
-            u = data["units"]
-            config.units = UnitsConfig(
-                speed=u.get("speed", Units.SPEED_MPH),
-                temperature=u.get("temperature", Units.TEMP_CELSIUS),
-                pressure=u.get("pressure", Units.PRESSURE_BAR),
-            )
+            _apply(config.units, data["units"], UnitsConfig.__slots__)
 
         # Layout
-        if "layout" in data:
-            config.current_layout = data["layout"].get("current", Layouts.RACE)
+        if "layout" in data and "current" in data["layout"]:
+            config.current_layout = data["layout"]["current"]
 
         # Theme
-        if "theme" in data:
-            config.theme = data["theme"].get("current", "robotechy_dark")
+        if "theme" in data and "current" in data["theme"]:
+            config.theme = data["theme"]["current"]
 
         # Splash
-        if "splash" in data:
-            config.splash_duration_ms = data["splash"].get("duration_ms", 2500)
+        if "splash" in data and "duration_ms" in data["splash"]:
+            config.splash_duration_ms = data["splash"]["duration_ms"]
 
-        # Gauge configurations
+        # Gauge configurations (unknown gauge names are ignored)
         if "gauges" in data:
+            gauges = list(config.gauges)
             for name, gauge_data in data["gauges"].items():
-                if name in config.gauges:
-                    config.gauges[name] = GaugeConfig(
-                        min=gauge_data.get("min", config.gauges[name].min),
-                        max=gauge_data.get("max", config.gauges[name].max),
-                        warning=gauge_data.get("warning"),
-                        critical=gauge_data.get("critical"),
-                        warning_low=gauge_data.get("warning_low"),
-                        zones=gauge_data.get("zones", []),
-                    )
+                index = _GAUGE_INDEX.get(name)
+                if index is not None:
+                    gauges[index] = GaugeConfig.from_dict(gauges[index], gauge_data)
+            config.gauges = tuple(gauges)
 
         return config
 
+    @property
+    def gauges_by_name(self) -> Dict[str, GaugeConfig]:
+        """Gauges keyed by their YAML name, for the load/save path."""
+        return dict(zip(_GAUGE_NAMES, self.gauges))
+
     def save(self, path: Optional[Path] = None) -> None:
         """
         Save configuration to a YAML file.
@@ -276,18 +448,30 @@ class Config:
                 "version": self.app_version,
                 "update_rate_hz": self.update_rate_hz,
             },
-            "display": asdict(self.display),
-            "can": asdict(self.can),
-            "units": asdict(self.units),
+            "display": self.display.to_dict(),
+            "can": self.can.to_dict(),
+            "units": self.units.to_dict(),
             "layout": {"current": self.current_layout},
             "theme": {"current": self.theme},
             "splash": {"duration_ms": self.splash_duration_ms},
-            "gauges": {name: asdict(gauge) for name, gauge in self.gauges.items()},
+            "gauges": {
+                name: gauge.to_dict() for name, gauge in self.gauges_by_name.items()
+            },
         }
 
         config_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(config_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                data, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False
+            )
 
         logger.info(f"Configuration saved to {config_path}")
+
+
+# YAML gauge names in GaugeId order, and the reverse lookup
+_GAUGE_NAMES: Tuple[str, ...] = tuple(gauge.name.lower() for gauge in GaugeId)
+_GAUGE_INDEX: Dict[str, int] = {name: i for i, name in enumerate(_GAUGE_NAMES)}
+
+# Built once and shared by every Config() that uses the defaults
+_DEFAULT_GAUGES: Tuple[GaugeConfig, ...] = Config._default_gauges()
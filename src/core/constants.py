@@ -3,8 +3,13 @@ Application-wide constants for RoboDash.
 
 Reference: https://github.com/valtsu23/DIY-Emu-Black-Dash
 ECU Protocol: https://github.com/designer2k2/EMUcan
+
+Constants are flat module globals (COLOR_*, GAUGE_*, UNIT_*, LAYOUT_*) so
+lookups are a single global load. The Colors, GaugeDefaults, Units and
+Layouts classes remain as namespace aliases for existing callers.
 """
 
+from enum import IntEnum
 from pathlib import Path
 
 # =============================================================================
@@ -38,131 +43,211 @@ CAN_TIMEOUT_MS = 1000
 # Robotechy Brand Colors
 # =============================================================================
 
+# Backgrounds
+COLOR_BACKGROUND = "#0A0A0A"
+COLOR_SURFACE = "#1A1A1A"
+COLOR_SURFACE_ELEVATED = "#242424"
 
-class Colors:
-    """Robotechy dark theme color palette."""
+# Borders
+COLOR_BORDER = "#333333"
+COLOR_BORDER_LIGHT = "#444444"
 
-    # Backgrounds
-    BACKGROUND = "#0A0A0A"
-    SURFACE = "#1A1A1A"
-    SURFACE_ELEVATED = "#242424"
+# Text
+COLOR_TEXT_PRIMARY = "#FFFFFF"
+COLOR_TEXT_SECONDARY = "#888888"
+COLOR_TEXT_DISABLED = "#555555"
 
-    # Borders
-    BORDER = "#333333"
-    BORDER_LIGHT = "#444444"
+# Brand
+COLOR_ROBOTECHY_GREEN = "#9EFF11"  # Official Robotechy luminous green
+COLOR_ACCENT = COLOR_ROBOTECHY_GREEN
 
-    # Text
-    TEXT_PRIMARY = "#FFFFFF"
-    TEXT_SECONDARY = "#888888"
-    TEXT_DISABLED = "#555555"
+# Status colors
+COLOR_NORMAL = COLOR_ROBOTECHY_GREEN
+COLOR_WARNING = "#FFAA00"
+COLOR_CRITICAL = "#FF0000"
+COLOR_INFO = "#00AAFF"
 
-    # Brand
-    ROBOTECHY_GREEN = "#9EFF11"  # Official Robotechy luminous green
-    ACCENT = ROBOTECHY_GREEN
+# Gauge specific
+COLOR_GAUGE_BACKGROUND = "#1A1A1A"
+COLOR_GAUGE_ARC = "#333333"
+COLOR_GAUGE_NEEDLE = "#FFFFFF"
 
-    # Status colors
-    NORMAL = ROBOTECHY_GREEN
-    WARNING = "#FFAA00"
-    CRITICAL = "#FF0000"
-    INFO = "#00AAFF"
+# RPM zones
+COLOR_RPM_NORMAL = COLOR_ROBOTECHY_GREEN
+COLOR_RPM_WARNING = "#FFAA00"
+COLOR_RPM_REDLINE = "#FF0000"
 
-    # Gauge specific
-    GAUGE_BACKGROUND = "#1A1A1A"
-    GAUGE_ARC = "#333333"
-    GAUGE_NEEDLE = "#FFFFFF"
 
-    # RPM zones
-    RPM_NORMAL = ROBOTECHY_GREEN
-    RPM_WARNING = "#FFAA00"
-    RPM_REDLINE = "#FF0000"
+class Colors:
+    """Robotechy dark theme color palette."""
+
+    BACKGROUND = COLOR_BACKGROUND
+    SURFACE = COLOR_SURFACE
+    SURFACE_ELEVATED = COLOR_SURFACE_ELEVATED
+    BORDER = COLOR_BORDER
+    BORDER_LIGHT = COLOR_BORDER_LIGHT
+    TEXT_PRIMARY = COLOR_TEXT_PRIMARY
+    TEXT_SECONDARY = COLOR_TEXT_SECONDARY
+    TEXT_DISABLED = COLOR_TEXT_DISABLED
+    ROBOTECHY_GREEN = COLOR_ROBOTECHY_GREEN
+    ACCENT = COLOR_ACCENT
+    NORMAL = COLOR_NORMAL
+    WARNING = COLOR_WARNING
+    CRITICAL = COLOR_CRITICAL
+    INFO = COLOR_INFO
+    GAUGE_BACKGROUND = COLOR_GAUGE_BACKGROUND
+    GAUGE_ARC = COLOR_GAUGE_ARC
+    GAUGE_NEEDLE = COLOR_GAUGE_NEEDLE
+    RPM_NORMAL = COLOR_RPM_NORMAL
+    RPM_WARNING = COLOR_RPM_WARNING
+    RPM_REDLINE = COLOR_RPM_REDLINE
 
 
 # =============================================================================
 # Gauge Defaults
 # =============================================================================
 
+# RPM
+GAUGE_RPM_MIN = 0
+GAUGE_RPM_MAX = 8000
+GAUGE_RPM_REDLINE = 7200
+GAUGE_RPM_SHIFT_LIGHT = 6800
+
+# Speed (stored internally as km/h)
+GAUGE_SPEED_MIN = 0
+GAUGE_SPEED_MAX_KMH = 320
+GAUGE_SPEED_MAX_MPH = 200
+
+# Boost pressure (bar)
+GAUGE_BOOST_MIN = -1.0  # Vacuum
+GAUGE_BOOST_MAX = 2.5
+GAUGE_BOOST_WARNING = 2.0
+
+# Coolant temperature (Celsius)
+GAUGE_COOLANT_MIN = 0
+GAUGE_COOLANT_MAX = 140
+GAUGE_COOLANT_WARNING = 105
+GAUGE_COOLANT_CRITICAL = 115
+
+# Oil temperature (Celsius)
+GAUGE_OIL_TEMP_MIN = 0
+GAUGE_OIL_TEMP_MAX = 160
+GAUGE_OIL_TEMP_WARNING = 120
+GAUGE_OIL_TEMP_CRITICAL = 140
+
+# Oil pressure (bar)
+GAUGE_OIL_PRESSURE_MIN = 0
+GAUGE_OIL_PRESSURE_MAX = 10
+GAUGE_OIL_PRESSURE_WARNING_LOW = 1.0
+
+# AFR
+GAUGE_AFR_MIN = 10.0
+GAUGE_AFR_MAX = 20.0
+GAUGE_AFR_STOICH = 14.7
+
+# Battery voltage
+GAUGE_BATTERY_MIN = 10.0
+GAUGE_BATTERY_MAX = 16.0
+GAUGE_BATTERY_WARNING_LOW = 12.0
+GAUGE_BATTERY_WARNING_HIGH = 15.0
+
 
 class GaugeDefaults:
     """Default gauge ranges and thresholds."""
 
-    # RPM
-    RPM_MIN = 0
-    RPM_MAX = 8000
-    RPM_REDLINE = 7200
-    RPM_SHIFT_LIGHT = 6800
-
-    # Speed (stored internally as km/h)
-    SPEED_MIN = 0
-    SPEED_MAX_KMH = 320
-    SPEED_MAX_MPH = 200
-
-    # Boost pressure (bar)
-    BOOST_MIN = -1.0  # Vacuum
-    BOOST_MAX = 2.5
-    BOOST_WARNING = 2.0
-
-    # Coolant temperature (Celsius)
-    COOLANT_MIN = 0
-    COOLANT_MAX = 140
-    COOLANT_WARNING = 105
-    COOLANT_CRITICAL = 115
-
-    # Oil temperature (Celsius)
-    OIL_TEMP_MIN = 0
-    OIL_TEMP_MAX = 160
-    OIL_TEMP_WARNING = 120
-    OIL_TEMP_CRITICAL = 140
-
-    # Oil pressure (bar)
-    OIL_PRESSURE_MIN = 0
-    OIL_PRESSURE_MAX = 10
-    OIL_PRESSURE_WARNING_LOW = 1.0
-
-    # AFR
-    AFR_MIN = 10.0
-    AFR_MAX = 20.0
-    AFR_STOICH = 14.7
-
-    # Battery voltage
-    BATTERY_MIN = 10.0
-    BATTERY_MAX = 16.0
-    BATTERY_WARNING_LOW = 12.0
-    BATTERY_WARNING_HIGH = 15.0
+    RPM_MIN = GAUGE_RPM_MIN
+    RPM_MAX = GAUGE_RPM_MAX
+    RPM_REDLINE = GAUGE_RPM_REDLINE
+    RPM_SHIFT_LIGHT = GAUGE_RPM_SHIFT_LIGHT
+    SPEED_MIN = GAUGE_SPEED_MIN
+    SPEED_MAX_KMH = GAUGE_SPEED_MAX_KMH
+    SPEED_MAX_MPH = GAUGE_SPEED_MAX_MPH
+    BOOST_MIN = GAUGE_BOOST_MIN
+    BOOST_MAX = GAUGE_BOOST_MAX
+    BOOST_WARNING = GAUGE_BOOST_WARNING
+    COOLANT_MIN = GAUGE_COOLANT_MIN
+    COOLANT_MAX = GAUGE_COOLANT_MAX
+    COOLANT_WARNING = GAUGE_COOLANT_WARNING
+    COOLANT_CRITICAL = GAUGE_COOLANT_CRITICAL
+    OIL_TEMP_MIN = GAUGE_OIL_TEMP_MIN
+    OIL_TEMP_MAX = GAUGE_OIL_TEMP_MAX
+    OIL_TEMP_WARNING = GAUGE_OIL_TEMP_WARNING
+    OIL_TEMP_CRITICAL = GAUGE_OIL_TEMP_CRITICAL
+    OIL_PRESSURE_MIN = GAUGE_OIL_PRESSURE_MIN
+    OIL_PRESSURE_MAX = GAUGE_OIL_PRESSURE_MAX
+    OIL_PRESSURE_WARNING_LOW = GAUGE_OIL_PRESSURE_WARNING_LOW
+    AFR_MIN = GAUGE_AFR_MIN
+    AFR_MAX = GAUGE_AFR_MAX
+    AFR_STOICH = GAUGE_AFR_STOICH
+    BATTERY_MIN = GAUGE_BATTERY_MIN
+    BATTERY_MAX = GAUGE_BATTERY_MAX
+    BATTERY_WARNING_LOW = GAUGE_BATTERY_WARNING_LOW
+    BATTERY_WARNING_HIGH = GAUGE_BATTERY_WARNING_HIGH
+
+
+class GaugeId(IntEnum):
+    """
+    Index of each gauge in Config.gauges.
+
+    The lowercased member name is the gauge's key in the YAML config.
+    """
+
+    RPM = 0
+    SPEED = 1
+    BOOST = 2
+    COOLANT_TEMP = 3
+    OIL_TEMP = 4
+    OIL_PRESSURE = 5
+    AFR = 6
+    BATTERY = 7
 
 
 # =============================================================================
 # Unit Systems
 # =============================================================================
 
+# Speed
+UNIT_SPEED_MPH = "mph"
+UNIT_SPEED_KMH = "km/h"
+KMH_TO_MPH = 0.621371
 
-class Units:
-    """Unit system identifiers."""
+# Temperature
+UNIT_TEMP_CELSIUS = "c"
+UNIT_TEMP_FAHRENHEIT = "f"
 
-    # Speed
-    SPEED_MPH = "mph"
-    SPEED_KMH = "km/h"
+# Pressure
+UNIT_PRESSURE_BAR = "bar"
+UNIT_PRESSURE_PSI = "psi"
+UNIT_PRESSURE_KPA = "kpa"
 
-    # Temperature
-    TEMP_CELSIUS = "c"
-    TEMP_FAHRENHEIT = "f"
 
-    # Pressure
-    PRESSURE_BAR = "bar"
-    PRESSURE_PSI = "psi"
-    PRESSURE_KPA = "kpa"
+class Units:
+    """Unit system identifiers."""
+
+    SPEED_MPH = UNIT_SPEED_MPH
+    SPEED_KMH = UNIT_SPEED_KMH
+    TEMP_CELSIUS = UNIT_TEMP_CELSIUS
+    TEMP_FAHRENHEIT = UNIT_TEMP_FAHRENHEIT
+    PRESSURE_BAR = UNIT_PRESSURE_BAR
+    PRESSURE_PSI = UNIT_PRESSURE_PSI
+    PRESSURE_KPA = UNIT_PRESSURE_KPA
 
 
 # =============================================================================
 # Layout Identifiers
 # =============================================================================
 
+LAYOUT_RACE = "race"
+LAYOUT_STREET = "street"
+LAYOUT_DIAGNOSTIC = "diagnostic"
+
 
 class Layouts:
     """Available dashboard layout identifiers."""
 
-    RACE = "race"
-    STREET = "street"
-    DIAGNOSTIC = "diagnostic"
+    RACE = LAYOUT_RACE
+    STREET = LAYOUT_STREET
+    DIAGNOSTIC = LAYOUT_DIAGNOSTIC
 
 
 # =============================================================================
@@ -183,3 +268,9 @@ DEFAULT_CONFIG_PATH = CONFIG_DIR / "default.yaml"
 
 # Logo path
 ROBOTECHY_LOGO_PATH = ICONS_DIR / "robotechy_r.png"
+
+# Resolved once at import so startup code skips repeated Path building/stat calls
+ROBOTECHY_LOGO_STR = str(ROBOTECHY_LOGO_PATH)
+ROBOTECHY_LOGO_EXISTS = ROBOTECHY_LOGO_PATH.exists()
+JAPANESE_ROBOT_TTF = str(FONTS_DIR / "Japanese Robot.ttf")
+JAPANESE_ROBOT_ALT_TTF = str(FONTS_DIR / "JapaneseRobot.ttf")
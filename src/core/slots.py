@@ -0,0 +1,44 @@
+"""
+Dataclass helpers shared across RoboDash.
+
+Python 3.9 is still supported, so @dataclass(slots=True) (3.10+) is
+not available; slotted() provides the same result.
+"""
+
+from dataclasses import fields
+
+
+def slotted(cls):
+    """
+    Rebuild a dataclass with __slots__ for its fields.
+
+    Equivalent to @dataclass(slots=True), which needs Python 3.10+.
+    Slotted instances drop the per-instance __dict__ and use slot
+    descriptors for attribute access. Apply above @dataclass.
+
+    Frozen dataclasses also get __getstate__/__setstate__, as with
+    slots=True, since the default slot restore goes through the blocked
+    __setattr__ and would break pickling.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    if cls.__dataclass_params__.frozen:
+        namespace["__getstate__"] = _frozen_getstate
+        namespace["__setstate__"] = _frozen_setstate
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _frozen_getstate(self):
+    """Pickle a frozen slotted dataclass as a tuple of field values."""
+    return tuple(getattr(self, f.name) for f in fields(self))
+
+
+def _frozen_setstate(self, state):
+    """Restore a frozen slotted dataclass, bypassing the frozen __setattr__."""
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
@@ -3,4 +3,9 @@
 from .base import DataSource  # noqa: F401
 from .can_source import CANDataSource  # noqa: F401
 from .mock_source import MockDataSource  # noqa: F401
-from .models import EngineFlags, VehicleState, WarningFlags  # noqa: F401
+from .models import (  # noqa: F401
+    EngineFlags,
+    StateHistory,
+    VehicleState,
+    WarningFlags,
+)
@@ -0,0 +1,181 @@
+"""
+Numeric step functions for the mock driving simulation.
+
+These are the per-tick scalar state updates of MockDataSource, written
+as free functions over plain floats so they can be JIT-compiled. Random
+inputs are drawn by the caller and passed in.
+
+If numba is installed the kernels are compiled (and cached to disk, so
+only the first boot pays the compile); otherwise they run as plain
+Python.
+"""
+
+# Numba is optional - it JIT-compiles the per-tick simulation steps
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def step_throttle(
+    throttle: float,
+    accelerating: bool,
+    cycle: float,
+    rpm: float,
+    dt: float,
+    lift_roll: float,
+    event_roll: float,
+):
+    """
+    Advance the simulated driver's throttle input by one tick.
+
+    Args:
+        throttle: Current throttle position (0-100%).
+        accelerating: True while the driver is on the throttle.
+        cycle: Slow 0-1 driving cycle that sets the target throttle.
+        rpm: Current engine RPM.
+        dt: Tick length in seconds.
+        lift_roll: Uniform [0, 1) draw for a sudden full lift.
+        event_roll: Uniform [0, 1) draw for easing off or getting back on.
+
+    Returns:
+        Tuple of (throttle, accelerating).
+    """
+    # Occasionally trigger heavy braking/slowdown
+    if lift_roll < 0.002:  # ~0.2% chance per frame
+        accelerating = False
+        throttle = 0.0  # Full lift
+
+    if accelerating:
+        # Gradual throttle increase
+        target = 70.0 + cycle * 30.0  # 70-100%
+        throttle = min(100.0, throttle + 150.0 * dt)
+        if throttle >= target and event_roll < 0.015:
+            accelerating = False
+    else:
+        # Lift off - sometimes more aggressive
+        if throttle > 50.0:
+            # Quick lift
+            throttle = max(0.0, throttle - 300.0 * dt)
+        else:
+            # Gradual coast down to idle
+            throttle = max(0.0, throttle - 150.0 * dt)
+
+        # More likely to accelerate again if speed/rpm is low
+        resume_chance = 0.03 if rpm < 3000.0 else 0.02
+        if throttle <= 15.0 and event_roll < resume_chance:
+            accelerating = True
+
+    return throttle, accelerating
+
+
+def step_rpm(
+    rpm: float,
+    throttle: float,
+    dt: float,
+    idle_rpm: float,
+    rev_limit_rpm: float,
+    noise: float,
+) -> float:
+    """
+    Advance engine RPM by one tick based on throttle.
+
+    Args:
+        rpm: Current engine RPM.
+        throttle: Current throttle position (0-100%).
+        dt: Tick length in seconds.
+        idle_rpm: RPM the engine settles to off throttle.
+        rev_limit_rpm: Hard RPM ceiling.
+        noise: Additive RPM noise.
+
+    Returns:
+        New RPM.
+    """
+    if throttle > 50.0:
+        # Accelerating
+        rpm = min(rev_limit_rpm, rpm + (throttle - 30.0) * 15.0 * dt)
+    elif throttle > 10.0:
+        # Light throttle - maintain with some variation
+        target = idle_rpm + throttle * 200.0
+        rpm += (target - rpm) * dt * 2.0
+    else:
+        # Decel / engine braking
+        rpm = max(idle_rpm, rpm - 800.0 * dt)
+
+    return rpm + noise
+
+
+def step_temperatures(
+    coolant_temp: float,
+    oil_temp: float,
+    throttle: float,
+    rpm: float,
+    gear: int,
+    running_time: float,
+    dt: float,
+    load_k: float,
+    coolant_noise: float,
+    oil_noise: float,
+):
+    """
+    Move coolant and oil temperatures toward their load-dependent targets.
+
+    Args:
+        coolant_temp: Current coolant temperature (Celsius).
+        oil_temp: Current oil temperature (Celsius).
+        throttle: Current throttle position (0-100%).
+        rpm: Current engine RPM.
+        gear: Current gear.
+        running_time: Seconds since the engine started.
+        dt: Tick length in seconds.
+        load_k: Factor turning throttle * rpm into a 0-1 load.
+        coolant_noise: Additive coolant temperature noise.
+        oil_noise: Additive oil temperature noise.
+
+    Returns:
+        Tuple of (coolant_temp, oil_temp).
+    """
+    # Base target temps after warm-up, plus heat from throttle and RPM
+    load_factor = throttle * rpm * load_k
+    coolant_target = 88.0 + load_factor * 15.0
+    oil_target = 95.0 + load_factor * 20.0
+
+    # At sustained high load in top gears, temps can reach warning levels
+    if gear >= 5 and rpm > 6000.0 and throttle > 80.0:
+        coolant_target += 25.0  # Can reach 115+
+        oil_target += 35.0  # Can reach 130+
+
+    # Warm-up rate (slower when cold, faster when hot and cooling)
+    if running_time < 60.0:
+        rate = 0.5
+    elif coolant_temp > coolant_target:
+        rate = 0.15  # Cooling rate
+    else:
+        rate = 0.2  # Heating rate
+
+    # Move toward target, add noise and clamp to reasonable values
+    coolant_temp += (coolant_target - coolant_temp) * rate * dt + coolant_noise
+    oil_temp += (oil_target - oil_temp) * rate * dt + oil_noise
+    coolant_temp = max(20.0, min(130.0, coolant_temp))
+    oil_temp = max(20.0, min(150.0, oil_temp))
+
+    return coolant_temp, oil_temp
+
+
+if NUMBA_AVAILABLE:
+    step_throttle = njit(cache=True, fastmath=True)(step_throttle)
+    step_rpm = njit(cache=True, fastmath=True)(step_rpm)
+    step_temperatures = njit(cache=True, fastmath=True)(step_temperatures)
+
+
+def warm_up() -> None:
+    """
+    Run each kernel once so any JIT compile happens now, not on a tick.
+
+    Cheap when numba is absent or the compiled kernels are cached.
+    """
+    step_throttle(0.0, True, 0.5, 850.0, 0.033, 0.5, 0.5)
+    step_rpm(850.0, 0.0, 0.033, 850.0, 7500.0, 0.0)
+    step_temperatures(20.0, 20.0, 0.0, 850.0, 1, 0.0, 0.033, 1e-6, 0.0, 0.0)
@@ -11,7 +11,7 @@ from typing import Optional
 from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.sip import wrappertype
 
-from .models import VehicleState
+from .models import StateHistory, VehicleState
 
 
 # Combined metaclass to resolve QObject + ABC conflict
@@ -30,6 +30,8 @@ class DataSource(QObject, metaclass=QObjectABCMeta):
 
     Signals:
         data_updated: Emitted when new vehicle state is available.
+        state_scalars: Typed headline values of each state (only emitted
+            while something is connected to it).
         connection_changed: Emitted when connection status changes.
         error_occurred: Emitted when an error occurs.
     """
@@ -37,6 +39,11 @@ class DataSource(QObject, metaclass=QObjectABCMeta):
     # Signal emitted when new data is available
     data_updated = pyqtSignal(object)  # Emits VehicleState
 
+    # Typed copy of the headline gauge values. Doubles are marshalled
+    # directly instead of boxing a Python object per emission.
+    # Args: rpm, speed, boost, coolant, oil_temp, oil_press, afr, battery
+    state_scalars = pyqtSignal(float, float, float, float, float, float, float, float)
+
     # Signal for connection status changes
     connection_changed = pyqtSignal(bool)
 
@@ -53,6 +60,7 @@ class DataSource(QObject, metaclass=QObjectABCMeta):
         super().__init__(parent)
         self._connected = False
         self._last_state: Optional[VehicleState] = None
+        self._history: Optional[StateHistory] = None
 
     @property
     def connected(self) -> bool:
@@ -64,6 +72,43 @@ class DataSource(QObject, metaclass=QObjectABCMeta):
         """Get the most recently received vehicle state."""
         return self._last_state
 
+    @property
+    def history(self) -> Optional[StateHistory]:
+        """Get the recorded state history, or None if not enabled."""
+        return self._history
+
+    def enable_history(self, capacity: int = 4096) -> StateHistory:
+        """
+        Start recording every emitted state into a StateHistory ring.
+
+        The history is just another data_updated receiver, so sources that
+        never enable it pay nothing per frame. Enabling again replaces the
+        previous history.
+
+        Args:
+            capacity: Number of states kept before the oldest is overwritten.
+
+        Returns:
+            The history being recorded into.
+        """
+        if self._history is not None:
+            self.data_updated.disconnect(self._history.append)
+        self._history = StateHistory(capacity)
+        self.data_updated.connect(self._history.append)
+        return self._history
+
+    def set_active(self, active: bool) -> None:
+        """
+        Hint whether anything is currently displaying this source's data.
+
+        Sources that can throttle their own production (e.g. simulations)
+        slow down while inactive. The default ignores the hint.
+
+        Args:
+            active: False while the dashboard is hidden or minimized.
+        """
+        pass
+
     @abstractmethod
     def start(self) -> None:
         """
@@ -99,7 +144,8 @@ class DataSource(QObject, metaclass=QObjectABCMeta):
         """
         Helper to emit a new vehicle state.
 
-        This updates the internal state cache and emits the signal.
+        This updates the internal state cache and emits data_updated,
+        plus state_scalars if anything is listening for it.
 
         Args:
             state: The new vehicle state to emit.
@@ -107,6 +153,18 @@ class DataSource(QObject, metaclass=QObjectABCMeta):
         self._last_state = state
         self.data_updated.emit(state)
 
+        if self.receivers(self.state_scalars):
+            self.state_scalars.emit(
+                state.rpm,
+                state.speed,
+                state.boost_pressure,
+                state.coolant_temp,
+                state.oil_temp,
+                state.oil_pressure,
+                state.afr,
+                state.battery_voltage,
+            )
+
     def _set_connected(self, connected: bool) -> None:
         """
         Helper to update connection status.
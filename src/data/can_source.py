@@ -12,14 +12,18 @@ Hardware setup:
 Reference: https://python-can.readthedocs.io/
 """
 
+import functools
 import logging
 import threading
-from typing import Optional
+import time
+from collections import deque
+from typing import Deque, Optional
 
-from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtCore import QObject, Qt, QTimer
 
 from .base import DataSource
 from .emu_protocol import EMUProtocolDecoder
+from .models import VehicleState
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +50,16 @@ class CANDataSource(DataSource):
         source.start()
     """
 
+    # Newest-first handoff depth between the reader and GUI threads
+    RING_SIZE = 4
+
+    # GUI-thread drain rate for the state ring
+    DRAIN_INTERVAL_MS = 16
+
+    # Kernel acceptance mask for the 8-ID EMU block. Matches base_id through
+    # base_id + 7 only when base_id is a multiple of 8.
+    EMU_FILTER_MASK = 0x7F8
+
     def __init__(
         self,
         parent: Optional[QObject] = None,
@@ -82,9 +96,20 @@ class CANDataSource(DataSource):
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
-        # Timeout checker
-        self._timeout_timer = QTimer(self)
-        self._timeout_timer.timeout.connect(self._check_timeout)
+        # Liveness: the reader thread only stamps each complete state; the
+        # drain timer evaluates the stamp, so no timeout timer is needed
+        self._timeout_ns = timeout_ms * 1_000_000
+        self._last_complete_ns = 0
+
+        # Reader thread appends complete states; a GUI-thread timer drains
+        # the newest one. deque append/popleft are atomic in CPython, so
+        # this single-producer/single-consumer handoff needs no lock and
+        # data_updated is emitted on the GUI thread.
+        self._ring: Deque[VehicleState] = deque(maxlen=self.RING_SIZE)
+        self._drain_timer = QTimer(self)
+        self._drain_timer.setTimerType(Qt.PreciseTimer)
+        self._drain_timer.setInterval(self.DRAIN_INTERVAL_MS)
+        self._drain_timer.timeout.connect(self._drain_ring)
 
         logger.info(
             f"CANDataSource initialized: channel={channel}, "
@@ -108,10 +133,13 @@ class CANDataSource(DataSource):
                 interface="socketcan",
                 channel=self._channel,
                 bitrate=self._bitrate,
+                can_filters=self._can_filters(),
             )
 
             self._running = True
             self._decoder.reset()
+            self._ring.clear()
+            self._drain_timer.start()
 
             # Start reader thread
             self._thread = threading.Thread(
@@ -119,9 +147,6 @@ class CANDataSource(DataSource):
             )
             self._thread.start()
 
-            # Start timeout checker
-            self._timeout_timer.start(100)  # Check every 100ms
-
             self._set_connected(True)
             logger.info(f"CANDataSource started on {self._channel}")
 
@@ -136,7 +161,7 @@ class CANDataSource(DataSource):
         logger.info("CANDataSource stopping")
 
         self._running = False
-        self._timeout_timer.stop()
+        self._drain_timer.stop()
 
         # Wait for reader thread to finish
         if self._thread and self._thread.is_alive():
@@ -155,7 +180,10 @@ class CANDataSource(DataSource):
 
     def is_connected(self) -> bool:
         """Check if CAN bus is active and receiving data."""
-        return self._running and self._decoder.is_receiving
+        return (
+            self._running
+            and time.monotonic_ns() - self._last_complete_ns < self._timeout_ns
+        )
 
     def _read_loop(self) -> None:
         """
@@ -167,20 +195,21 @@ class CANDataSource(DataSource):
 
         while self._running and self._bus:
             try:
-                # Read with timeout to allow clean shutdown
+                # Block with timeout to allow clean shutdown, then drain any
+                # backlog without blocking
                 msg = self._bus.recv(timeout=0.1)
 
-                if msg is None:
-                    continue
+                while msg is not None:
+                    # Decoder unpacks straight from the message's bytearray
+                    state = self._decoder.process_message(msg.arbitration_id, msg.data)
 
-                # Process message through decoder
-                state = self._decoder.process_message(
-                    msg.arbitration_id, bytes(msg.data)
-                )
+                    if state:
+                        self._last_complete_ns = time.monotonic_ns()
+                        # Decoder snapshots are never reused, so they
+                        # can be handed to the GUI thread as is
+                        self._ring.append(state)
 
-                if state:
-                    # Full state received, emit from main thread
-                    self._emit_state(state)
+                    msg = self._bus.recv(timeout=0)
 
             except can.CanError as e:
                 if self._running:
@@ -193,13 +222,33 @@ class CANDataSource(DataSource):
 
         logger.debug("CAN reader thread exiting")
 
+    def _drain_ring(self) -> None:
+        """
+        Emit the newest state handed over by the reader thread, if any.
+
+        Also re-evaluates liveness, so connection status is only ever
+        written from the GUI thread.
+        """
+        state = None
+        ring = self._ring
+        try:
+            while True:
+                state = ring.popleft()
+        except IndexError:
+            pass
+
+        if state is not None:
+            self._emit_state(state)
+
+        self._check_timeout()
+
     def _check_timeout(self) -> None:
-        """Check for CAN communication timeout."""
-        if not self._decoder.is_receiving and self._connected:
-            logger.warning("CAN communication timeout")
-            self._set_connected(False)
-        elif self._decoder.is_receiving and not self._connected:
-            self._set_connected(True)
+        """Update connection status on a liveness transition."""
+        receiving = time.monotonic_ns() - self._last_complete_ns < self._timeout_ns
+        if receiving != self._connected:
+            if not receiving:
+                logger.warning("CAN communication timeout")
+            self._set_connected(receiving)
 
     @property
     def channel(self) -> str:
@@ -211,9 +260,39 @@ class CANDataSource(DataSource):
         """Get EMU Black base CAN ID."""
         return self._base_id
 
+    def _can_filters(self) -> Optional[list]:
+        """
+        Build the kernel receive filter for the EMU frame block.
+
+        SocketCAN then drops other nodes' traffic before it reaches Python.
 
+        Returns:
+            python-can filter list, or None (receive everything) if base_id
+            is not 8-aligned and cannot be expressed as one mask.
+        """
+        if self._base_id & ~self.EMU_FILTER_MASK:
+            logger.warning(
+                "base_id %#x is not 8-aligned; CAN kernel filter disabled",
+                self._base_id,
+            )
+            return None
+        return [
+            {
+                "can_id": self._base_id,
+                "can_mask": self.EMU_FILTER_MASK,
+                "extended": False,
+            }
+        ]
+
+
+@functools.lru_cache(maxsize=1)
 def is_can_available() -> bool:
-    """Check if CAN bus support is available."""
+    """
+    Check if CAN bus support is available.
+
+    The result is cached for the process lifetime; hardware support
+    does not change while the dashboard is running.
+    """
     return CAN_AVAILABLE
 
 
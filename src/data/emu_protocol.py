@@ -8,6 +8,10 @@ all engine telemetry data.
 Reference: https://github.com/designer2k2/EMUcan
 Protocol: EMU Black CAN Stream Format v2.154+
 
+The module is fully annotated so it can be compiled ahead of time with
+mypyc (`make build-ext`). The compiled extension is imported in place of
+this file when present; delete it to fall back to pure Python.
+
 CAN Configuration:
 - Bitrate: 500 kbps
 - Base ID: 0x600 (configurable in ECU software)
@@ -18,12 +22,34 @@ CAN Configuration:
 import logging
 import struct
 import time
-from typing import Dict, Optional
+from typing import Callable, Final, Optional, Tuple
 
-from .models import EngineFlags, VehicleState, WarningFlags
+from .models import VehicleState
 
 logger = logging.getLogger(__name__)
 
+# Precompiled per-frame layouts; one unpack_from call decodes a whole frame
+_FRAME0 = struct.Struct("<HBbH2x")  # RPM, TPS, IAT, MAP
+_FRAME1 = struct.Struct("<HBxHH")  # Injector PW, lambda target, lambda, fuel press
+_FRAME2 = struct.Struct("<HbbB3x")  # VSS, gear, ignition angle, battery
+_FRAME3 = struct.Struct("<hh4x")  # CLT, oil temp
+_FRAME4 = struct.Struct("<HHH2x")  # Oil pressure, EGT1, EGT2
+_FRAME5 = struct.Struct("<BH5x")  # Engine flags, warning flags
+
+# Frame offsets from base ID
+FRAME_COUNT: Final = 8
+
+# Received-frame bitmask value once every frame has arrived
+ALL_FRAMES_MASK: Final = (1 << FRAME_COUNT) - 1
+
+# Raw-to-derived scale factors, folded so each value takes one multiply
+_BOOST_PER_MAP_BIT: Final = 0.1 / 100.0  # 0.1 kPa per bit, 100 kPa per bar
+_BOOST_OFFSET: Final = 101.3 / 100.0  # Atmosphere in bar
+_LAMBDA_PER_BIT: Final = 1.0 / 10000.0
+_AFR_PER_LAMBDA_BIT: Final = 14.7 / 10000.0  # Stoich 14.7 times lambda
+# Duty % = PW (0.01 ms/bit) / cycle time (120000 / RPM ms, 4-stroke) * 100
+_DUTY_PER_PW_RPM: Final = 0.01 / 120000.0 * 100.0
+
 
 class EMUProtocolDecoder:
     """
@@ -41,8 +67,9 @@ class EMUProtocolDecoder:
                 update_display(state)
     """
 
-    # Frame offsets from base ID
-    FRAME_COUNT = 8
+    # Module constants re-exposed for callers that use the class namespace
+    FRAME_COUNT: Final = FRAME_COUNT
+    ALL_FRAMES_MASK: Final = ALL_FRAMES_MASK
 
     def __init__(self, base_id: int = 0x600):
         """
@@ -51,10 +78,38 @@ class EMUProtocolDecoder:
         Args:
             base_id: CAN base ID for EMU stream (default 0x600).
         """
-        self.base_id = base_id
-        self._frame_data: Dict[int, bytes] = {}
-        self._last_complete_time = 0.0
-        self._state = VehicleState()
+        self.base_id: int = base_id
+        self._last_complete_ns: int = 0
+
+        # Per-frame decoders indexed by frame offset from base_id.
+        # Frame layouts based on EMUcan library and EMU Black documentation.
+        # Frames with no decoded fields are None and only count towards
+        # completion:
+        #   Frame 6: DBW position (byte 0), boost target (byte 1), custom
+        #   Frame 7: Reserved for custom CAN data set up in EMU software
+        self._decoders: Tuple[Optional[Callable[[bytes], None]], ...] = (
+            self._decode_frame_0,
+            self._decode_frame_1,
+            self._decode_frame_2,
+            self._decode_frame_3,
+            self._decode_frame_4,
+            self._decode_frame_5,
+            None,
+            None,
+        )
+
+        # Decode state; reset() restores these starting values
+        self._received_mask: int = 0  # Bit N set once frame N has arrived
+
+        # Frames decode into one working state that carries the last known
+        # values; each complete set hands out a snapshot copy of it.
+        self._state: VehicleState = VehicleState()
+
+        # Raw inputs behind derived values; -1 forces the first recompute
+        self._last_map_raw: int = -1
+        self._last_lambda_raw: int = -1
+        self._last_inj_raw: int = -1
+        self._last_duty_rpm: int = -1
 
     def process_message(
         self, arbitration_id: int, data: bytes
@@ -64,62 +119,41 @@ class EMUProtocolDecoder:
 
         Args:
             arbitration_id: CAN message ID.
-            data: CAN message data (8 bytes).
+            data: CAN message data (8 bytes, any bytes-like object; it is
+                only read during this call).
 
         Returns:
             VehicleState if a complete set of frames received, else None.
+            The returned object is a snapshot owned by the caller; the
+            decoder never touches it again.
         """
         # Check if this message belongs to our EMU stream
-        if not self._is_emu_frame(arbitration_id):
+        frame_index = arbitration_id - self.base_id
+        if frame_index < 0 or frame_index >= FRAME_COUNT:
             return None
 
         if len(data) != 8:
             logger.warning(f"Invalid DLC {len(data)} for frame {arbitration_id:#x}")
             return None
 
-        # Store frame data
-        frame_index = arbitration_id - self.base_id
-        self._frame_data[frame_index] = data
+        # Mark frame as received
+        self._received_mask |= 1 << frame_index
 
         # Decode this frame
-        self._decode_frame(frame_index, data)
+        decoder = self._decoders[frame_index]
+        if decoder is not None:
+            decoder(data)
 
         # Check if we have all frames
-        if len(self._frame_data) >= self.FRAME_COUNT:
-            self._frame_data.clear()
-            self._state.timestamp = time.time()
-            self._last_complete_time = self._state.timestamp
+        if self._received_mask == ALL_FRAMES_MASK:
+            self._received_mask = 0
+            self._state.timestamp_ns = self._last_complete_ns = time.monotonic_ns()
+
+            # One copy per set; the caller owns it, so it can cross threads
             return self._state.copy()
 
         return None
 
-    def _is_emu_frame(self, arbitration_id: int) -> bool:
-        """Check if CAN ID belongs to EMU stream."""
-        return self.base_id <= arbitration_id < self.base_id + self.FRAME_COUNT
-
-    def _decode_frame(self, frame_index: int, data: bytes) -> None:
-        """
-        Decode a single CAN frame and update state.
-
-        Frame layout based on EMUcan library and EMU Black documentation.
-        """
-        if frame_index == 0:
-            self._decode_frame_0(data)
-        elif frame_index == 1:
-            self._decode_frame_1(data)
-        elif frame_index == 2:
-            self._decode_frame_2(data)
-        elif frame_index == 3:
-            self._decode_frame_3(data)
-        elif frame_index == 4:
-            self._decode_frame_4(data)
-        elif frame_index == 5:
-            self._decode_frame_5(data)
-        elif frame_index == 6:
-            self._decode_frame_6(data)
-        elif frame_index == 7:
-            self._decode_frame_7(data)
-
     def _decode_frame_0(self, data: bytes) -> None:
         """
         Frame 0: RPM, TPS, IAT, MAP
@@ -130,13 +164,19 @@ class EMUProtocolDecoder:
         Byte 4-5: MAP (uint16, 0.1 kPa per bit)
         Byte 6-7: Reserved
         """
-        self._state.rpm = struct.unpack_from("<H", data, 0)[0]
-        self._state.tps = data[2] * 0.5
-        self._state.intake_temp = struct.unpack_from("<b", data, 3)[0]
-        self._state.map_kpa = struct.unpack_from("<H", data, 4)[0] * 0.1
+        state = self._state
+        rpm, tps, iat, map_raw = _FRAME0.unpack_from(data)
+        state.rpm = rpm
+        state.tps = tps * 0.5
+        state.intake_temp = iat
+
+        # MAP and boost only change when the raw MAP does
+        if map_raw != self._last_map_raw:
+            self._last_map_raw = map_raw
+            state.map_kpa = map_raw * 0.1
 
-        # Calculate boost from MAP (relative to 101.3 kPa atmosphere)
-        self._state.boost_pressure = (self._state.map_kpa - 101.3) / 100.0
+            # Boost from MAP, relative to 101.3 kPa atmosphere
+            state.boost_pressure = map_raw * _BOOST_PER_MAP_BIT - _BOOST_OFFSET
 
     def _decode_frame_1(self, data: bytes) -> None:
         """
@@ -148,19 +188,25 @@ class EMUProtocolDecoder:
         Byte 4-5: Lambda (uint16, value/10000)
         Byte 6-7: Fuel pressure (uint16, 0.01 bar per bit)
         """
-        inj_pw = struct.unpack_from("<H", data, 0)[0] * 0.01  # ms
-        self._state.lambda_target = data[2] / 100.0 + 0.5
-        self._state.lambda_value = struct.unpack_from("<H", data, 4)[0] / 10000.0
-        self._state.fuel_pressure = struct.unpack_from("<H", data, 6)[0] * 0.01
-
-        # Calculate AFR from lambda (stoich = 14.7)
-        if self._state.lambda_value > 0:
-            self._state.afr = self._state.lambda_value * 14.7
-
-        # Calculate injector duty (assuming max 8333 Hz at 7500 RPM)
-        if self._state.rpm > 0:
-            cycle_time = 120000.0 / self._state.rpm  # ms per cycle (4-stroke)
-            self._state.injector_duty = min(100.0, (inj_pw / cycle_time) * 100.0)
+        state = self._state
+        inj_raw, target_raw, lambda_raw, fuel_raw = _FRAME1.unpack_from(data)
+        state.lambda_target = target_raw / 100.0 + 0.5
+        state.fuel_pressure = fuel_raw * 0.01
+
+        # Lambda and AFR only change when the raw lambda does
+        if lambda_raw != self._last_lambda_raw:
+            self._last_lambda_raw = lambda_raw
+            state.lambda_value = lambda_raw * _LAMBDA_PER_BIT
+            if lambda_raw > 0:
+                state.afr = lambda_raw * _AFR_PER_LAMBDA_BIT
+
+        # Injector duty only changes when pulse width or RPM does
+        rpm = state.rpm
+        if inj_raw != self._last_inj_raw or rpm != self._last_duty_rpm:
+            self._last_inj_raw = inj_raw
+            self._last_duty_rpm = rpm
+            if rpm > 0:
+                state.injector_duty = min(100.0, inj_raw * rpm * _DUTY_PER_PW_RPM)
 
     def _decode_frame_2(self, data: bytes) -> None:
         """
@@ -172,10 +218,12 @@ class EMUProtocolDecoder:
         Byte 4: Battery voltage (uint8, 0.1V per bit)
         Byte 5-7: Reserved
         """
-        self._state.speed = struct.unpack_from("<H", data, 0)[0] * 0.1
-        self._state.gear = struct.unpack_from("<b", data, 2)[0]
-        self._state.ignition_angle = struct.unpack_from("<b", data, 3)[0]
-        self._state.battery_voltage = data[4] * 0.1
+        state = self._state
+        speed_raw, gear, ignition_angle, battery_raw = _FRAME2.unpack_from(data)
+        state.speed = speed_raw * 0.1
+        state.gear = gear
+        state.ignition_angle = ignition_angle
+        state.battery_voltage = battery_raw * 0.1
 
     def _decode_frame_3(self, data: bytes) -> None:
         """
@@ -185,8 +233,10 @@ class EMUProtocolDecoder:
         Byte 2-3: Oil temp (int16, 0.1°C per bit)
         Byte 4-7: Reserved
         """
-        self._state.coolant_temp = struct.unpack_from("<h", data, 0)[0] * 0.1
-        self._state.oil_temp = struct.unpack_from("<h", data, 2)[0] * 0.1
+        state = self._state
+        clt_raw, oil_raw = _FRAME3.unpack_from(data)
+        state.coolant_temp = clt_raw * 0.1
+        state.oil_temp = oil_raw * 0.1
 
     def _decode_frame_4(self, data: bytes) -> None:
         """
@@ -197,9 +247,11 @@ class EMUProtocolDecoder:
         Byte 4-5: EGT2 (uint16, Celsius)
         Byte 6-7: Reserved
         """
-        self._state.oil_pressure = struct.unpack_from("<H", data, 0)[0] * 0.01
-        self._state.egt1 = struct.unpack_from("<H", data, 2)[0]
-        self._state.egt2 = struct.unpack_from("<H", data, 4)[0]
+        state = self._state
+        oil_press_raw, egt1, egt2 = _FRAME4.unpack_from(data)
+        state.oil_pressure = oil_press_raw * 0.01
+        state.egt1 = egt1
+        state.egt2 = egt2
 
     def _decode_frame_5(self, data: bytes) -> None:
         """
@@ -209,43 +261,29 @@ class EMUProtocolDecoder:
         Byte 1-2: Warning flags (WarningFlags bitfield)
         Byte 3-7: Reserved
         """
-        self._state.flags = EngineFlags(data[0])
-        self._state.warnings = WarningFlags(struct.unpack_from("<H", data, 1)[0])
-
-    def _decode_frame_6(self, data: bytes) -> None:
-        """
-        Frame 6: Additional data (DBW, boost target, etc.)
-
-        Byte 0: DBW position (uint8, 0.5% per bit)
-        Byte 1: Boost target (uint8, 0.01 bar per bit, signed offset)
-        Byte 2-7: Reserved/Custom
-        """
-        # DBW (Drive By Wire) position if equipped
-        # dbw_position = data[0] * 0.5
-        pass
-
-    def _decode_frame_7(self, data: bytes) -> None:
-        """
-        Frame 7: Reserved/Custom data
-
-        This frame is available for custom CAN messages configured
-        in the EMU Black software.
-        """
-        pass
+        state = self._state
+        state.flags, state.warnings = _FRAME5.unpack_from(data)
 
     def reset(self) -> None:
         """Reset decoder state, clearing accumulated frame data."""
-        self._frame_data.clear()
+        self._received_mask = 0
         self._state = VehicleState()
+        self._last_map_raw = -1
+        self._last_lambda_raw = -1
+        self._last_inj_raw = -1
+        self._last_duty_rpm = -1
 
     @property
     def time_since_last_complete(self) -> float:
         """Get seconds since last complete state was received."""
-        if self._last_complete_time == 0:
+        if self._last_complete_ns == 0:
             return float("inf")
-        return time.time() - self._last_complete_time
+        return (time.monotonic_ns() - self._last_complete_ns) * 1e-9
 
     @property
     def is_receiving(self) -> bool:
         """Check if decoder is actively receiving data (within 1 second)."""
-        return self.time_since_last_complete < 1.0
+        return (
+            self._last_complete_ns != 0
+            and time.monotonic_ns() - self._last_complete_ns < 1_000_000_000
+        )
@@ -11,26 +11,63 @@ The simulation models a realistic driving experience with
 acceleration, gear changes, and fluctuating temperatures.
 
 Optional: Includes synthesized engine sound that varies with RPM.
+
+The throttle, RPM and temperature steps live in _sim_kernels so they
+can be JIT-compiled when numba is installed.
 """
 
 import logging
 import math
 import random
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
+import numpy as np
 from PyQt5.QtCore import QObject, QTimer
 
-from ..utils.engine_sound import EngineSoundSynthesizer, create_engine_sound
+from ._sim_kernels import step_rpm, step_temperatures, step_throttle
 from .base import DataSource
-from .models import EngineFlags, VehicleState, WarningFlags
+from .models import REDLINE_RPM, EngineFlags, VehicleState, WarningFlags
+
+if TYPE_CHECKING:
+    from ..utils.engine_sound import EngineSoundSynthesizer
 
 logger = logging.getLogger(__name__)
 
+# Columns of the per-tick noise row; each is uniform in [-1, 1) and scaled
+# by the consumer to its own amplitude
+_NOISE_RPM = 0
+_NOISE_BOOST = 1
+_NOISE_COOLANT = 2
+_NOISE_OIL_TEMP = 3
+_NOISE_OIL_PRESSURE = 4
+_NOISE_AFR = 5
+_NOISE_DUTY = 6
+_NOISE_IGNITION = 7
+_NOISE_LIFT_ROLL = 8  # Driver event rolls, mapped to [0, 1) by x * 0.5 + 0.5
+_NOISE_EVENT_ROLL = 9
+_NOISE_COLUMNS = 10
+
+_INV_STOICH_AFR = 1.0 / 14.7  # AFR to lambda
+
+# Fueling by load bucket (throttle > 30) + (throttle > 80):
+# stoich at cruise/idle, slightly rich at part throttle, rich under boost
+_AFR_BY_LOAD = (14.7, 13.5, 11.5)
+_AFR_NOISE_BY_LOAD = (0.2, 0.3, 0.3)
+_LAMBDA_TARGET_BY_LOAD = (1.0, 1.0, 0.85)
+
+# Flag bits as plain ints; IntFlag | and & allocate a new enum member
+_FLAG_IDLE = int(EngineFlags.IDLE)
+_FLAG_GEARCUT = int(EngineFlags.GEARCUT)
+_WARNING_KNOCKING = int(WarningFlags.KNOCKING)
+
 
 class MockDataSource(DataSource):
     """
     Simulated vehicle data source for development.
 
+    Emitted VehicleState objects are pooled and overwritten POOL_SIZE
+    ticks later; call copy() on a state that must outlive that.
+
     Generates realistic driving data including:
     - RPM cycling with gear changes
     - Speed based on gear and RPM
@@ -51,15 +88,60 @@ class MockDataSource(DataSource):
     FINAL_DRIVE = 3.538
     TIRE_CIRCUMFERENCE = 2.0  # meters (approximate for 275/35R18)
 
-    # RPM limits
-    IDLE_RPM = 850
-    REDLINE_RPM = 7200
-    REV_LIMIT_RPM = 7500
+    # RPM limits; floats so the step kernels only ever see float RPM
+    IDLE_RPM = 850.0
+    REDLINE_RPM = float(REDLINE_RPM)
+    REV_LIMIT_RPM = 7500.0
 
     # Shift points
     UPSHIFT_RPM = 6800
     DOWNSHIFT_RPM = 2500
 
+    # Per-tick formula constants folded once at class creation. The zip()
+    # is evaluated in class scope, so the comprehensions can see it.
+    _RATIOS = tuple(GEAR_RATIOS.values())
+    # km/h per RPM: tire_circumference * 3.6 / (ratio * final_drive * 60)
+    _KPH_PER_RPM = {
+        gear: k / ratio
+        for gear, ratio, k in zip(
+            GEAR_RATIOS,
+            _RATIOS,
+            (TIRE_CIRCUMFERENCE * 3.6 / (FINAL_DRIVE * 60),) * len(_RATIOS),
+        )
+    }
+    # RPM scale on shifting out of a gear (new ratio / old ratio)
+    _UPSHIFT_RPM_SCALE = {
+        gear: new / old for gear, old, new in zip(GEAR_RATIOS, _RATIOS, _RATIOS[1:])
+    }
+    _DOWNSHIFT_RPM_SCALE = {
+        gear: new / old
+        for gear, old, new in zip(list(GEAR_RATIOS)[1:], _RATIOS[1:], _RATIOS)
+    }
+    # (throttle / 100) * (rpm / REDLINE_RPM) == throttle * rpm * _LOAD_K
+    _LOAD_K = 1.0 / (100 * REDLINE_RPM)
+    _DUTY_PER_RPM = 50.0 / REDLINE_RPM
+
+    # Timer interval while set_active(False); just enough to keep alive
+    KEEPALIVE_INTERVAL_MS = 200
+
+    # Engine sound follows RPM at this rate, ignoring smaller changes
+    SOUND_UPDATE_HZ = 20
+    SOUND_RPM_STEP = 10
+
+    # Emitted states are recycled from a pool of this size
+    POOL_SIZE = 4
+
+    # Seconds of independent sensor readings generated per vectorized block
+    BLOCK_SECONDS = 10
+
+    # Sensor channels that don't depend on the simulation state, as
+    # (center, noise amplitude); precomputed a block at a time
+    SENSOR_CHANNELS = {
+        "intake_temp": (25.0, 2.0),
+        "fuel_pressure": (3.0, 0.1),
+        "battery_voltage": (13.8, 0.3),
+    }
+
     def __init__(
         self,
         parent: Optional[QObject] = None,
@@ -82,21 +164,35 @@ class MockDataSource(DataSource):
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._generate_data)
         self._update_interval = 1000 // update_rate_hz
+        self._timer.setInterval(self._update_interval)
         self._enable_warnings = enable_warnings
 
         # Engine sound synthesis
-        self._engine_sound: Optional[EngineSoundSynthesizer] = None
+        self._engine_sound: Optional["EngineSoundSynthesizer"] = None
         if enable_sound:
+            # Imported only when wanted; pulls in pygame and numpy audio setup
+            from ..utils.engine_sound import create_engine_sound
+
             self._engine_sound = create_engine_sound(sound_volume)
             if self._engine_sound:
                 logger.info("Engine sound enabled")
             else:
                 logger.warning("Engine sound requested but audio not available")
+        self._sound_every = max(1, round(update_rate_hz / self.SOUND_UPDATE_HZ))
+        self._sound_tick = 0
+        self._last_sound_rpm = 0.0
 
         # Simulation state
         self._time = 0.0
         self._gear = 1
-        self._rpm = self.IDLE_RPM
+
+        # Throttle cycle sin(0.3 * time), advanced by a fixed rotation per
+        # tick (the tick interval never changes) instead of calling sin()
+        step = self._update_interval / 1000.0 * 0.3
+        self._cycle_rotation = (math.cos(step), math.sin(step))
+        self._cycle_sin = 0.0
+        self._cycle_cos = 1.0
+        self._rpm: float = self.IDLE_RPM
         self._throttle = 0.0
         self._accelerating = True
         self._cruise_mode = False
@@ -110,12 +206,25 @@ class MockDataSource(DataSource):
         # Fuel simulation (start at 29% for demo)
         self._fuel_level = 29.0
 
+        # Emitted states rotate through a small pool instead of allocating
+        # one per tick; consumers copy() a state they need to keep longer
+        self._pool = [VehicleState() for _ in range(self.POOL_SIZE)]
+        self._pool_idx = 0
+
+        # Precomputed sensor channels, refilled when the row index wraps
+        self._rng = np.random.default_rng()
+        self._block_size = max(1, self.BLOCK_SECONDS * update_rate_hz)
+        self._block_idx = 0
+        self._block: Dict[str, List[float]] = {}
+        self._noise_block: List[List[float]] = []
+        self._noise: List[float] = [0.0] * _NOISE_COLUMNS  # Current tick's row
+
         logger.info("MockDataSource initialized")
 
     def start(self) -> None:
         """Begin generating simulated data."""
         logger.info("MockDataSource starting")
-        self._timer.start(self._update_interval)
+        self._timer.start()
         self._set_connected(True)
 
         # Start engine sound if enabled
@@ -136,19 +245,51 @@ class MockDataSource(DataSource):
         """Check if simulation is running."""
         return self._timer.isActive()
 
+    def set_active(self, active: bool) -> None:
+        """
+        Drop to a keepalive tick rate while nothing is displayed.
+
+        Args:
+            active: True to simulate at the configured update rate.
+        """
+        self._timer.setInterval(
+            self._update_interval if active else self.KEEPALIVE_INTERVAL_MS
+        )
+
     def _generate_data(self) -> None:
         """Generate a frame of simulated data."""
+        # Nobody to feed: skip the physics until a consumer connects
+        if self._engine_sound is None and not (
+            self.receivers(self.data_updated) or self.receivers(self.state_scalars)
+        ):
+            return
+
         dt = self._update_interval / 1000.0
         self._time += dt
         self._engine_running_time += dt
 
+        # Next row of the precomputed sensor channels and noise
+        i = self._block_idx
+        if i == 0:
+            self._precompute_block()
+        self._block_idx = (i + 1) % self._block_size
+        block = self._block
+        self._noise = self._noise_block[i]
+
         # Update throttle and RPM
         self._update_throttle(dt)
         self._update_rpm(dt)
 
-        # Update engine sound with current RPM
+        # Update engine sound with current RPM, at SOUND_UPDATE_HZ and only
+        # when it moved audibly
         if self._engine_sound:
-            self._engine_sound.set_rpm(self._rpm)
+            self._sound_tick += 1
+            if self._sound_tick >= self._sound_every:
+                self._sound_tick = 0
+                rpm = self._rpm
+                if abs(rpm - self._last_sound_rpm) >= self.SOUND_RPM_STEP:
+                    self._last_sound_rpm = rpm
+                    self._engine_sound.set_rpm(rpm)
 
         # Auto gear changes
         self._check_gear_change()
@@ -163,79 +304,74 @@ class MockDataSource(DataSource):
         # Update fuel level (slow consumption)
         self._update_fuel(dt)
 
-        # Build state
-        state = VehicleState(
-            rpm=int(self._rpm),
-            speed=speed,
-            gear=self._gear,
-            boost_pressure=boost,
-            map_kpa=101.3 + (boost * 100),
-            coolant_temp=self._coolant_temp,
-            oil_temp=self._oil_temp,
-            intake_temp=25 + random.uniform(-2, 2),
-            oil_pressure=self._calculate_oil_pressure(),
-            fuel_pressure=3.0 + random.uniform(-0.1, 0.1),
-            afr=self._calculate_afr(),
-            lambda_value=self._calculate_afr() / 14.7,
-            lambda_target=0.85 if self._throttle > 80 else 1.0,
-            tps=self._throttle,
-            injector_duty=self._calculate_injector_duty(),
-            ignition_angle=self._calculate_ignition(),
-            battery_voltage=13.8 + random.uniform(-0.3, 0.3),
-            fuel_level=self._fuel_level,
-            flags=self._get_engine_flags(),
-            warnings=self._get_warnings(),
-        )
+        # Fill the next pooled state in place
+        state = self._pool[self._pool_idx]
+        self._pool_idx = (self._pool_idx + 1) % self.POOL_SIZE
+        state.rpm = int(self._rpm)
+        state.speed = speed
+        state.gear = self._gear
+        state.boost_pressure = boost
+        state.map_kpa = 101.3 + (boost * 100)
+        state.coolant_temp = self._coolant_temp
+        state.oil_temp = self._oil_temp
+        state.intake_temp = block["intake_temp"][i]
+        state.oil_pressure = self._calculate_oil_pressure()
+        state.fuel_pressure = block["fuel_pressure"][i]
+        afr = self._calculate_afr()
+        state.afr = afr
+        state.lambda_value = afr * _INV_STOICH_AFR
+        state.lambda_target = _LAMBDA_TARGET_BY_LOAD[self._load_bucket()]
+        state.tps = self._throttle
+        state.injector_duty = self._calculate_injector_duty()
+        state.ignition_angle = self._calculate_ignition()
+        state.battery_voltage = block["battery_voltage"][i]
+        state.fuel_level = self._fuel_level
+        state.flags = self._get_engine_flags()
+        state.warnings = self._get_warnings()
+        state.timestamp_ns = int(self._time * 1e9)  # Simulation clock
 
         self._emit_state(state)
 
+    def _precompute_block(self) -> None:
+        """Generate the next block of sensor channels in one vectorized pass."""
+        n = self._block_size
+        uniform = self._rng.uniform
+        # tolist() so per-tick indexing yields plain floats, not numpy scalars
+        self._block = {
+            name: (center + uniform(-amplitude, amplitude, n)).tolist()
+            for name, (center, amplitude) in self.SENSOR_CHANNELS.items()
+        }
+        self._noise_block = uniform(-1.0, 1.0, (n, _NOISE_COLUMNS)).tolist()
+
     def _update_throttle(self, dt: float) -> None:
         """Simulate throttle input patterns with more variation."""
         # Vary throttle to create realistic driving
-        cycle = math.sin(self._time * 0.3) * 0.5 + 0.5  # 0-1 cycle
-
-        # Occasionally trigger heavy braking/slowdown
-        if random.random() < 0.002:  # ~0.2% chance per frame
-            self._accelerating = False
-            self._throttle = 0  # Full lift
-
-        if self._accelerating:
-            # Gradual throttle increase
-            target = 70 + cycle * 30  # 70-100%
-            self._throttle = min(100, self._throttle + 150 * dt)
-            if self._throttle >= target and random.random() < 0.015:
-                self._accelerating = False
-        else:
-            # Lift off - sometimes more aggressive
-            if self._throttle > 50:
-                # Quick lift
-                self._throttle = max(0, self._throttle - 300 * dt)
-            else:
-                # Gradual coast down to idle
-                self._throttle = max(0, self._throttle - 150 * dt)
-
-            # More likely to accelerate again if speed/rpm is low
-            resume_chance = 0.03 if self._rpm < 3000 else 0.02
-            if self._throttle <= 15 and random.random() < resume_chance:
-                self._accelerating = True
+        cos_step, sin_step = self._cycle_rotation
+        s, c = self._cycle_sin, self._cycle_cos
+        self._cycle_sin = s * cos_step + c * sin_step
+        self._cycle_cos = c * cos_step - s * sin_step
+        cycle = self._cycle_sin * 0.5 + 0.5  # 0-1 cycle
+
+        self._throttle, self._accelerating = step_throttle(
+            self._throttle,
+            self._accelerating,
+            cycle,
+            self._rpm,
+            dt,
+            self._noise[_NOISE_LIFT_ROLL] * 0.5 + 0.5,
+            self._noise[_NOISE_EVENT_ROLL] * 0.5 + 0.5,
+        )
 
     def _update_rpm(self, dt: float) -> None:
         """Update RPM based on throttle."""
-        if self._throttle > 50:
-            # Accelerating
-            rpm_change = (self._throttle - 30) * 15 * dt
-            self._rpm = min(self.REV_LIMIT_RPM, self._rpm + rpm_change)
-        elif self._throttle > 10:
-            # Light throttle - maintain with some variation
-            target = self.IDLE_RPM + (self._throttle / 10) * 2000
-            self._rpm += (target - self._rpm) * dt * 2
-        else:
-            # Decel / engine braking
-            rpm_change = 800 * dt
-            self._rpm = max(self.IDLE_RPM, self._rpm - rpm_change)
-
-        # Add some noise
-        self._rpm += random.uniform(-20, 20)
+        self._rpm = step_rpm(
+            self._rpm,
+            self._throttle,
+            dt,
+            self.IDLE_RPM,
+            self.REV_LIMIT_RPM,
+            self._noise[_NOISE_RPM] * 20,
+        )
 
     def _check_gear_change(self) -> None:
         """Check if gear change is needed and execute."""
@@ -250,8 +386,7 @@ class MockDataSource(DataSource):
             old_gear = self._gear
             self._gear += 1
             # RPM drop on upshift
-            ratio_change = self.GEAR_RATIOS[old_gear] / self.GEAR_RATIOS[self._gear]
-            self._rpm *= 1 / ratio_change
+            self._rpm *= self._UPSHIFT_RPM_SCALE[old_gear]
 
             # Play gear change sound
             if self._engine_sound:
@@ -265,8 +400,7 @@ class MockDataSource(DataSource):
             old_gear = self._gear
             self._gear -= 1
             # RPM rise on downshift
-            ratio_change = self.GEAR_RATIOS[old_gear] / self.GEAR_RATIOS[self._gear]
-            self._rpm *= 1 / ratio_change
+            self._rpm *= self._DOWNSHIFT_RPM_SCALE[old_gear]
             self._rpm = min(self._rpm, self.REDLINE_RPM)
 
             # Play gear change sound
@@ -280,74 +414,42 @@ class MockDataSource(DataSource):
         if self._gear <= 0:
             return 0.0
 
-        ratio = self.GEAR_RATIOS.get(self._gear, 1.0)
-        # Speed = (RPM * tire_circumference * 60) / (gear_ratio * final_drive * 1000)
-        speed_mps = (self._rpm * self.TIRE_CIRCUMFERENCE) / (
-            ratio * self.FINAL_DRIVE * 60
-        )
-        speed_kph = speed_mps * 3.6
-
-        return max(0, speed_kph)
+        return max(0, self._rpm * self._KPH_PER_RPM[self._gear])
 
     def _calculate_boost(self) -> float:
         """Calculate boost pressure based on RPM and throttle."""
         if self._rpm < 2500 or self._throttle < 50:
             # Vacuum at low RPM/throttle
-            return -0.5 + random.uniform(-0.1, 0.1)
+            return -0.5 + self._noise[_NOISE_BOOST] * 0.1
 
-        # Boost builds with RPM and throttle
-        rpm_factor = min(1.0, (self._rpm - 2500) / 4000)
-        throttle_factor = (self._throttle - 50) / 50
-
-        boost = 1.8 * rpm_factor * throttle_factor
-        boost += random.uniform(-0.05, 0.05)
+        # Boost builds with RPM and throttle: 1.8 bar * rpm and throttle factors
+        rpm_factor = min(1.0, (self._rpm - 2500) * 0.00025)
+        boost = rpm_factor * (self._throttle - 50) * 0.036
+        boost += self._noise[_NOISE_BOOST] * 0.05
 
         return round(boost, 2)
 
     def _update_temperatures(self, dt: float) -> None:
         """Update coolant and oil temperatures with warning capability."""
-        # Base target temps after warm-up
-        base_coolant = 88
-        base_oil = 95
-
-        # Add heat based on throttle and RPM
-        load_factor = (self._throttle / 100) * (self._rpm / self.REDLINE_RPM)
-
-        # At sustained high load, temps can reach warning levels
-        if self._gear >= 5 and self._rpm > 6000 and self._throttle > 80:
-            # High load in top gears - temps rise more
-            coolant_target = base_coolant + 25 + load_factor * 15  # Can reach 115+
-            oil_target = base_oil + 35 + load_factor * 20  # Can reach 130+
-        else:
-            coolant_target = base_coolant + load_factor * 15
-            oil_target = base_oil + load_factor * 20
-
-        # Warm-up rate (slower when cold, faster when hot and cooling)
-        if self._engine_running_time < 60:
-            rate = 0.5
-        elif self._coolant_temp > coolant_target:
-            rate = 0.15  # Cooling rate
-        else:
-            rate = 0.2  # Heating rate
-
-        # Move toward target
-        self._coolant_temp += (coolant_target - self._coolant_temp) * rate * dt
-        self._oil_temp += (oil_target - self._oil_temp) * rate * dt
-
-        # Add noise
-        self._coolant_temp += random.uniform(-0.3, 0.3)
-        self._oil_temp += random.uniform(-0.3, 0.3)
-
-        # Clamp to reasonable values
-        self._coolant_temp = max(20, min(130, self._coolant_temp))
-        self._oil_temp = max(20, min(150, self._oil_temp))
+        self._coolant_temp, self._oil_temp = step_temperatures(
+            self._coolant_temp,
+            self._oil_temp,
+            self._throttle,
+            self._rpm,
+            self._gear,
+            self._engine_running_time,
+            dt,
+            self._LOAD_K,
+            self._noise[_NOISE_COOLANT] * 0.3,
+            self._noise[_NOISE_OIL_TEMP] * 0.3,
+        )
 
     def _update_fuel(self, dt: float) -> None:
         """Simulate fuel consumption - faster for demo, restarts at zero."""
         # Fuel consumption based on RPM and throttle (faster for demo)
-        load_factor = (self._throttle / 100) * (self._rpm / self.REDLINE_RPM)
-        # Faster consumption for demo visibility
-        consumption = (0.5 + load_factor * 2.0) * dt / 60.0
+        load_factor = self._throttle * self._rpm * self._LOAD_K
+        # Faster consumption for demo visibility (litres-ish per minute)
+        consumption = (0.5 + load_factor * 2.0) * dt * (1 / 60.0)
         self._fuel_level = max(0, self._fuel_level - consumption)
 
         # Restart at zero - reset to 29%
@@ -358,57 +460,55 @@ class MockDataSource(DataSource):
     def _calculate_oil_pressure(self) -> float:
         """Calculate oil pressure based on RPM."""
         # Oil pressure increases with RPM
-        base = 1.0 + (self._rpm / 1000) * 0.8
-        return base + random.uniform(-0.2, 0.2)
+        base = 1.0 + self._rpm * 0.0008
+        return base + self._noise[_NOISE_OIL_PRESSURE] * 0.2
+
+    def _load_bucket(self) -> int:
+        """Get the fueling table row for the current throttle (0-2)."""
+        throttle = self._throttle
+        return (throttle > 30) + (throttle > 80)
 
     def _calculate_afr(self) -> float:
         """Calculate air-fuel ratio based on load."""
-        if self._throttle > 80:
-            # Rich under boost
-            return 11.5 + random.uniform(-0.3, 0.3)
-        elif self._throttle > 30:
-            # Slightly rich at part throttle
-            return 13.5 + random.uniform(-0.3, 0.3)
-        else:
-            # Stoich at cruise/idle
-            return 14.7 + random.uniform(-0.2, 0.2)
+        bucket = self._load_bucket()
+        return (
+            _AFR_BY_LOAD[bucket] + self._noise[_NOISE_AFR] * _AFR_NOISE_BY_LOAD[bucket]
+        )
 
     def _calculate_injector_duty(self) -> float:
         """Calculate injector duty cycle."""
-        base = (self._rpm / self.REDLINE_RPM) * 50
-        load_factor = self._throttle / 100
-        duty = base + (load_factor * 40)
-        return min(95, duty + random.uniform(-2, 2))
+        duty = self._rpm * self._DUTY_PER_RPM + self._throttle * 0.4
+        return min(95, duty + self._noise[_NOISE_DUTY] * 2)
 
     def _calculate_ignition(self) -> float:
         """Calculate ignition timing."""
         # Base timing varies with RPM and load
-        base = 35 - (self._throttle / 100) * 20
-        rpm_advance = min(10, (self._rpm - self.IDLE_RPM) / 500)
-        return base + rpm_advance + random.uniform(-1, 1)
+        base = 35 - self._throttle * 0.2
+        rpm_advance = min(10, (self._rpm - self.IDLE_RPM) * 0.002)
+        return base + rpm_advance + self._noise[_NOISE_IGNITION]
 
-    def _get_engine_flags(self) -> EngineFlags:
-        """Get current engine status flags."""
-        flags = EngineFlags.NONE
+    def _get_engine_flags(self) -> int:
+        """Get current engine status flags (EngineFlags bits)."""
+        flags = 0
 
         if self._rpm < 1000:
-            flags |= EngineFlags.IDLE
+            flags |= _FLAG_IDLE
         if self._rpm >= self.UPSHIFT_RPM and self._throttle > 90:
             # Simulate shift light / gear cut
-            flags |= EngineFlags.GEARCUT
+            flags |= _FLAG_GEARCUT
 
         return flags
 
-    def _get_warnings(self) -> WarningFlags:
-        """Get warning flags (occasional if enabled)."""
+    def _get_warnings(self) -> int:
+        """Get warning flags (WarningFlags bits, occasional if enabled)."""
         if not self._enable_warnings:
-            return WarningFlags.NONE
+            return 0
 
-        warnings = WarningFlags.NONE
+        warnings = 0
 
         # Randomly trigger warnings (rare)
         if random.random() < 0.001:
-            warnings |= WarningFlags.KNOCKING
+            warnings |= _WARNING_KNOCKING
 
         return warnings
 
@@ -418,4 +518,4 @@ class MockDataSource(DataSource):
 
     def set_rpm(self, rpm: int) -> None:
         """Manually set RPM (for testing)."""
-        self._rpm = max(0, min(self.REV_LIMIT_RPM, rpm))
+        self._rpm = float(max(0, min(self.REV_LIMIT_RPM, rpm)))
@@ -5,9 +5,18 @@ Reference: https://github.com/designer2k2/EMUcan
 ECU: ECUMaster EMU Black
 """
 
-import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import IntFlag
+from typing import Final, Tuple
+
+import numpy as np
+
+from ..core.constants import GAUGE_COOLANT_CRITICAL, GAUGE_RPM_REDLINE, KMH_TO_MPH
+from ..core.slots import slotted
+
+# Thresholds behind the VehicleState status properties
+REDLINE_RPM: Final = GAUGE_RPM_REDLINE
+OVERHEAT_C: Final = GAUGE_COOLANT_CRITICAL
 
 
 class EngineFlags(IntFlag):
@@ -51,6 +60,18 @@ class WarningFlags(IntFlag):
     BATTERY_LOW = 0x0400  # Low battery voltage
 
 
+# WarningFlags bits that indicate a failed sensor rather than an alarm
+SENSOR_FAULT_MASK = int(
+    WarningFlags.CLT_SENSOR
+    | WarningFlags.IAT_SENSOR
+    | WarningFlags.MAP_SENSOR
+    | WarningFlags.WBO_SENSOR
+    | WarningFlags.EGT1_SENSOR
+    | WarningFlags.EGT2_SENSOR
+)
+
+
+@slotted
 @dataclass
 class VehicleState:
     """
@@ -61,7 +82,12 @@ class VehicleState:
     - Temperature: Celsius
     - Pressure: bar (boost) or kPa (manifold)
 
-    Unit conversion happens at the display layer.
+    Unit conversion happens at the display layer. Status flags are
+    stored as raw ints; engine_flags / warning_flags wrap them in their
+    IntFlag types for display.
+
+    Instances are slotted (no per-instance __dict__) since one is
+    produced for every complete CAN frame set.
     """
 
     # ==========================================================================
@@ -111,18 +137,29 @@ class VehicleState:
     # ==========================================================================
     # Status Flags
     # ==========================================================================
-    flags: EngineFlags = field(default_factory=lambda: EngineFlags.NONE)
-    warnings: WarningFlags = field(default_factory=lambda: WarningFlags.NONE)
+    flags: int = 0  # EngineFlags bits
+    warnings: int = 0  # WarningFlags bits
 
     # ==========================================================================
     # Timing
     # ==========================================================================
-    timestamp: float = field(default_factory=time.time)
+    # Monotonic nanoseconds, stamped by the producing source; 0 = unstamped
+    timestamp_ns: int = 0
 
     # ==========================================================================
     # Computed Properties
     # ==========================================================================
 
+    @property
+    def timestamp(self) -> float:
+        """Get the monotonic timestamp in seconds."""
+        return self.timestamp_ns * 1e-9
+
+    @property
+    def speed_mph(self) -> float:
+        """Get vehicle speed in mph."""
+        return self.speed * KMH_TO_MPH
+
     @property
     def gear_display(self) -> str:
         """Get displayable gear string."""
@@ -135,56 +172,160 @@ class VehicleState:
 
     @property
     def is_at_redline(self) -> bool:
-        """Check if RPM is at or above redline (7200 default)."""
-        return self.rpm >= 7200
+        """Check if RPM is at or above redline (REDLINE_RPM)."""
+        return self.rpm >= REDLINE_RPM
 
     @property
     def is_overheating(self) -> bool:
-        """Check if coolant temp is critical (115°C default)."""
-        return self.coolant_temp >= 115
+        """Check if coolant temp is critical (OVERHEAT_C)."""
+        return self.coolant_temp >= OVERHEAT_C
+
+    @property
+    def engine_flags(self) -> EngineFlags:
+        """Get the engine status flags as an EngineFlags value."""
+        return EngineFlags(self.flags)
+
+    @property
+    def warning_flags(self) -> WarningFlags:
+        """Get the warning flags as a WarningFlags value."""
+        return WarningFlags(self.warnings)
 
     @property
     def has_warnings(self) -> bool:
         """Check if any warning flags are set."""
-        return self.warnings != WarningFlags.NONE
+        return self.warnings != 0
 
     @property
     def has_sensor_faults(self) -> bool:
         """Check if any sensor fault flags are set."""
-        sensor_faults = (
-            WarningFlags.CLT_SENSOR
-            | WarningFlags.IAT_SENSOR
-            | WarningFlags.MAP_SENSOR
-            | WarningFlags.WBO_SENSOR
-            | WarningFlags.EGT1_SENSOR
-            | WarningFlags.EGT2_SENSOR
-        )
-        return bool(self.warnings & sensor_faults)
+        return bool(self.warnings & SENSOR_FAULT_MASK)
 
     def copy(self) -> "VehicleState":
         """Create a shallow copy of this state."""
-        return VehicleState(
-            rpm=self.rpm,
-            speed=self.speed,
-            gear=self.gear,
-            boost_pressure=self.boost_pressure,
-            map_kpa=self.map_kpa,
-            oil_pressure=self.oil_pressure,
-            fuel_pressure=self.fuel_pressure,
-            coolant_temp=self.coolant_temp,
-            oil_temp=self.oil_temp,
-            intake_temp=self.intake_temp,
-            egt1=self.egt1,
-            egt2=self.egt2,
-            afr=self.afr,
-            lambda_value=self.lambda_value,
-            lambda_target=self.lambda_target,
-            tps=self.tps,
-            injector_duty=self.injector_duty,
-            ignition_angle=self.ignition_angle,
-            battery_voltage=self.battery_voltage,
-            fuel_level=self.fuel_level,
-            flags=self.flags,
-            warnings=self.warnings,
-            timestamp=self.timestamp,
+        state = VehicleState.__new__(VehicleState)
+        state.copy_from(self)
+        return state
+
+    def copy_from(self, other: "VehicleState") -> None:
+        """
+        Overwrite every field of this state with another state's values.
+
+        Args:
+            other: State to copy from.
+        """
+        self.rpm = other.rpm
+        self.speed = other.speed
+        self.gear = other.gear
+        self.boost_pressure = other.boost_pressure
+        self.map_kpa = other.map_kpa
+        self.oil_pressure = other.oil_pressure
+        self.fuel_pressure = other.fuel_pressure
+        self.coolant_temp = other.coolant_temp
+        self.oil_temp = other.oil_temp
+        self.intake_temp = other.intake_temp
+        self.egt1 = other.egt1
+        self.egt2 = other.egt2
+        self.afr = other.afr
+        self.lambda_value = other.lambda_value
+        self.lambda_target = other.lambda_target
+        self.tps = other.tps
+        self.injector_duty = other.injector_duty
+        self.ignition_angle = other.ignition_angle
+        self.battery_voltage = other.battery_voltage
+        self.fuel_level = other.fuel_level
+        self.flags = other.flags
+        self.warnings = other.warnings
+        self.timestamp_ns = other.timestamp_ns
+
+
+# Numeric VehicleState fields recorded by StateHistory, one column each
+HISTORY_FIELDS: Tuple[str, ...] = (
+    "timestamp",
+    "rpm",
+    "speed",
+    "gear",
+    "boost_pressure",
+    "map_kpa",
+    "oil_pressure",
+    "fuel_pressure",
+    "coolant_temp",
+    "oil_temp",
+    "intake_temp",
+    "egt1",
+    "egt2",
+    "afr",
+    "lambda_value",
+    "lambda_target",
+    "tps",
+    "injector_duty",
+    "ignition_angle",
+    "battery_voltage",
+    "fuel_level",
+    "flags",
+    "warnings",
+)
+
+
+class StateHistory:
+    """
+    Fixed-size ring of past vehicle states stored column-wise.
+
+    Each field is a column of a numpy record array, so plotting or
+    logging code can read a whole channel as one array instead of
+    walking VehicleState objects.
+
+    Usage:
+        history = StateHistory(capacity=4096)
+        history.append(state)
+        rpm_trace = history.channel("rpm")
+    """
+
+    def __init__(self, capacity: int = 4096):
+        """
+        Initialize an empty history.
+
+        Args:
+            capacity: Number of states kept before the oldest is overwritten.
+        """
+        self.capacity = capacity
+        self._buffer = np.zeros(
+            capacity, dtype=[(name, np.float64) for name in HISTORY_FIELDS]
+        ).view(np.recarray)
+        self._count = 0  # Total states appended
+
+    def __len__(self) -> int:
+        """Number of states currently held."""
+        return min(self._count, self.capacity)
+
+    def append(self, state: VehicleState) -> None:
+        """
+        Record a state, overwriting the oldest once full.
+
+        Args:
+            state: State to record. Its values are copied.
+        """
+        self._buffer[self._count % self.capacity] = tuple(
+            getattr(state, name) for name in HISTORY_FIELDS
         )
+        self._count += 1
+
+    def channel(self, name: str) -> np.ndarray:
+        """
+        Get one field's values in chronological order.
+
+        Args:
+            name: Field name from HISTORY_FIELDS.
+
+        Returns:
+            Array of the held values, oldest first. A view when the ring
+            has not wrapped yet, otherwise a copy.
+        """
+        column = self._buffer[name]
+        if self._count <= self.capacity:
+            return column[: self._count]
+        start = self._count % self.capacity
+        return np.concatenate((column[start:], column[:start]))
+
+    def clear(self) -> None:
+        """Drop all recorded states."""
+        self._count = 0
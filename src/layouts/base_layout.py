@@ -8,9 +8,9 @@ Provides common functionality for all dashboard layouts including:
 """
 
 from abc import ABCMeta, abstractmethod
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtWidgets import QWidget
 from PyQt5.sip import wrappertype
 
@@ -32,8 +32,14 @@ class BaseLayout(QWidget, metaclass=QWidgetABCMeta):
     Subclasses must implement:
     - _setup_ui(): Create and arrange widgets
     - update_from_state(): Update widgets from VehicleState
+
+    Signals:
+        visibility_changed: Emitted with False when the layout is hidden
+            (including by minimizing its window) and True when shown.
     """
 
+    visibility_changed = pyqtSignal(bool)
+
     def __init__(self, parent: Optional[QWidget] = None):
         """
         Initialize base layout.
@@ -45,6 +51,7 @@ class BaseLayout(QWidget, metaclass=QWidgetABCMeta):
 
         self._theme = get_current_theme()
         self._widgets: Dict[str, QWidget] = {}
+        self._themeable: List[QWidget] = []  # Registered widgets with refresh_theme
         self._last_state: Optional[VehicleState] = None
 
         # Set background
@@ -83,7 +90,12 @@ class BaseLayout(QWidget, metaclass=QWidgetABCMeta):
             name: Widget identifier.
             widget: Widget instance.
         """
+        old = self._widgets.get(name)
+        if old is not None and old in self._themeable:
+            self._themeable.remove(old)
         self._widgets[name] = widget
+        if hasattr(widget, "refresh_theme"):
+            self._themeable.append(widget)
 
     def get_widget(self, name: str) -> Optional[QWidget]:
         """
@@ -97,6 +109,16 @@ class BaseLayout(QWidget, metaclass=QWidgetABCMeta):
         """
         return self._widgets.get(name)
 
+    def showEvent(self, event) -> None:
+        """Report that the layout is on screen."""
+        super().showEvent(event)
+        self.visibility_changed.emit(True)
+
+    def hideEvent(self, event) -> None:
+        """Report that the layout is no longer on screen."""
+        super().hideEvent(event)
+        self.visibility_changed.emit(False)
+
     @property
     def theme(self):
         """Get current theme."""
@@ -105,9 +127,8 @@ class BaseLayout(QWidget, metaclass=QWidgetABCMeta):
     def refresh_theme(self) -> None:
         """Refresh theme for all widgets."""
         self._theme = get_current_theme()
-        for widget in self._widgets.values():
-            if hasattr(widget, "refresh_theme"):
-                widget.refresh_theme()
+        for widget in self._themeable:
+            widget.refresh_theme()
 
     def show_connection_warning(self) -> None:
         """Show a visual indication that connection is lost."""
@@ -17,12 +17,12 @@ Layout (1920x720):
 └─────────────────────────────────────────────────────────────────────────────┘
 """
 
-from typing import Optional
+from operator import attrgetter
+from typing import Callable, List, Optional, Tuple
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QRect, Qt
 from PyQt5.QtWidgets import (
     QFrame,
-    QGridLayout,
     QHBoxLayout,
     QLabel,
     QVBoxLayout,
@@ -41,6 +41,88 @@ from ..widgets import (
 )
 from .base_layout import BaseLayout
 
+# (state getter, widget setter, display decimals) applied on every state update
+_Binding = Tuple[Callable[[VehicleState], float], Callable[[float], None], int]
+
+
+# Right panel geometry. The dash is fixed-size, so the panel's cells are
+# placed once with setGeometry instead of through a QGridLayout.
+_RIGHT_PANEL_WIDTH = 600  # 50% wider panel
+_RIGHT_PANEL_HEIGHT = SCREEN_HEIGHT - 30  # Inside the main layout margins
+_RIGHT_PANEL_MARGIN = 10
+_RIGHT_PANEL_SPACING = 12
+_RIGHT_PANEL_ROWS = 4  # Three rows of metric boxes, then the fuel bar
+_RIGHT_PANEL_COLUMNS = 2
+
+# Right panel metric boxes:
+# (key, label, (min, max), decimals, unit, thresholds, (row, column)).
+# Each box is registered under its key and stored as self._<key>.
+_METRIC_CONFIG = (
+    ("oil_pressure", "Oil Pressure", (0, 10), 1, "bar", {"warning_low": 1.0}, (0, 0)),
+    (
+        "oil_temp",
+        "Oil Temp",
+        (0, 160),
+        0,
+        "°C",
+        {"warning": 120, "critical": 140},
+        (0, 1),
+    ),
+    (
+        "coolant_temp",
+        "Coolant Temp",
+        (0, 140),
+        0,
+        "°C",
+        {"warning": 105, "critical": 115},
+        (1, 0),
+    ),
+    ("afr", "AFR", (10, 20), 1, "", {}, (1, 1)),
+    (
+        "battery",
+        "Battery",
+        (10, 16),
+        1,
+        "V",
+        {"warning": 15.0, "warning_low": 12.0},
+        (2, 0),
+    ),
+    ("boost", "Boost", (-1.0, 2.5), 2, "bar", {"warning": 2.0}, (2, 1)),
+)
+
+
+def _right_panel_cell(row: int, column: int, column_span: int = 1) -> QRect:
+    """
+    Get the geometry of a right panel grid cell.
+
+    Args:
+        row: Grid row.
+        column: Grid column.
+        column_span: Number of columns the cell covers.
+
+    Returns:
+        Cell rectangle in panel coordinates.
+    """
+    inner_width = _RIGHT_PANEL_WIDTH - 2 * _RIGHT_PANEL_MARGIN
+    inner_height = _RIGHT_PANEL_HEIGHT - 2 * _RIGHT_PANEL_MARGIN
+    spacing = _RIGHT_PANEL_SPACING
+    cell_width = (inner_width - spacing * (_RIGHT_PANEL_COLUMNS - 1)) / (
+        _RIGHT_PANEL_COLUMNS
+    )
+    cell_height = (inner_height - spacing * (_RIGHT_PANEL_ROWS - 1)) / (
+        _RIGHT_PANEL_ROWS
+    )
+
+    left = _RIGHT_PANEL_MARGIN + column * (cell_width + spacing)
+    top = _RIGHT_PANEL_MARGIN + row * (cell_height + spacing)
+    width = column_span * cell_width + (column_span - 1) * spacing
+    return QRect(round(left), round(top), round(width), round(cell_height))
+
+
+def _setter(widget: QWidget, name: str) -> Callable[[float], None]:
+    """Return the property setter for ``widget.name`` bound to the widget."""
+    return getattr(type(widget), name).fset.__get__(widget)
+
 
 class RaceLayout(BaseLayout):
     """
@@ -80,6 +162,38 @@ class RaceLayout(BaseLayout):
         right_panel = self._create_right_panel()
         main_layout.addWidget(right_panel)
 
+        self._bindings = self._create_bindings()
+        # Last value written through each binding (None until first update)
+        self._bound_values: List[Optional[float]] = [None] * len(self._bindings)
+
+    def _create_bindings(self) -> List[_Binding]:
+        """
+        Build the state-to-widget dispatch table.
+
+        Getters and bound setters are resolved once here so each update
+        is a flat loop of calls with no per-field attribute lookups. The
+        decimals are each widget's display precision; values are rounded
+        to it so changes too small to show never reach the widget.
+        """
+        return [
+            # Core displays
+            (attrgetter("gear"), _setter(self._gear_indicator, "gear"), 0),
+            (attrgetter("rpm"), _setter(self._rpm_display, "value"), 0),
+            (attrgetter("rpm"), _setter(self._rpm_bar, "value"), 0),
+            (attrgetter("speed_mph"), _setter(self._speed_display, "value"), 0),
+            # Pressures
+            (attrgetter("boost_pressure"), _setter(self._boost, "value"), 2),
+            (attrgetter("oil_pressure"), _setter(self._oil_pressure, "value"), 1),
+            # Temperatures
+            (attrgetter("oil_temp"), _setter(self._oil_temp, "value"), 0),
+            (attrgetter("coolant_temp"), _setter(self._coolant_temp, "value"), 0),
+            # Fueling
+            (attrgetter("afr"), _setter(self._afr, "value"), 1),
+            (attrgetter("fuel_level"), _setter(self._fuel_level, "value"), 0),
+            # Electrical
+            (attrgetter("battery_voltage"), _setter(self._battery, "value"), 1),
+        ]
+
     def _create_left_panel(self) -> QWidget:
         """Create left panel with gear and status."""
         panel = QFrame()
@@ -94,12 +208,13 @@ class RaceLayout(BaseLayout):
         layout.addWidget(self._gear_indicator, stretch=4)
         self.register_widget("gear", self._gear_indicator)
 
-        # Connection status at bottom of left panel
+        # Connection status at bottom of left panel. Styled by the theme
+        # stylesheet (QLabel#ConnectionStatus); toggles flip "warn".
         self._status_label = QLabel("Connected")
+        self._status_label.setObjectName("ConnectionStatus")
         self._status_label.setAlignment(Qt.AlignCenter)
-        self._status_label.setStyleSheet(
-            f"color: {self.theme.ROBOTECHY_GREEN}; font-size: 14px; padding: 10px;"
-        )
+        self._status_label.setProperty("warn", False)
+        self._status_warn = False
         layout.addWidget(self._status_label)
         self.register_widget("status", self._status_label)
 
@@ -149,68 +264,21 @@ class RaceLayout(BaseLayout):
     def _create_right_panel(self) -> QWidget:
         """Create right panel with secondary metrics (wider)."""
         panel = QFrame()
-        panel.setFixedWidth(600)  # 50% wider panel
-        layout = QGridLayout(panel)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(12)
-
-        # Oil Pressure
-        self._oil_pressure = MetricBox("Oil Pressure")
-        self._oil_pressure.set_range(0, 10)
-        self._oil_pressure.set_decimals(1)
-        self._oil_pressure.set_unit("bar")
-        self._oil_pressure.set_thresholds(warning_low=1.0)
-        layout.addWidget(self._oil_pressure, 0, 0)
-        self.register_widget("oil_pressure", self._oil_pressure)
-
-        # Oil Temp
-        self._oil_temp = MetricBox("Oil Temp")
-        self._oil_temp.set_range(0, 160)
-        self._oil_temp.set_decimals(0)
-        self._oil_temp.set_unit("°C")
-        self._oil_temp.set_thresholds(warning=120, critical=140)
-        layout.addWidget(self._oil_temp, 0, 1)
-        self.register_widget("oil_temp", self._oil_temp)
-
-        # Coolant Temp
-        self._coolant_temp = MetricBox("Coolant Temp")
-        self._coolant_temp.set_range(0, 140)
-        self._coolant_temp.set_decimals(0)
-        self._coolant_temp.set_unit("°C")
-        self._coolant_temp.set_thresholds(warning=105, critical=115)
-        layout.addWidget(self._coolant_temp, 1, 0)
-        self.register_widget("coolant_temp", self._coolant_temp)
-
-        # AFR
-        self._afr = MetricBox("AFR")
-        self._afr.set_range(10, 20)
-        self._afr.set_decimals(1)
-        self._afr.set_unit("")
-        layout.addWidget(self._afr, 1, 1)
-        self.register_widget("afr", self._afr)
-
-        # Battery
-        self._battery = MetricBox("Battery")
-        self._battery.set_range(10, 16)
-        self._battery.set_decimals(1)
-        self._battery.set_unit("V")
-        self._battery.set_thresholds(warning=15.0, warning_low=12.0)
-        layout.addWidget(self._battery, 2, 0)
-        self.register_widget("battery", self._battery)
-
-        # Boost gauge (moved from left panel)
-        self._boost_box = MetricBox("Boost")
-        self._boost_box.set_range(-1.0, 2.5)
-        self._boost_box.set_decimals(2)
-        self._boost_box.set_unit("bar")
-        self._boost_box.set_thresholds(warning=2.0)
-        layout.addWidget(self._boost_box, 2, 1)
-        self.register_widget("boost", self._boost_box)
+        panel.setFixedSize(_RIGHT_PANEL_WIDTH, _RIGHT_PANEL_HEIGHT)
+
+        for key, label, (low, high), decimals, unit, thresholds, cell in _METRIC_CONFIG:
+            box = MetricBox(label, panel)
+            box.set_range(low, high)
+            box.set_decimals(decimals)
+            box.set_unit(unit)
+            box.set_thresholds(**thresholds)
+            box.setGeometry(_right_panel_cell(*cell))
+            self.register_widget(key, box)
+            setattr(self, f"_{key}", box)
 
         # Fuel Level - with visual bar (at bottom, spans both columns)
-        self._fuel_level = FuelBar()
-        self._fuel_level.setMinimumHeight(100)  # Taller for bigger text
-        layout.addWidget(self._fuel_level, 3, 0, 1, 2)  # Row 3, span both columns
+        self._fuel_level = FuelBar(panel)
+        self._fuel_level.setGeometry(_right_panel_cell(3, 0, column_span=2))
         self.register_widget("fuel_level", self._fuel_level)
 
         return panel
@@ -224,40 +292,37 @@ class RaceLayout(BaseLayout):
         """
         self._last_state = state
 
-        # Core displays
-        self._gear_indicator.gear = state.gear
-        self._rpm_display.value = state.rpm
-        self._rpm_bar.value = state.rpm
-        self._speed_display.value = state.speed * 0.621371  # km/h to mph
-
-        # Pressures
-        self._boost_box.value = state.boost_pressure
-        self._oil_pressure.value = state.oil_pressure
-
-        # Temperatures
-        self._oil_temp.value = state.oil_temp
-        self._coolant_temp.value = state.coolant_temp
-
-        # Fueling
-        self._afr.value = state.afr
-        self._fuel_level.value = state.fuel_level
-
-        # Electrical
-        self._battery.value = state.battery_voltage
+        # Only write fields whose displayed value changed since last frame
+        last = self._bound_values
+        for i, (get, set_value, decimals) in enumerate(self._bindings):
+            value = round(get(state), decimals)
+            if value != last[i]:
+                last[i] = value
+                set_value(value)
 
     def show_connection_warning(self) -> None:
-        """Show disconnection warning."""
+        """Show disconnection warning (no-op if already shown)."""
+        if self._status_warn:
+            return
         self._status_label.setText("Disconnected")
-        self._status_label.setStyleSheet(
-            f"color: {self.theme.CRITICAL}; font-size: 14px; padding: 10px;"
-        )
+        self._set_status_warn(True)
 
     def hide_connection_warning(self) -> None:
-        """Hide disconnection warning."""
+        """Hide disconnection warning (no-op if already hidden)."""
+        if not self._status_warn:
+            return
         self._status_label.setText("Connected")
-        self._status_label.setStyleSheet(
-            f"color: {self.theme.ROBOTECHY_GREEN}; font-size: 14px; padding: 10px;"
-        )
+        self._set_status_warn(False)
+
+    def _set_status_warn(self, warn: bool) -> None:
+        """Restyle the status label for the given warning state."""
+        self._status_warn = warn
+        label = self._status_label
+        label.setProperty("warn", warn)
+        # Re-polish so the property selector is re-evaluated; the already
+        # parsed stylesheet is reused rather than set again.
+        label.style().unpolish(label)
+        label.style().polish(label)
 
     def cleanup(self) -> None:
         """Clean up resources."""
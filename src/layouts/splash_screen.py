@@ -5,18 +5,43 @@ Displays the Robotechy R logo during application startup
 while initializing CAN communication and loading resources.
 """
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from PyQt5.QtCore import QEasingCurve, QPropertyAnimation, Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QColor, QFont, QPainter, QPixmap
-from PyQt5.QtWidgets import (
-    QApplication,
-    QGraphicsOpacityEffect,
-    QWidget,
+from PyQt5.QtGui import QColor, QPainter, QPixmap
+from PyQt5.QtWidgets import QWidget
+
+from ..core.constants import (
+    ROBOTECHY_LOGO_EXISTS,
+    ROBOTECHY_LOGO_STR,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
 )
-
-from ..core.constants import ROBOTECHY_LOGO_PATH, SCREEN_HEIGHT, SCREEN_WIDTH
 from ..themes import get_current_theme
+from ..widgets.base_widget import get_dashboard_font
+
+# Decoded and smooth-scaled logos keyed by (path, height), so later
+# splashes skip the PNG decode and rescale
+_SCALED_LOGO_CACHE: Dict[Tuple[str, int], QPixmap] = {}
+
+
+def _scaled_logo(path: str, height: int) -> QPixmap:
+    """
+    Load a logo scaled to the given height, reusing earlier results.
+
+    Args:
+        path: Image file path.
+        height: Target height in pixels.
+
+    Returns:
+        Scaled pixmap.
+    """
+    key = (path, height)
+    pixmap = _SCALED_LOGO_CACHE.get(key)
+    if pixmap is None:
+        pixmap = QPixmap(path).scaledToHeight(height, Qt.SmoothTransformation)
+        _SCALED_LOGO_CACHE[key] = pixmap
+    return pixmap
 
 
 class SplashScreen(QWidget):
@@ -49,6 +74,8 @@ class SplashScreen(QWidget):
         self._theme = get_current_theme()
         self._status_text = "Initializing..."
         self._logo_pixmap: Optional[QPixmap] = None
+        self._logo_x = 0
+        self._logo_y = 0
 
         # Timer for auto-close
         self._timer = QTimer(self)
@@ -59,42 +86,61 @@ class SplashScreen(QWidget):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setFixedSize(SCREEN_WIDTH, SCREEN_HEIGHT)
 
-        # Opacity effect for fade transitions
-        self._opacity_effect = QGraphicsOpacityEffect(self)
-        self._opacity_effect.setOpacity(0.0)
-        self.setGraphicsEffect(self._opacity_effect)
-
-        # Fade animations
-        self._fade_in_anim = QPropertyAnimation(self._opacity_effect, b"opacity")
+        # Fade animations drive the window opacity, which the compositor
+        # applies without re-rendering the widget each frame
+        self._fade_in_anim = QPropertyAnimation(self, b"windowOpacity")
         self._fade_in_anim.setDuration(400)
         self._fade_in_anim.setStartValue(0.0)
         self._fade_in_anim.setEndValue(1.0)
         self._fade_in_anim.setEasingCurve(QEasingCurve.OutCubic)
 
-        self._fade_out_anim = QPropertyAnimation(self._opacity_effect, b"opacity")
+        self._fade_out_anim = QPropertyAnimation(self, b"windowOpacity")
         self._fade_out_anim.setDuration(500)
         self._fade_out_anim.setStartValue(1.0)
         self._fade_out_anim.setEndValue(0.0)
         self._fade_out_anim.setEasingCurve(QEasingCurve.InCubic)
         self._fade_out_anim.finished.connect(self._on_fade_out_complete)
 
-        # Load logo
+        # Quick fade for skip(); no start value, so it fades from wherever
+        # the opacity is when skipped
+        self._fade_skip_anim = QPropertyAnimation(self, b"windowOpacity")
+        self._fade_skip_anim.setDuration(200)
+        self._fade_skip_anim.setEndValue(0.0)
+        self._fade_skip_anim.setEasingCurve(QEasingCurve.InCubic)
+        self._fade_skip_anim.finished.connect(self._on_fade_out_complete)
+
+        # Load logo and pre-composite the frame that every paint blits
+        self._frame = QPixmap()
         self._load_logo()
+        self._compose_frame()
 
     def _load_logo(self) -> None:
         """Load the Robotechy logo."""
-        logo_path = ROBOTECHY_LOGO_PATH
-
-        if logo_path.exists():
-            self._logo_pixmap = QPixmap(str(logo_path))
-            # Scale to appropriate size (about 1/3 of screen height)
-            target_height = SCREEN_HEIGHT * 0.5
-            self._logo_pixmap = self._logo_pixmap.scaledToHeight(
-                int(target_height), Qt.SmoothTransformation
-            )
+        if ROBOTECHY_LOGO_EXISTS:
+            # Scale to appropriate size (about 1/2 of screen height)
+            target_height = int(SCREEN_HEIGHT * 0.5)
+            self._logo_pixmap = _scaled_logo(ROBOTECHY_LOGO_STR, target_height)
         else:
-            # Create placeholder if logo not found
-            self._logo_pixmap = None
+            # Rasterize a placeholder once if logo not found, so fade frames
+            # only blit it
+            self._logo_pixmap = self._render_placeholder_logo()
+
+    def _compose_frame(self) -> None:
+        """Render the background with the centered logo into one pixmap."""
+        self._frame = QPixmap(self.size())
+        self._frame.fill(QColor(self._theme.BACKGROUND))
+
+        if self._logo_pixmap:
+            self._logo_x = (self.width() - self._logo_pixmap.width()) // 2
+            self._logo_y = (self.height() - self._logo_pixmap.height()) // 2
+            painter = QPainter(self._frame)
+            painter.drawPixmap(self._logo_x, self._logo_y, self._logo_pixmap)
+            painter.end()
+
+    def resizeEvent(self, event) -> None:
+        """Recomposite the frame when the splash is resized."""
+        super().resizeEvent(event)
+        self._compose_frame()
 
     def set_status(self, text: str) -> None:
         """
@@ -108,6 +154,7 @@ class SplashScreen(QWidget):
 
     def start(self) -> None:
         """Start the splash screen with fade in."""
+        self.setWindowOpacity(0.0)
         self.show()
         self._fade_in_anim.start()
         self._timer.start(self._duration)
@@ -123,48 +170,38 @@ class SplashScreen(QWidget):
     def skip(self) -> None:
         """Skip the splash screen with quick fade."""
         self._timer.stop()
-        # Quick fade out
-        self._fade_out_anim.setDuration(200)
-        self._fade_out_anim.start()
+        # Stopped animations don't emit finished, so only the skip fade
+        # completes the splash
+        self._fade_in_anim.stop()
+        self._fade_out_anim.stop()
+        self._fade_skip_anim.start()
 
     def paintEvent(self, event) -> None:
         """Paint the splash screen - just the Robotechy R logo centered."""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setRenderHint(QPainter.TextAntialiasing)
-
-        rect = self.rect()
-
-        # Draw background
-        painter.fillRect(rect, QColor(self._theme.BACKGROUND))
+        painter.drawPixmap(0, 0, self._frame)
+        painter.end()
 
-        center_x = rect.center().x()
-        center_y = rect.center().y()
-
-        # Draw logo only - centered
-        if self._logo_pixmap:
-            logo_x = center_x - self._logo_pixmap.width() // 2
-            logo_y = center_y - self._logo_pixmap.height() // 2
-            painter.drawPixmap(logo_x, logo_y, self._logo_pixmap)
-        else:
-            # Draw placeholder "R" if no logo
-            self._draw_placeholder_logo(painter, center_x, center_y)
+    def _render_placeholder_logo(self) -> QPixmap:
+        """Render the placeholder R logo into a transparent pixmap."""
+        pixmap = QPixmap(self.size())
+        pixmap.fill(Qt.transparent)
 
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        center = self.rect().center()
+        self._draw_placeholder_logo(painter, center.x(), center.y())
         painter.end()
 
+        return pixmap
+
     def _draw_placeholder_logo(
         self, painter: QPainter, center_x: int, center_y: int
     ) -> None:
         """Draw a placeholder R with shadow if logo file not found."""
-        # Try to use custom font if available
-        app = QApplication.instance()
-        custom_font = app.property("custom_font") if app else None
-        font_name = custom_font if custom_font else "Roboto"
-
         # Large stylized R
-        font = QFont(font_name, 180)
-        font.setBold(True)
-        painter.setFont(font)
+        painter.setFont(get_dashboard_font(180, bold=True))
 
         text_rect = self.rect()
         text_rect.moveCenter(self.rect().center())
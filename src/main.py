@@ -25,9 +25,6 @@ import logging
 import sys
 from pathlib import Path
 
-from .core.app import DashboardApp
-from .core.config import Config
-
 
 def setup_logging(debug: bool = False) -> None:
     """
@@ -36,7 +33,8 @@ def setup_logging(debug: bool = False) -> None:
     Args:
         debug: Enable debug level logging.
     """
-    level = logging.DEBUG if debug else logging.INFO
+    # Production runs only surface warnings; --debug shows everything
+    level = logging.DEBUG if debug else logging.WARNING
     format_str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     logging.basicConfig(
@@ -112,9 +110,13 @@ def main() -> int:
     Returns:
         Exit code (0 for success).
     """
-    # Parse arguments
+    # Parse arguments first; --help, --version and usage errors exit here
+    # without paying for the PyQt5 import behind the app
     args = parse_arguments()
 
+    from .core.app import DashboardApp
+    from .core.config import Config
+
     # Setup logging
     setup_logging(args.debug)
     logger = logging.getLogger(__name__)
@@ -6,7 +6,10 @@ on a dark background optimized for visibility in racing conditions.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from functools import cached_property
+from math import inf
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -102,26 +105,40 @@ class RobotechyDarkTheme:
     # Helper Methods
     # =========================================================================
 
-    def get_rpm_zone_colors(self) -> List[Tuple[float, float, str]]:
+    def get_rpm_zone_colors(self) -> Tuple[Tuple[float, float, str], ...]:
         """
         Get RPM zone color definitions.
 
+        Built once per theme; the same immutable tuple is returned on
+        every call.
+
         Returns:
-            List of (start_pct, end_pct, color) tuples.
+            Tuple of (start_pct, end_pct, color) tuples.
         """
-        return [
-            (0.0, 0.75, self.RPM_ZONE_NORMAL),  # 0-75%: Green
-            (0.75, 0.85, self.RPM_ZONE_WARNING),  # 75-85%: Yellow
-            (0.85, 1.0, self.RPM_ZONE_REDLINE),  # 85-100%: Red
-        ]
-
-    def get_boost_colors(self) -> Dict[str, str]:
-        """Get boost pressure color mapping."""
-        return {
-            "vacuum": self.BOOST_VACUUM,
-            "atmosphere": self.BOOST_ATMOSPHERE,
-            "boost": self.BOOST_POSITIVE,
-        }
+        return self._rpm_zones
+
+    def get_boost_colors(self) -> Mapping[str, str]:
+        """Get boost pressure color mapping (read-only, built once per theme)."""
+        return self._boost_color_map
+
+    # Derived tables, built on first use and then stored in the instance
+    # __dict__ (cached_property bypasses the frozen __setattr__), so later
+    # lookups are plain attribute reads rather than hashing every field.
+
+    @cached_property
+    def _rpm_zones(self) -> Tuple[Tuple[float, float, str], ...]:
+        """RPM zone table for this theme."""
+        return _rpm_zone_colors(self)
+
+    @cached_property
+    def _boost_color_map(self) -> Mapping[str, str]:
+        """Boost color mapping for this theme."""
+        return _boost_colors(self)
+
+    @cached_property
+    def _stylesheet(self) -> str:
+        """Qt stylesheet for this theme."""
+        return _build_stylesheet(self)
 
     def get_temperature_color(
         self, value: float, warning: float, critical: float
@@ -166,68 +183,146 @@ class RobotechyDarkTheme:
             return self.WARNING
         return self.NORMAL
 
+    def make_threshold_color_fn(
+        self,
+        warning: Optional[float] = None,
+        critical: Optional[float] = None,
+        warning_low: Optional[float] = None,
+    ) -> Callable[[float], str]:
+        """
+        Build a value-to-color function for a fixed set of thresholds.
+
+        Intended to be built once when thresholds are configured, so the
+        per-paint call does no None checks or theme lookups. Values at or
+        above ``critical`` are critical; values at or above ``warning`` or
+        at or below ``warning_low`` are warnings.
+
+        Args:
+            warning: Warning threshold (high).
+            critical: Critical threshold (high).
+            warning_low: Warning threshold (low).
+
+        Returns:
+            Function mapping a value to a hex color string.
+        """
+        normal, warn, crit = self.NORMAL, self.WARNING, self.CRITICAL
+        # Unset thresholds become bounds that never trigger
+        high_crit = inf if critical is None else critical
+        high_warn = inf if warning is None else warning
+        low_warn = -inf if warning_low is None else warning_low
+
+        def color(value: float) -> str:
+            if value >= high_crit:
+                return crit
+            if value >= high_warn or value <= low_warn:
+                return warn
+            return normal
+
+        return color
+
     def to_stylesheet(self) -> str:
         """
         Generate Qt stylesheet for this theme.
 
+        The theme is frozen, so the string is built once per theme
+        instance and cached; repeat calls return the same object.
+
         Returns:
             Qt stylesheet string.
         """
-        return f"""
-            /* Main Window */
-            QMainWindow {{
-                background-color: {self.BACKGROUND};
-            }}
-
-            QWidget {{
-                background-color: transparent;
-                color: {self.TEXT_PRIMARY};
-                font-family: "Roboto", "Arial", sans-serif;
-            }}
-
-            /* Labels */
-            QLabel {{
-                color: {self.TEXT_PRIMARY};
-            }}
-
-            QLabel[class="secondary"] {{
-                color: {self.TEXT_SECONDARY};
-            }}
-
-            QLabel[class="accent"] {{
-                color: {self.TEXT_ACCENT};
-            }}
-
-            /* Frames */
-            QFrame {{
-                background-color: {self.SURFACE};
-                border: 1px solid {self.BORDER};
-                border-radius: 4px;
-            }}
-
-            QFrame[class="metric-box"] {{
-                background-color: {self.BOX_BACKGROUND};
-                border: 1px solid {self.BOX_BORDER};
-            }}
-
-            /* Buttons (for menu/settings if needed) */
-            QPushButton {{
-                background-color: {self.SURFACE};
-                color: {self.TEXT_PRIMARY};
-                border: 1px solid {self.BORDER};
-                border-radius: 4px;
-                padding: 8px 16px;
-            }}
-
-            QPushButton:hover {{
-                background-color: {self.SURFACE_HOVER};
-                border-color: {self.BORDER_ACCENT};
-            }}
-
-            QPushButton:pressed {{
-                background-color: {self.SURFACE_ELEVATED};
-            }}
-        """
+        return self._stylesheet
+
+
+def _rpm_zone_colors(
+    theme: RobotechyDarkTheme,
+) -> Tuple[Tuple[float, float, str], ...]:
+    """Build the RPM zone table for a theme."""
+    return (
+        (0.0, 0.75, theme.RPM_ZONE_NORMAL),  # 0-75%: Green
+        (0.75, 0.85, theme.RPM_ZONE_WARNING),  # 75-85%: Yellow
+        (0.85, 1.0, theme.RPM_ZONE_REDLINE),  # 85-100%: Red
+    )
+
+
+def _boost_colors(theme: RobotechyDarkTheme) -> Mapping[str, str]:
+    """Build the read-only boost color mapping for a theme."""
+    return MappingProxyType(
+        {
+            "vacuum": theme.BOOST_VACUUM,
+            "atmosphere": theme.BOOST_ATMOSPHERE,
+            "boost": theme.BOOST_POSITIVE,
+        }
+    )
+
+
+def _build_stylesheet(theme: RobotechyDarkTheme) -> str:
+    """Format the Qt stylesheet for a theme."""
+    return f"""
+        /* Main Window */
+        QMainWindow {{
+            background-color: {theme.BACKGROUND};
+        }}
+
+        QWidget {{
+            background-color: transparent;
+            color: {theme.TEXT_PRIMARY};
+            font-family: "Roboto", "Arial", sans-serif;
+        }}
+
+        /* Labels */
+        QLabel {{
+            color: {theme.TEXT_PRIMARY};
+        }}
+
+        QLabel[class="secondary"] {{
+            color: {theme.TEXT_SECONDARY};
+        }}
+
+        QLabel[class="accent"] {{
+            color: {theme.TEXT_ACCENT};
+        }}
+
+        /* Connection status (warn property set while disconnected) */
+        QLabel#ConnectionStatus {{
+            color: {theme.ROBOTECHY_GREEN};
+            font-size: 14px;
+            padding: 10px;
+        }}
+
+        QLabel#ConnectionStatus[warn="true"] {{
+            color: {theme.CRITICAL};
+        }}
+
+        /* Frames */
+        QFrame {{
+            background-color: {theme.SURFACE};
+            border: 1px solid {theme.BORDER};
+            border-radius: 4px;
+        }}
+
+        QFrame[class="metric-box"] {{
+            background-color: {theme.BOX_BACKGROUND};
+            border: 1px solid {theme.BOX_BORDER};
+        }}
+
+        /* Buttons (for menu/settings if needed) */
+        QPushButton {{
+            background-color: {theme.SURFACE};
+            color: {theme.TEXT_PRIMARY};
+            border: 1px solid {theme.BORDER};
+            border-radius: 4px;
+            padding: 8px 16px;
+        }}
+
+        QPushButton:hover {{
+            background-color: {theme.SURFACE_HOVER};
+            border-color: {theme.BORDER_ACCENT};
+        }}
+
+        QPushButton:pressed {{
+            background-color: {theme.SURFACE_ELEVATED};
+        }}
+    """
 
 
 # Create a default instance
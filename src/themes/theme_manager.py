@@ -6,8 +6,9 @@ Handles loading, applying, and switching between themes.
 
 import logging
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
+from PyQt5.QtCore import QByteArray
 from PyQt5.QtGui import QFont, QFontDatabase
 from PyQt5.QtWidgets import QApplication
 
@@ -39,7 +40,12 @@ class ThemeManager:
         }
         self._current_theme_name: str = "robotechy_dark"
         self._current_theme: Theme = DEFAULT_THEME
-        self._fonts_loaded: bool = False
+        # Font file name -> application font id, plus the font bytes, which
+        # are kept alive for as long as Qt may read glyphs from them
+        self._loaded_font_ids: Dict[str, int] = {}
+        self._font_data: Dict[str, QByteArray] = {}
+        # Every font file already tried (loaded, missing or failed)
+        self._fonts_attempted: Set[str] = set()
 
     @property
     def current_theme(self) -> Theme:
@@ -94,41 +100,51 @@ class ThemeManager:
         Args:
             app: QApplication instance.
         """
-        # Load fonts first
-        if not self._fonts_loaded:
-            self._load_fonts()
+        # Load fonts first (files already registered are skipped)
+        self._load_fonts()
 
-        # Apply stylesheet
+        # Apply stylesheet and default font. Either call re-polishes every
+        # widget in the application, so skip them when nothing changed
+        # (e.g. switching between themes that render the same stylesheet).
         stylesheet = self._current_theme.to_stylesheet()
-        app.setStyleSheet(stylesheet)
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
 
-        # Set default font
         font = QFont("Roboto", 12)
         font.setStyleHint(QFont.SansSerif)
-        app.setFont(font)
+        if app.font() != font:
+            app.setFont(font)
 
         logger.info(f"Applied theme to application: {self._current_theme_name}")
 
     def _load_fonts(self) -> None:
-        """Load custom fonts for the application."""
+        """
+        Load custom fonts for the application.
+
+        Each font file is read once and registered from memory, so Qt does
+        not go back to disk for it. Each file is only tried once per
+        manager, so later theme applications skip the disk entirely.
+        """
         from ..core.constants import FONTS_DIR
 
-        # Try to load Roboto font if available
-        roboto_path = FONTS_DIR / "Roboto-Regular.ttf"
+        # Try to load Roboto, and its bold variant, if available
+        for file_name in ("Roboto-Regular.ttf", "Roboto-Bold.ttf"):
+            if file_name in self._fonts_attempted:
+                continue
+            self._fonts_attempted.add(file_name)
 
-        if roboto_path.exists():
-            font_id = QFontDatabase.addApplicationFont(str(roboto_path))
+            font_path = FONTS_DIR / file_name
+            if not font_path.exists():
+                continue
+
+            data = QByteArray(font_path.read_bytes())
+            font_id = QFontDatabase.addApplicationFontFromData(data)
             if font_id >= 0:
-                logger.info("Loaded font: Roboto")
+                self._font_data[file_name] = data
+                self._loaded_font_ids[file_name] = font_id
+                logger.info(f"Loaded font: {file_name}")
             else:
-                logger.warning(f"Failed to load font: {roboto_path}")
-
-        # Also try bold variant
-        roboto_bold_path = FONTS_DIR / "Roboto-Bold.ttf"
-        if roboto_bold_path.exists():
-            QFontDatabase.addApplicationFont(str(roboto_bold_path))
-
-        self._fonts_loaded = True
+                logger.warning(f"Failed to load font: {font_path}")
 
     def get_available_themes(self) -> list:
         """
@@ -1,5 +1,15 @@
 """Utility modules for RoboDash."""
 
-from .engine_sound import EngineSoundSynthesizer, create_engine_sound  # noqa: F401
 from .smoothing import ExponentialMovingAverage, ValueSmoother  # noqa: F401
 from .unit_converter import UnitConverter  # noqa: F401
+
+# Engine sound pulls in pygame; only import it when one of its names is used
+_ENGINE_SOUND_NAMES = ("EngineSoundSynthesizer", "create_engine_sound")
+
+
+def __getattr__(name):
+    if name in _ENGINE_SOUND_NAMES:
+        from . import engine_sound
+
+        return getattr(engine_sound, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,6 +10,7 @@ the characteristic inline-6 exhaust note.
 
 import logging
 import threading
+import time
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,16 @@ logger = logging.getLogger(__name__)
 # Audio parameters
 SAMPLE_RATE = 44100
 BUFFER_SIZE = 2048
+BUFFER_SECONDS = BUFFER_SIZE / SAMPLE_RATE
+RING_SIZE = 4  # Reusable Sound buffers cycled by the audio loop
+NOISE_BUFFERS = 43  # ~2 s of pre-generated white noise, cycled per buffer
+POP_CHANCE = 0.002  # Chance of an exhaust pop per buffer on decel
+
+# Peak of the raw (pre-gain) engine mix, measured over many buffers at
+# redline; the output gain maps it to 0.9 so redline plays at the old
+# normalized level and lower RPMs fall off with the RPM volume ramp
+MIX_PEAK = 2.0
+OUTPUT_PEAK = 0.9
 
 # Try to import pygame and numpy
 try:
@@ -45,6 +56,20 @@ class EngineSoundSynthesizer:
     IDLE_RPM = 850
     REDLINE_RPM = 7200
 
+    # Harmonic multiples of the firing frequency and their amplitudes
+    # (tuned for meaty 2JZ-GTE turbo sound - more bass, deeper exhaust note)
+    HARMONIC_MULTS = (
+        0.25,  # Deep sub-bass
+        0.5,  # Sub-harmonic for low-end rumble
+        1.0,  # Fundamental
+        1.5,  # Between fundamental and 2nd
+        2.0,  # 2nd harmonic
+        3.0,  # 3rd harmonic
+        4.0,  # 4th harmonic
+        6.0,  # Higher overtone
+    )
+    HARMONIC_AMPS = (0.5, 0.7, 1.0, 0.4, 0.5, 0.25, 0.15, 0.1)
+
     def __init__(self, volume: float = 0.5):
         """
         Initialize the engine sound synthesizer.
@@ -55,16 +80,50 @@ class EngineSoundSynthesizer:
         self._enabled = False
         self._running = False
         self._rpm = self.IDLE_RPM
+        # Target RPM and volume are single floats written by the UI thread
+        # and read by the audio thread; a float attribute store or load is
+        # atomic under the GIL, so they need no lock.
         self._target_rpm = self.IDLE_RPM
         self._volume = max(0.0, min(1.0, volume))
-        self._phase = 0.0
-        self._lock = threading.Lock()
         self._channel: Optional["pygame.mixer.Channel"] = None
 
         if not AUDIO_AVAILABLE:
             logger.warning("Audio not available - sound synthesis disabled")
             return
 
+        # Harmonic tables as arrays, so a buffer's harmonics are one
+        # (harmonics, samples) phase matrix collapsed by a matrix-vector
+        # product. The 0.8 saturation gain is folded into the amplitudes.
+        self._harmonic_mults = np.array(self.HARMONIC_MULTS, dtype=np.float32)
+        self._harmonic_amps = np.array(self.HARMONIC_AMPS, dtype=np.float32) * 0.8
+        self._phase_matrix = np.empty(
+            (len(self.HARMONIC_MULTS), BUFFER_SIZE), dtype=np.float32
+        )
+        self._sample_index = np.arange(BUFFER_SIZE, dtype=np.float32)
+        self._scratch = np.empty(BUFFER_SIZE, dtype=np.float32)
+        self._samples = np.empty(BUFFER_SIZE, dtype=np.float32)
+
+        # Fixed output gain instead of a per-buffer peak scan, calibrated
+        # so redline peaks at OUTPUT_PEAK; rare overshoots are clipped
+        self._norm_target = OUTPUT_PEAK / MIX_PEAK
+
+        # Noise is drawn once and cycled; a ~2 s loop of white noise is
+        # inaudible as a repeat under the engine note. The table is a whole
+        # number of buffers long so windows never wrap.
+        self._rng = np.random.default_rng()
+        self._noise = self._rng.uniform(-1.0, 1.0, BUFFER_SIZE * NOISE_BUFFERS).astype(
+            np.float32
+        )
+        self._noise_idx = 0
+
+        # Exhaust pops are a fixed decaying click, scheduled as a Poisson
+        # process over decel time rather than rolled for every buffer
+        self._pop_template = (
+            np.exp(-np.arange(BUFFER_SIZE, dtype=np.float32) / 100) * 0.3
+        )
+        self._schedule_pop()
+        self._reset_phases()
+
         try:
             # Initialize pygame mixer
             pygame.mixer.pre_init(
@@ -74,6 +133,9 @@ class EngineSoundSynthesizer:
                 buffer=BUFFER_SIZE,
             )
             pygame.mixer.init()
+            self._upshift_samples = _render_upshift()
+            self._downshift_samples = _render_downshift()
+            self._build_gear_sounds()
             self._enabled = True
             logger.info("Engine sound synthesizer initialized")
         except Exception as e:
@@ -86,7 +148,17 @@ class EngineSoundSynthesizer:
             return
 
         self._running = True
-        self._phase = 0.0
+        self._reset_phases()
+
+        # Ring of Sounds with int16 views onto their sample data: the audio
+        # loop renders into a free slot in place and queues it, so no Sound
+        # is allocated per buffer
+        self._sounds = [
+            pygame.sndarray.make_sound(np.zeros(BUFFER_SIZE, dtype=np.int16))
+            for _ in range(RING_SIZE)
+        ]
+        self._ring = [pygame.sndarray.samples(sound) for sound in self._sounds]
+        self._channel = pygame.mixer.find_channel(True)
 
         # Start the sound generation thread
         self._audio_thread = threading.Thread(target=self._audio_loop, daemon=True)
@@ -107,8 +179,7 @@ class EngineSoundSynthesizer:
         Args:
             rpm: Current engine RPM
         """
-        with self._lock:
-            self._target_rpm = max(self.IDLE_RPM, min(self.REDLINE_RPM, rpm))
+        self._target_rpm = max(self.IDLE_RPM, min(self.REDLINE_RPM, rpm))
 
     def set_volume(self, volume: float) -> None:
         """
@@ -118,6 +189,18 @@ class EngineSoundSynthesizer:
             volume: Volume level (0.0 to 1.0)
         """
         self._volume = max(0.0, min(1.0, volume))
+        if self._enabled:
+            self._build_gear_sounds()
+
+    def _build_gear_sounds(self) -> None:
+        """Bake the cached gear change waveforms into Sounds at the volume."""
+        scale = 32767 * self._volume
+        self._upshift_sound = pygame.sndarray.make_sound(
+            (self._upshift_samples * scale).astype(np.int16)
+        )
+        self._downshift_sound = pygame.sndarray.make_sound(
+            (self._downshift_samples * scale).astype(np.int16)
+        )
 
     def play_gear_change(self, upshift: bool = True) -> None:
         """
@@ -130,63 +213,47 @@ class EngineSoundSynthesizer:
             return
 
         try:
-            # Generate gear change sound
-            duration = 0.15 if upshift else 0.2
-            num_samples = int(SAMPLE_RATE * duration)
-            t = np.arange(num_samples) / SAMPLE_RATE
-
+            # Pre-rendered at init/set_volume, so this is just a play call
             if upshift:
-                # Upshift: quick "clunk" + brief silence (gear cut)
-                # Mechanical clunk sound
-                clunk_freq = 150
-                clunk = np.sin(2 * np.pi * clunk_freq * t) * np.exp(-t * 30)
-
-                # Add metallic character
-                metal = np.sin(2 * np.pi * 800 * t) * np.exp(-t * 50) * 0.3
-                metal += np.sin(2 * np.pi * 1200 * t) * np.exp(-t * 60) * 0.2
-
-                samples = clunk + metal
+                self._upshift_sound.play()
             else:
-                # Downshift: blip/rev sound
-                freq_start = 200
-                freq_end = 350
-                freq = freq_start + (freq_end - freq_start) * t / duration
-                blip = np.sin(2 * np.pi * freq * t) * np.exp(-t * 15)
-
-                samples = blip * 0.8
-
-            # Normalize
-            max_val = np.max(np.abs(samples))
-            if max_val > 0:
-                samples = samples / max_val * 0.7
-
-            # Convert and play
-            sound_array = (samples * 32767 * self._volume).astype(np.int16)
-            sound = pygame.sndarray.make_sound(sound_array)
-            sound.play()
-
+                self._downshift_sound.play()
         except Exception as e:
             logger.error(f"Failed to play gear change sound: {e}")
 
+    def _reset_phases(self) -> None:
+        """Reset the oscillator phases (radians) carried between buffers."""
+        self._harmonic_phase = np.zeros(len(self.HARMONIC_MULTS))
+        self._cam_phase = 0.0
+        self._turbo_phase = 0.0
+
     def _audio_loop(self) -> None:
         """Main audio generation loop (runs in thread)."""
         if not AUDIO_AVAILABLE:
             return
 
+        channel = self._channel
+        buffer_index = 0
+
         while self._running:
             try:
-                # Generate audio buffer
+                # Render the next buffer into a ring slot that is neither
+                # playing nor queued
                 samples = self._generate_samples(BUFFER_SIZE)
-
-                # Convert to pygame Sound
-                sound_array = (samples * 32767 * self._volume).astype(np.int16)
-                sound = pygame.sndarray.make_sound(sound_array)
-
-                # Play and wait for completion
-                channel = sound.play()
-                if channel:
-                    while channel.get_busy() and self._running:
-                        pygame.time.wait(5)
+                slot = buffer_index % RING_SIZE
+                np.multiply(
+                    samples,
+                    32767 * self._volume,
+                    out=self._ring[slot],
+                    casting="unsafe",
+                )
+
+                # A channel holds one queued Sound; wait until the previous
+                # one starts playing, then queue this one for gap-free output
+                while channel.get_queue() is not None and self._running:
+                    time.sleep(BUFFER_SECONDS * 0.25)
+                channel.queue(self._sounds[slot])
+                buffer_index += 1
 
             except Exception as e:
                 logger.error(f"Audio generation error: {e}")
@@ -205,14 +272,15 @@ class EngineSoundSynthesizer:
             num_samples: Number of samples to generate
 
         Returns:
-            numpy array of audio samples (-1.0 to 1.0)
+            float32 numpy array of audio samples (-1.0 to 1.0, peaking
+            near 0.9 at redline and about 0.45 at idle). The array
+            is reused, so it is only valid until the next call.
         """
         if not AUDIO_AVAILABLE:
             return np.zeros(num_samples)
 
         # Smooth RPM transition
-        with self._lock:
-            target = self._target_rpm
+        target = self._target_rpm
 
         # Interpolate RPM for smooth sound changes
         rpm_smoothing = 0.1
@@ -223,76 +291,116 @@ class EngineSoundSynthesizer:
         # Frequency = (RPM / 60) * 3
         base_freq = (self._rpm / 60.0) * (self.CYLINDERS / 2)
 
-        # Time array for this buffer
-        t = np.arange(num_samples) / SAMPLE_RATE
-
-        # Advance phase to maintain continuity between buffers
-        t = t + self._phase
-
-        # Generate harmonics
-        samples = np.zeros(num_samples, dtype=np.float32)
-
-        # Harmonic amplitudes (tuned for meaty 2JZ-GTE turbo sound)
-        # More bass, deeper exhaust note
-        harmonics = [
-            (0.25, 0.5),  # Deep sub-bass
-            (0.5, 0.7),  # Sub-harmonic for low-end rumble
-            (1.0, 1.0),  # Fundamental
-            (1.5, 0.4),  # Between fundamental and 2nd
-            (2.0, 0.5),  # 2nd harmonic
-            (3.0, 0.25),  # 3rd harmonic
-            (4.0, 0.15),  # 4th harmonic
-            (6.0, 0.1),  # Higher overtone
-        ]
-
-        for harmonic_mult, amplitude in harmonics:
-            freq = base_freq * harmonic_mult
-            # Use slightly distorted sine for more aggressive sound
-            wave = np.sin(2 * np.pi * freq * t)
-            # Soft clipping for some distortion/saturation
-            wave = np.tanh(wave * 1.5) * 0.8
-            samples += amplitude * wave
+        # Sample offsets within this buffer. Each oscillator keeps its phase
+        # in radians (mod 2*pi) across buffers, so waves stay continuous at
+        # buffer boundaries even as the frequency changes.
+        # Everything below is float32 in preallocated buffers; other buffer
+        # sizes (tests only) get fresh ones.
+        n = self._sample_index
+        tmp = self._scratch
+        samples = self._samples
+        phase = self._phase_matrix
+        if num_samples != BUFFER_SIZE:
+            n = np.arange(num_samples, dtype=np.float32)
+            tmp = np.empty(num_samples, dtype=np.float32)
+            samples = np.empty(num_samples, dtype=np.float32)
+            phase = np.empty((len(self.HARMONIC_MULTS), num_samples), np.float32)
+        rad_per_hz = 2 * np.pi / SAMPLE_RATE
+
+        # Generate all harmonics at once: phase matrix of harmonic x sample
+        step = self._harmonic_mults * (base_freq * rad_per_hz)
+        np.multiply.outer(step, n, out=phase)
+        phase += self._harmonic_phase[:, None]
+        self._harmonic_phase = (self._harmonic_phase + step * num_samples) % (2 * np.pi)
+        # Slightly distorted sine for more aggressive sound, soft clipped
+        # for some saturation
+        np.sin(phase, out=phase)
+        phase *= 1.5
+        np.tanh(phase, out=phase)
+        np.dot(self._harmonic_amps, phase, out=samples)
 
         # Add some "growl" - amplitude modulation at cam frequency
         cam_freq = self._rpm / 120.0  # Camshaft frequency
         am_depth = 0.2 + (self._rpm - self.IDLE_RPM) / self.REDLINE_RPM * 0.15
-        am = 1.0 - am_depth * (np.sin(2 * np.pi * cam_freq * t) ** 2)
-        samples *= am
+        cam_step = cam_freq * rad_per_hz
+        np.multiply(n, cam_step, out=tmp)
+        tmp += self._cam_phase
+        np.sin(tmp, out=tmp)
+        np.square(tmp, out=tmp)
+        tmp *= -am_depth
+        tmp += 1.0
+        samples *= tmp
+        self._cam_phase = (self._cam_phase + cam_step * num_samples) % (2 * np.pi)
 
         # Add turbo whoosh at higher RPM
         rpm_factor = max(
             0, (self._rpm - self.IDLE_RPM) / (self.REDLINE_RPM - self.IDLE_RPM)
         )
-        if rpm_factor > 0.3:
-            turbo_freq = 80 + rpm_factor * 120  # Turbo whine
-            turbo_wave = np.sin(2 * np.pi * turbo_freq * t) * 0.15 * (rpm_factor - 0.3)
-            samples += turbo_wave
+        # Turbo whine fades in above 30% of the rev range. The gain is
+        # continuous; the sine is only evaluated while it is audible.
+        turbo_gain = 0.15 * max(0.0, rpm_factor - 0.3)
+        turbo_freq = 80 + rpm_factor * 120
+        turbo_step = turbo_freq * rad_per_hz
+        if turbo_gain > 0.0:
+            np.multiply(n, turbo_step, out=tmp)
+            tmp += self._turbo_phase
+            np.sin(tmp, out=tmp)
+            tmp *= turbo_gain
+            samples += tmp
+        self._turbo_phase = (self._turbo_phase + turbo_step * num_samples) % (2 * np.pi)
 
         # Add some noise/crackle - more at higher RPM
         noise_level = 0.03 + rpm_factor * 0.12
-        samples += np.random.uniform(-noise_level, noise_level, num_samples)
+        np.multiply(self._next_noise(num_samples), noise_level, out=tmp)
+        samples += tmp
 
         # Exhaust pops at lower RPM (decel)
         if rpm_factor < 0.3:
-            pop_chance = 0.002
-            if np.random.random() < pop_chance:
-                pop = np.exp(-np.arange(num_samples) / 100) * 0.3
-                samples += pop * np.random.choice([-1, 1])
-
-        # Volume increases with RPM (like real engine)
+            self._pop_countdown -= num_samples
+            if self._pop_countdown <= 0:
+                pop = self._pop_template[:num_samples]
+                if self._pop_sign > 0:
+                    samples[: len(pop)] += pop
+                else:
+                    samples[: len(pop)] -= pop
+                self._schedule_pop()
+
+        # Volume increases with RPM (like real engine), folded into the
+        # static normalization
         rpm_volume = 0.6 + rpm_factor * 0.4
-        samples *= rpm_volume
-
-        # Normalize
-        max_val = np.max(np.abs(samples))
-        if max_val > 0:
-            samples = samples / max_val * 0.9
+        samples *= self._norm_target * rpm_volume
 
-        # Update phase for continuity
-        self._phase = (self._phase + num_samples / SAMPLE_RATE) % 1.0
+        # Keep the int16 conversion in range (an unsafe cast would wrap)
+        np.clip(samples, -1.0, 1.0, out=samples)
 
         return samples
 
+    def _schedule_pop(self) -> None:
+        """Draw the decel time (in samples) until the next exhaust pop."""
+        mean_interval = BUFFER_SIZE / POP_CHANCE
+        self._pop_countdown = int(self._rng.exponential(mean_interval))
+        self._pop_sign = 1 if self._rng.random() < 0.5 else -1
+
+    def _next_noise(self, num_samples: int) -> "np.ndarray":
+        """
+        Return the next window of the pre-generated white-noise table.
+
+        Args:
+            num_samples: Window length
+
+        Returns:
+            numpy array of noise in [-1.0, 1.0)
+        """
+        start = self._noise_idx
+        end = start + num_samples
+        size = len(self._noise)
+        if end <= size:
+            chunk = self._noise[start:end]
+        else:
+            chunk = np.take(self._noise, np.arange(start, end) % size)
+        self._noise_idx = end % size
+        return chunk
+
     @property
     def is_enabled(self) -> bool:
         """Check if audio is available and initialized."""
@@ -304,6 +412,53 @@ class EngineSoundSynthesizer:
         return self._running
 
 
+def _normalize_effect(samples: "np.ndarray") -> "np.ndarray":
+    """Scale a gear change effect to a 0.7 peak as float32."""
+    max_val = np.max(np.abs(samples))
+    if max_val > 0:
+        samples = samples / max_val * 0.7
+    return samples.astype(np.float32)
+
+
+def _render_upshift() -> "np.ndarray":
+    """
+    Render the upshift effect: a quick "clunk" for the gear cut.
+
+    Returns:
+        numpy array of float32 samples peaking at 0.7
+    """
+    duration = 0.15
+    t = np.arange(int(SAMPLE_RATE * duration)) / SAMPLE_RATE
+
+    # Mechanical clunk sound
+    clunk_freq = 150
+    clunk = np.sin(2 * np.pi * clunk_freq * t) * np.exp(-t * 30)
+
+    # Add metallic character
+    metal = np.sin(2 * np.pi * 800 * t) * np.exp(-t * 50) * 0.3
+    metal += np.sin(2 * np.pi * 1200 * t) * np.exp(-t * 60) * 0.2
+
+    return _normalize_effect(clunk + metal)
+
+
+def _render_downshift() -> "np.ndarray":
+    """
+    Render the downshift effect: a rising throttle blip.
+
+    Returns:
+        numpy array of float32 samples peaking at 0.7
+    """
+    duration = 0.2
+    t = np.arange(int(SAMPLE_RATE * duration)) / SAMPLE_RATE
+
+    freq_start = 200
+    freq_end = 350
+    freq = freq_start + (freq_end - freq_start) * t / duration
+    blip = np.sin(2 * np.pi * freq * t) * np.exp(-t * 15)
+
+    return _normalize_effect(blip * 0.8)
+
+
 def create_engine_sound(volume: float = 0.5) -> Optional[EngineSoundSynthesizer]:
     """
     Factory function to create engine sound synthesizer.
@@ -7,14 +7,51 @@ gauge displays without introducing noticeable lag.
 Available smoothers:
 - ExponentialMovingAverage: Simple EMA with configurable alpha
 - ValueSmoother: Multi-channel smoother for VehicleState
+
+If numba is installed, the multi-channel EMA kernel is JIT-compiled
+(and cached to disk so only the first boot pays the compile); otherwise
+an equivalent vectorized NumPy update is used.
 """
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+import numpy as np
 
 if TYPE_CHECKING:
     from ..data.models import VehicleState
 
+# Numba is optional - it JIT-compiles the per-frame EMA kernel
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# VehicleState fields smoothed by ValueSmoother.smooth_state, in buffer order.
+# Discrete values (gear, flags) and targets are passed through unsmoothed.
+SMOOTHED_CHANNELS = (
+    "rpm",
+    "speed",
+    "boost_pressure",
+    "map_kpa",
+    "oil_pressure",
+    "fuel_pressure",
+    "coolant_temp",
+    "oil_temp",
+    "intake_temp",
+    "egt1",
+    "egt2",
+    "afr",
+    "lambda_value",
+    "tps",
+    "injector_duty",
+    "ignition_angle",
+    "battery_voltage",
+    "fuel_level",
+)
+
 
 class ExponentialMovingAverage:
     """
@@ -47,8 +84,11 @@ class ExponentialMovingAverage:
             raise ValueError("alpha must be between 0 (exclusive) and 1 (inclusive)")
 
         self._alpha = alpha
+        self._one_minus = 1.0 - alpha
         self._value = initial_value
-        self._initialized = initial_value is not None
+        self._initialized = False
+        if initial_value is not None:
+            self._seeded()
 
     @property
     def value(self) -> Optional[float]:
@@ -66,26 +106,37 @@ class ExponentialMovingAverage:
         if not 0.0 < value <= 1.0:
             raise ValueError("alpha must be between 0 (exclusive) and 1 (inclusive)")
         self._alpha = value
+        self._one_minus = 1.0 - value
 
     def update(self, value: float) -> float:
         """
         Update filter with new input value.
 
+        The first input seeds the filter, after which the instance switches
+        to the branch-free _update_fast path.
+
         Args:
             value: New input value.
 
         Returns:
             Smoothed output value.
         """
-        if not self._initialized:
-            self._value = value
-            self._initialized = True
-        else:
-            assert self._value is not None  # Guaranteed since _initialized is True
-            self._value = self._alpha * value + (1 - self._alpha) * self._value
-
-        assert self._value is not None  # Type narrowing for return
-        return self._value
+        self._value = value
+        self._seeded()
+        return value
+
+    def _update_fast(self, value: float) -> float:
+        """Blend a value into an already seeded filter."""
+        previous = self._value
+        assert previous is not None  # Only bound once seeded
+        smoothed = self._alpha * value + self._one_minus * previous
+        self._value = smoothed
+        return smoothed
+
+    def _seeded(self) -> None:
+        """Mark the filter seeded and bind update to the fast path."""
+        self._initialized = True
+        self.update = self._update_fast  # type: ignore[method-assign]
 
     def reset(self, value: Optional[float] = None) -> None:
         """
@@ -95,15 +146,114 @@ class ExponentialMovingAverage:
             value: Optional new initial value.
         """
         self._value = value
-        self._initialized = value is not None
+        if value is not None:
+            self._seeded()
+        else:
+            self._initialized = False
+            self.__dict__.pop("update", None)
+
+
+def _ema_kernel(
+    values: "np.ndarray",
+    raw: "np.ndarray",
+    alphas: "np.ndarray",
+    enabled: "np.ndarray",
+    primed: "np.ndarray",
+    out: "np.ndarray",
+) -> None:
+    """
+    Advance every channel's EMA by one sample, in place.
+
+    Disabled channels pass the raw value through untouched; a channel's
+    first sample seeds its filter.
+
+    Args:
+        values: Filter state per channel (updated).
+        raw: New raw input per channel.
+        alphas: Smoothing factor per channel.
+        enabled: Whether smoothing is enabled per channel.
+        primed: Whether each filter has been seeded (updated).
+        out: Output buffer for smoothed values.
+    """
+    for i in range(raw.shape[0]):
+        value = raw[i]
+        if not enabled[i]:
+            out[i] = value
+        elif not primed[i]:
+            values[i] = value
+            primed[i] = True
+            out[i] = value
+        else:
+            alpha = alphas[i]
+            values[i] = alpha * value + (1.0 - alpha) * values[i]
+            out[i] = values[i]
+
+
+def _ema_vectorized(
+    values: "np.ndarray",
+    raw: "np.ndarray",
+    alphas: "np.ndarray",
+    enabled: "np.ndarray",
+    primed: "np.ndarray",
+    out: "np.ndarray",
+) -> None:
+    """
+    NumPy equivalent of _ema_kernel, updating all channels at once.
 
+    Without numba, a handful of whole-array operations is about three
+    times faster than looping over the channels in Python.
+    """
+    blended = alphas * raw
+    blended += (1.0 - alphas) * values
+    np.copyto(values, blended, where=enabled & primed)
+    np.copyto(values, raw, where=enabled & ~primed)
+    primed |= enabled
+    np.copyto(out, raw)
+    np.copyto(out, values, where=enabled)
 
-@dataclass
-class SmootherConfig:
-    """Configuration for a single value smoother."""
 
-    alpha: float = 0.3
-    enabled: bool = True
+if NUMBA_AVAILABLE:
+    _ema_kernel = njit(cache=True, fastmath=True)(_ema_kernel)
+else:
+    _ema_kernel = _ema_vectorized
+
+
+def _passthrough(value: float) -> float:
+    """Channel update for a channel with smoothing disabled."""
+    return value
+
+
+def _ema_channel(
+    values: "np.ndarray", primed: "np.ndarray", index: int, alpha: float
+) -> Callable[[float], float]:
+    """
+    Build the update function for one smoothed channel.
+
+    The closure binds the state arrays, slot index, alpha and 1 - alpha,
+    so an update is a single call with no per-call lookups. State stays
+    in the shared arrays, so smooth_state(), get() and reset() see it.
+
+    Args:
+        values: Per-channel smoothed values.
+        primed: Per-channel seeded flags.
+        index: The channel's slot in the arrays.
+        alpha: Smoothing factor.
+
+    Returns:
+        Function taking a raw value and returning the smoothed value.
+    """
+    one_minus = 1.0 - alpha
+
+    def update(value: float) -> float:
+        if primed[index]:
+            value = alpha * value + one_minus * values.item(index)
+        else:
+            # First sample seeds the filter
+            primed[index] = True
+        values[index] = value
+        return value
+
+    return update
 
 
 @dataclass
@@ -111,8 +261,10 @@ class ValueSmoother:
     """
     Multi-channel value smoother for vehicle telemetry.
 
-    Maintains separate EMA filters for each telemetry channel,
-    allowing different smoothing levels per value type.
+    Maintains a separate EMA filter for each telemetry channel,
+    allowing different smoothing levels per value type. Filter state
+    lives in flat arrays indexed by channel so that smooth_state()
+    updates every channel in a single kernel call.
 
     Usage:
         smoother = ValueSmoother()
@@ -147,8 +299,37 @@ class ValueSmoother:
 
     def __post_init__(self):
         """Initialize internal state."""
-        self._filters: Dict[str, ExponentialMovingAverage] = {}
-        self._configs: Dict[str, SmootherConfig] = {}
+        self._index: Dict[str, int] = {}
+        # Per-channel update functions, built on first update()
+        self._dispatch: Dict[str, Callable[[float], float]] = {}
+
+        # Per-channel filter state (parallel arrays, indexed by channel)
+        self._values = np.zeros(0, dtype=np.float64)
+        self._alphas = np.zeros(0, dtype=np.float64)
+        self._enabled = np.zeros(0, dtype=np.bool_)
+        self._primed = np.zeros(0, dtype=np.bool_)
+
+        for channel in SMOOTHED_CHANNELS:
+            self.configure(channel)
+
+        # Preallocated smooth_state() buffers (SMOOTHED_CHANNELS come first)
+        count = len(SMOOTHED_CHANNELS)
+        self._raw = np.zeros(count, dtype=np.float64)
+        self._out = np.zeros(count, dtype=np.float64)
+
+    def _channel_index(self, channel: str) -> int:
+        """Get the array index for a channel, allocating a slot if new."""
+        index = self._index.get(channel)
+        if index is None:
+            index = len(self._index)
+            self._index[channel] = index
+            self._values = np.append(self._values, 0.0)
+            self._alphas = np.append(self._alphas, 0.3)
+            self._enabled = np.append(self._enabled, True)
+            self._primed = np.append(self._primed, False)
+            # The state arrays were replaced, so rebind every channel
+            self._dispatch.clear()
+        return index
 
     def configure(
         self, channel: str, alpha: Optional[float] = None, enabled: bool = True
@@ -164,11 +345,28 @@ class ValueSmoother:
         if alpha is None:
             alpha = self.DEFAULT_ALPHAS.get(channel, 0.3)
 
-        self._configs[channel] = SmootherConfig(alpha=alpha, enabled=enabled)
+        index = self._channel_index(channel)
+        self._alphas[index] = alpha
+        self._enabled[index] = enabled
+        self._dispatch.pop(channel, None)
+
+    def _install(self, channel: str) -> Callable[[float], float]:
+        """Build and cache the update function for a channel."""
+        index = self._index.get(channel)
 
-        # Update existing filter if present
-        if channel in self._filters:
-            self._filters[channel].alpha = alpha
+        # If not configured, use defaults
+        if index is None:
+            self.configure(channel)
+            index = self._index[channel]
+
+        if self._enabled[index]:
+            fn = _ema_channel(
+                self._values, self._primed, index, float(self._alphas[index])
+            )
+        else:
+            fn = _passthrough
+        self._dispatch[channel] = fn
+        return fn
 
     def update(self, channel: str, value: float) -> float:
         """
@@ -181,25 +379,8 @@ class ValueSmoother:
         Returns:
             Smoothed value (or raw if smoothing disabled).
         """
-        config = self._configs.get(channel)
-
-        # If not configured, use defaults
-        if config is None:
-            self.configure(channel)
-            config = self._configs[channel]
-
-        # Return raw if disabled
-        if not config.enabled:
-            return value
-
-        # Get or create filter
-        if channel not in self._filters:
-            self._filters[channel] = ExponentialMovingAverage(
-                alpha=config.alpha, initial_value=value
-            )
-            return value
-
-        return self._filters[channel].update(value)
+        fn = self._dispatch.get(channel) or self._install(channel)
+        return fn(value)
 
     def get(self, channel: str) -> Optional[float]:
         """
@@ -211,8 +392,9 @@ class ValueSmoother:
         Returns:
             Current smoothed value, or None if not initialized.
         """
-        if channel in self._filters:
-            return self._filters[channel].value
+        index = self._index.get(channel)
+        if index is not None and self._primed[index]:
+            return float(self._values[index])
         return None
 
     def reset(self, channel: Optional[str] = None) -> None:
@@ -223,9 +405,9 @@ class ValueSmoother:
             channel: Channel to reset. If None, resets all channels.
         """
         if channel is None:
-            self._filters.clear()
-        elif channel in self._filters:
-            del self._filters[channel]
+            self._primed[:] = False
+        elif channel in self._index:
+            self._primed[self._index[channel]] = False
 
     def smooth_state(self, state: "VehicleState") -> "VehicleState":
         """
@@ -239,28 +421,61 @@ class ValueSmoother:
         """
         from ..data.models import VehicleState
 
+        raw = self._raw
+        raw[0] = state.rpm
+        raw[1] = state.speed
+        raw[2] = state.boost_pressure
+        raw[3] = state.map_kpa
+        raw[4] = state.oil_pressure
+        raw[5] = state.fuel_pressure
+        raw[6] = state.coolant_temp
+        raw[7] = state.oil_temp
+        raw[8] = state.intake_temp
+        raw[9] = state.egt1
+        raw[10] = state.egt2
+        raw[11] = state.afr
+        raw[12] = state.lambda_value
+        raw[13] = state.tps
+        raw[14] = state.injector_duty
+        raw[15] = state.ignition_angle
+        raw[16] = state.battery_voltage
+        raw[17] = state.fuel_level
+
+        count = len(raw)
+        _ema_kernel(
+            self._values[:count],
+            raw,
+            self._alphas[:count],
+            self._enabled[:count],
+            self._primed[:count],
+            self._out,
+        )
+        out = self._out.tolist()
+
+        # Positional in VehicleState field order; keyword dispatch for 23
+        # fields costs about twice as much per frame
         return VehicleState(
-            rpm=int(self.update("rpm", state.rpm)),
-            speed=self.update("speed", state.speed),
-            gear=state.gear,  # Don't smooth discrete values
-            boost_pressure=self.update("boost_pressure", state.boost_pressure),
-            map_kpa=self.update("map_kpa", state.map_kpa),
-            oil_pressure=self.update("oil_pressure", state.oil_pressure),
-            fuel_pressure=self.update("fuel_pressure", state.fuel_pressure),
-            coolant_temp=self.update("coolant_temp", state.coolant_temp),
-            oil_temp=self.update("oil_temp", state.oil_temp),
-            intake_temp=self.update("intake_temp", state.intake_temp),
-            egt1=self.update("egt1", state.egt1),
-            egt2=self.update("egt2", state.egt2),
-            afr=self.update("afr", state.afr),
-            lambda_value=self.update("lambda_value", state.lambda_value),
-            lambda_target=state.lambda_target,  # Target doesn't need smoothing
-            tps=self.update("tps", state.tps),
-            injector_duty=self.update("injector_duty", state.injector_duty),
-            ignition_angle=self.update("ignition_angle", state.ignition_angle),
-            battery_voltage=self.update("battery_voltage", state.battery_voltage),
-            fuel_level=self.update("fuel_level", state.fuel_level),
-            flags=state.flags,
-            warnings=state.warnings,
-            timestamp=state.timestamp,
+            int(out[0]),  # rpm
+            out[1],  # speed
+            state.gear,  # Don't smooth discrete values
+            out[2],  # boost_pressure
+            out[3],  # map_kpa
+            out[4],  # oil_pressure
+            out[5],  # fuel_pressure
+            out[6],  # coolant_temp
+            out[7],  # oil_temp
+            out[8],  # intake_temp
+            out[9],  # egt1
+            out[10],  # egt2
+            out[11],  # afr
+            out[12],  # lambda_value
+            state.lambda_target,  # Target doesn't need smoothing
+            out[13],  # tps
+            out[14],  # injector_duty
+            out[15],  # ignition_angle
+            out[16],  # battery_voltage
+            out[17],  # fuel_level
+            state.flags,
+            state.warnings,
+            state.timestamp_ns,
         )
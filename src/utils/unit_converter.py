@@ -13,7 +13,15 @@ happens at the display layer based on user preferences.
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from ..core.constants import Units
+from ..core.constants import (
+    KMH_TO_MPH,
+    UNIT_PRESSURE_BAR,
+    UNIT_PRESSURE_KPA,
+    UNIT_PRESSURE_PSI,
+    UNIT_SPEED_MPH,
+    UNIT_TEMP_CELSIUS,
+    UNIT_TEMP_FAHRENHEIT,
+)
 
 if TYPE_CHECKING:
     from ..data.models import VehicleState
@@ -45,7 +53,7 @@ class UnitConverter:
     """
 
     # Conversion factors
-    KMH_TO_MPH = 0.621371
+    KMH_TO_MPH = KMH_TO_MPH
     MPH_TO_KMH = 1.60934
 
     BAR_TO_PSI = 14.5038
@@ -55,9 +63,9 @@ class UnitConverter:
 
     def __init__(
         self,
-        speed: str = Units.SPEED_MPH,
-        temperature: str = Units.TEMP_CELSIUS,
-        pressure: str = Units.PRESSURE_BAR,
+        speed: str = UNIT_SPEED_MPH,
+        temperature: str = UNIT_TEMP_CELSIUS,
+        pressure: str = UNIT_PRESSURE_BAR,
     ):
         """
         Initialize converter with unit preferences.
@@ -85,7 +93,7 @@ class UnitConverter:
         Returns:
             Speed in configured display unit.
         """
-        if self.speed_unit == Units.SPEED_MPH:
+        if self.speed_unit == UNIT_SPEED_MPH:
             return kmh * self.KMH_TO_MPH
         return kmh  # km/h
 
@@ -99,17 +107,17 @@ class UnitConverter:
         Returns:
             Speed in km/h.
         """
-        if self.speed_unit == Units.SPEED_MPH:
+        if self.speed_unit == UNIT_SPEED_MPH:
             return value * self.MPH_TO_KMH
         return value
 
     def get_speed_unit_label(self) -> str:
         """Get display label for speed unit."""
-        return "mph" if self.speed_unit == Units.SPEED_MPH else "km/h"
+        return "mph" if self.speed_unit == UNIT_SPEED_MPH else "km/h"
 
     def get_speed_max(self) -> float:
         """Get appropriate max speed for current unit."""
-        return 200.0 if self.speed_unit == Units.SPEED_MPH else 320.0
+        return 200.0 if self.speed_unit == UNIT_SPEED_MPH else 320.0
 
     # =========================================================================
     # Temperature Conversion
@@ -125,7 +133,7 @@ class UnitConverter:
         Returns:
             Temperature in configured display unit.
         """
-        if self.temp_unit == Units.TEMP_FAHRENHEIT:
+        if self.temp_unit == UNIT_TEMP_FAHRENHEIT:
             return (celsius * 9 / 5) + 32
         return celsius
 
@@ -139,13 +147,13 @@ class UnitConverter:
         Returns:
             Temperature in Celsius.
         """
-        if self.temp_unit == Units.TEMP_FAHRENHEIT:
+        if self.temp_unit == UNIT_TEMP_FAHRENHEIT:
             return (value - 32) * 5 / 9
         return value
 
     def get_temp_unit_label(self) -> str:
         """Get display label for temperature unit."""
-        return "°F" if self.temp_unit == Units.TEMP_FAHRENHEIT else "°C"
+        return "°F" if self.temp_unit == UNIT_TEMP_FAHRENHEIT else "°C"
 
     # =========================================================================
     # Pressure Conversion
@@ -161,9 +169,9 @@ class UnitConverter:
         Returns:
             Pressure in configured display unit.
         """
-        if self.pressure_unit == Units.PRESSURE_PSI:
+        if self.pressure_unit == UNIT_PRESSURE_PSI:
             return bar * self.BAR_TO_PSI
-        elif self.pressure_unit == Units.PRESSURE_KPA:
+        elif self.pressure_unit == UNIT_PRESSURE_KPA:
             return bar * self.BAR_TO_KPA
         return bar
 
@@ -177,17 +185,17 @@ class UnitConverter:
         Returns:
             Pressure in bar.
         """
-        if self.pressure_unit == Units.PRESSURE_PSI:
+        if self.pressure_unit == UNIT_PRESSURE_PSI:
             return value * self.PSI_TO_BAR
-        elif self.pressure_unit == Units.PRESSURE_KPA:
+        elif self.pressure_unit == UNIT_PRESSURE_KPA:
             return value * self.KPA_TO_BAR
         return value
 
     def get_pressure_unit_label(self) -> str:
         """Get display label for pressure unit."""
-        if self.pressure_unit == Units.PRESSURE_PSI:
+        if self.pressure_unit == UNIT_PRESSURE_PSI:
             return "psi"
-        elif self.pressure_unit == Units.PRESSURE_KPA:
+        elif self.pressure_unit == UNIT_PRESSURE_KPA:
             return "kPa"
         return "bar"
 
@@ -10,10 +10,10 @@ Provides:
 from typing import List, Optional, Tuple
 
 from PyQt5.QtCore import QRect, QRectF, Qt
-from PyQt5.QtGui import QBrush, QColor, QFont, QLinearGradient, QPainter
+from PyQt5.QtGui import QBrush, QColor, QLinearGradient, QPainter
 from PyQt5.QtWidgets import QWidget
 
-from .base_widget import BaseWidget, get_custom_font
+from .base_widget import BaseWidget, get_dashboard_font
 
 
 class BarGauge(BaseWidget):
@@ -127,7 +127,7 @@ class BarGauge(BaseWidget):
 
         # Draw label
         if self._show_label and self._label:
-            font = QFont(get_custom_font(), 10)
+            font = get_dashboard_font(10)
             painter.setFont(font)
             painter.setPen(QColor(self.theme.TEXT_SECONDARY))
 
@@ -138,8 +138,7 @@ class BarGauge(BaseWidget):
 
         # Draw value
         if self._show_value:
-            font = QFont(get_custom_font(), 12)
-            font.setBold(True)
+            font = get_dashboard_font(12, bold=True)
             painter.setFont(font)
             painter.setPen(self.get_value_color())
 
@@ -187,7 +186,7 @@ class BarGauge(BaseWidget):
 
         # Draw label
         if self._show_label and self._label:
-            font = QFont(get_custom_font(), 9)
+            font = get_dashboard_font(9)
             painter.setFont(font)
             painter.setPen(QColor(self.theme.TEXT_SECONDARY))
 
@@ -196,8 +195,7 @@ class BarGauge(BaseWidget):
 
         # Draw value
         if self._show_value:
-            font = QFont(get_custom_font(), 10)
-            font.setBold(True)
+            font = get_dashboard_font(10, bold=True)
             painter.setFont(font)
             painter.setPen(self.get_value_color())
 
@@ -325,8 +323,7 @@ class RPMBar(BarGauge):
 
         # Draw RPM markers in reserved space at bottom
         painter.setPen(QColor(self.theme.TEXT_SECONDARY))
-        font_name = get_custom_font()
-        font = QFont(font_name, 14)
+        font = get_dashboard_font(14)
         painter.setFont(font)
 
         # Position markers in the reserved space at bottom
@@ -369,11 +366,10 @@ class FuelBar(BaseWidget):
 
         padding = 10
         label_height = 20
-        font_name = get_custom_font()
 
         # Label at top left
         painter.setPen(QColor(self.theme.TEXT_SECONDARY))
-        font = QFont(font_name, 12)
+        font = get_dashboard_font(12)
         painter.setFont(font)
         painter.drawText(
             QRectF(padding, 2, 60, label_height),
@@ -413,8 +409,7 @@ class FuelBar(BaseWidget):
             painter.drawRoundedRect(fill_rect, 6, 6)
 
         # Draw percentage in center of bar - same size as other gauges
-        value_font = QFont(font_name, 36)
-        value_font.setBold(True)
+        value_font = get_dashboard_font(36, bold=True)
         painter.setFont(value_font)
         painter.setPen(QColor("#FFFFFF"))
 
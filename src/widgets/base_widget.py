@@ -8,23 +8,43 @@ Provides common functionality for:
 - Update optimization
 """
 
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from PyQt5.QtCore import Qt, pyqtProperty, pyqtSignal
-from PyQt5.QtGui import QColor
+from PyQt5.QtGui import QColor, QFont
 from PyQt5.QtWidgets import QApplication, QWidget
 
 from ..themes import get_current_theme
 
+# (point_size, bold) -> QFont, built on first use
+_font_cache: Dict[Tuple[int, bool], QFont] = {}
 
-def get_custom_font() -> str:
-    """Get the custom font name if available, otherwise Roboto."""
-    app = QApplication.instance()
-    if app:
-        custom_font = app.property("custom_font")
-        if custom_font:
-            return custom_font
-    return "Roboto"
+
+def get_dashboard_font(point_size: int, bold: bool = False) -> QFont:
+    """
+    Get a shared dashboard QFont at the given size.
+
+    Fonts are derived from the application's "dashboard_font" property
+    once per size and cached, so paint code never rebuilds them. Callers
+    must not modify the returned font.
+
+    Args:
+        point_size: Font size in points.
+        bold: Whether the font is bold.
+
+    Returns:
+        Cached QFont instance.
+    """
+    key = (point_size, bold)
+    font = _font_cache.get(key)
+    if font is None:
+        app = QApplication.instance()
+        base = app.property("dashboard_font") if app else None
+        font = QFont(base) if isinstance(base, QFont) else QFont("Roboto")
+        font.setPointSize(point_size)
+        font.setBold(bold)
+        _font_cache[key] = font
+    return font
 
 
 class BaseWidget(QWidget):
@@ -72,6 +92,9 @@ class BaseWidget(QWidget):
         # Cache theme reference
         self._theme = get_current_theme()
 
+        # Value -> hex color, rebuilt when thresholds or theme change
+        self._color_fn = self._theme.make_threshold_color_fn()
+
     # =========================================================================
     # Value Property
     # =========================================================================
@@ -161,8 +184,17 @@ class BaseWidget(QWidget):
         self._warning_threshold = warning
         self._critical_threshold = critical
         self._warning_low_threshold = warning_low
+        self._rebuild_color_fn()
         self.update()
 
+    def _rebuild_color_fn(self) -> None:
+        """Rebuild the value color function from thresholds and theme."""
+        self._color_fn = self._theme.make_threshold_color_fn(
+            self._warning_threshold,
+            self._critical_threshold,
+            self._warning_low_threshold,
+        )
+
     # =========================================================================
     # Value State
     # =========================================================================
@@ -197,14 +229,7 @@ class BaseWidget(QWidget):
         Returns:
             QColor for the current state.
         """
-        state = self.get_value_state()
-
-        if state == "critical":
-            return QColor(self._theme.CRITICAL)
-        elif state == "warning":
-            return QColor(self._theme.WARNING)
-        else:
-            return QColor(self._theme.NORMAL)
+        return QColor(self._color_fn(self._value))
 
     def get_value_color_hex(self) -> str:
         """
@@ -213,14 +238,7 @@ class BaseWidget(QWidget):
         Returns:
             Hex color string (e.g., "#9EFF11").
         """
-        state = self.get_value_state()
-
-        if state == "critical":
-            return self._theme.CRITICAL
-        elif state == "warning":
-            return self._theme.WARNING
-        else:
-            return self._theme.NORMAL
+        return self._color_fn(self._value)
 
     # =========================================================================
     # Display Formatting
@@ -288,4 +306,5 @@ class BaseWidget(QWidget):
     def refresh_theme(self) -> None:
         """Refresh theme reference and repaint."""
         self._theme = get_current_theme()
+        self._rebuild_color_fn()
         self.update()
@@ -10,10 +10,10 @@ Provides clean, high-visibility numeric displays for:
 from typing import Optional
 
 from PyQt5.QtCore import QRect, Qt
-from PyQt5.QtGui import QColor, QFont, QPainter
+from PyQt5.QtGui import QColor, QPainter
 from PyQt5.QtWidgets import QWidget
 
-from .base_widget import BaseWidget, get_custom_font
+from .base_widget import BaseWidget, get_dashboard_font
 
 
 class DigitalDisplay(BaseWidget):
@@ -64,12 +64,9 @@ class DigitalDisplay(BaseWidget):
         # Get value color
         value_color = self.get_value_color()
 
-        # Get custom font
-        font_name = get_custom_font()
-
         # Draw label (top)
         if self._show_label and self._label:
-            label_font = QFont(font_name, label_font_size)
+            label_font = get_dashboard_font(label_font_size)
             painter.setFont(label_font)
             painter.setPen(QColor(self.theme.TEXT_SECONDARY))
 
@@ -79,8 +76,7 @@ class DigitalDisplay(BaseWidget):
             )
 
         # Draw main value in center
-        value_font = QFont(font_name, value_font_size)
-        value_font.setBold(True)
+        value_font = get_dashboard_font(value_font_size, bold=True)
         painter.setFont(value_font)
         painter.setPen(value_color)
 
@@ -94,7 +90,7 @@ class DigitalDisplay(BaseWidget):
 
         # Draw unit at bottom
         if self._show_unit and self._unit_label:
-            unit_font = QFont(font_name, unit_font_size)
+            unit_font = get_dashboard_font(unit_font_size)
             painter.setFont(unit_font)
             painter.setPen(QColor(self.theme.TEXT_SECONDARY))
 
@@ -206,14 +202,11 @@ class GearIndicator(BaseWidget):
         # Draw solid background
         painter.fillRect(rect, QColor("#0A0A0A"))
 
-        # Get custom font
-        font_name = get_custom_font()
-
         # Reserve space for label
         label_space = 30
 
         # Draw label at top
-        label_font = QFont(font_name, 16)
+        label_font = get_dashboard_font(16)
         painter.setFont(label_font)
         painter.setPen(QColor(self.theme.TEXT_SECONDARY))
 
@@ -223,8 +216,7 @@ class GearIndicator(BaseWidget):
         # Draw gear - large, centered in remaining space
         gear_area_height = rect.height() - label_space
         gear_font_size = min(150, int(gear_area_height * 0.7))
-        gear_font = QFont(font_name, gear_font_size)
-        gear_font.setBold(True)
+        gear_font = get_dashboard_font(gear_font_size, bold=True)
         painter.setFont(gear_font)
         painter.setPen(self.get_gear_color())
 
@@ -7,10 +7,10 @@ Used for secondary metrics like temperatures, pressures, and voltages.
 from typing import Optional
 
 from PyQt5.QtCore import QRectF, Qt
-from PyQt5.QtGui import QBrush, QColor, QFont, QPainter, QPen
+from PyQt5.QtGui import QBrush, QColor, QPainter, QPen
 from PyQt5.QtWidgets import QWidget
 
-from .base_widget import BaseWidget, get_custom_font
+from .base_widget import BaseWidget, get_dashboard_font
 
 
 class MetricBox(BaseWidget):
@@ -46,8 +46,24 @@ class MetricBox(BaseWidget):
         # Padding
         self._padding: int = 8
 
+        self._cache_theme_colors()
+
         self.setMinimumSize(120, 80)
 
+    def _cache_theme_colors(self) -> None:
+        """Resolve the theme colors used by paintEvent into Qt objects."""
+        theme = self.theme
+        self._base_brush = QBrush(QColor("#0A0A0A"))
+        self._border_pen = QPen(QColor(theme.BOX_BORDER), 1)
+        self._box_brush = QBrush(QColor(theme.BOX_BACKGROUND))
+        self._label_color = QColor(theme.BOX_LABEL)
+        self._unit_color = QColor(theme.TEXT_SECONDARY)
+
+    def refresh_theme(self) -> None:
+        """Refresh theme reference, cached colors, and repaint."""
+        super().refresh_theme()
+        self._cache_theme_colors()
+
     def set_decimals(self, decimals: int) -> None:
         """Set number of decimal places."""
         self._decimals = decimals
@@ -75,12 +91,12 @@ class MetricBox(BaseWidget):
 
         # Always draw solid background first
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(QColor("#0A0A0A")))
+        painter.setBrush(self._base_brush)
         painter.drawRect(rect)
 
         # Draw background and border
-        painter.setPen(QPen(QColor(self.theme.BOX_BORDER), 1))
-        painter.setBrush(QBrush(QColor(self.theme.BOX_BACKGROUND)))
+        painter.setPen(self._border_pen)
+        painter.setBrush(self._box_brush)
         painter.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 4, 4)
 
         # Calculate text areas
@@ -100,13 +116,10 @@ class MetricBox(BaseWidget):
         )
         value_font_size = max(value_font_size, 18)  # Minimum readable size
 
-        # Get custom font
-        font_name = get_custom_font()
-
         # Draw label
-        label_font = QFont(font_name, label_font_size)
+        label_font = get_dashboard_font(label_font_size)
         painter.setFont(label_font)
-        painter.setPen(QColor(self.theme.BOX_LABEL))
+        painter.setPen(self._label_color)
 
         label_rect = QRectF(
             inner_rect.left(), inner_rect.top(), inner_rect.width(), label_height
@@ -114,8 +127,7 @@ class MetricBox(BaseWidget):
         painter.drawText(label_rect, int(Qt.AlignLeft | Qt.AlignTop), self._label)
 
         # Draw value - right aligned
-        value_font = QFont(font_name, value_font_size)
-        value_font.setBold(True)
+        value_font = get_dashboard_font(value_font_size, bold=True)
         painter.setFont(value_font)
         painter.setPen(self.get_value_color())
 
@@ -131,9 +143,9 @@ class MetricBox(BaseWidget):
 
         # Draw unit
         if self._unit_label:
-            unit_font = QFont(font_name, label_font_size)
+            unit_font = get_dashboard_font(label_font_size)
             painter.setFont(unit_font)
-            painter.setPen(QColor(self.theme.TEXT_SECONDARY))
+            painter.setPen(self._unit_color)
 
             unit_rect = QRectF(
                 inner_rect.left(),
@@ -0,0 +1,135 @@
+"""Tests for the dashboard window."""
+
+from src.core.app import DashboardApp, DashboardWindow
+from src.core.config import Config
+from src.data.mock_source import MockDataSource
+
+
+class TestDashboardWindow:
+    """Tests for DashboardWindow."""
+
+    def test_data_updates_layout(self, qtbot, sample_vehicle_state):
+        """Emitted states should reach the layout."""
+        source = MockDataSource()
+        window = DashboardWindow(Config(), source)
+        qtbot.addWidget(window)
+
+        source.data_updated.emit(sample_vehicle_state)
+        gear = window.layout.get_widget("gear")
+
+        qtbot.waitUntil(lambda: gear.gear == sample_vehicle_state.gear, timeout=500)
+
+    def test_updates_coalesced_to_latest_state(self, qtbot):
+        """Bursts of states should render only the newest one."""
+        from src.data.models import VehicleState
+
+        source = MockDataSource()
+        window = DashboardWindow(Config(), source)
+        qtbot.addWidget(window)
+
+        for gear in (1, 2, 3):
+            source.data_updated.emit(VehicleState(gear=gear))
+
+        assert window._pending_state.gear == 3
+        window._flush_state()
+        assert window.layout.get_widget("gear").gear == 3
+        assert window._pending_state is None
+
+    def test_connection_changes_update_status(self, qtbot):
+        """Connection changes should toggle the status label."""
+        source = MockDataSource()
+        window = DashboardWindow(Config(), source)
+        qtbot.addWidget(window)
+        status = window.layout.get_widget("status")
+
+        source.connection_changed.emit(False)
+        assert status.text() == "Disconnected"
+
+        source.connection_changed.emit(True)
+        assert status.text() == "Connected"
+
+    def test_hidden_window_idles_source(self, qtbot):
+        """Hiding the dashboard should drop the source to its keepalive rate."""
+        source = MockDataSource(update_rate_hz=30)
+        window = DashboardWindow(Config(), source)
+        qtbot.addWidget(window)
+
+        window.show()
+        qtbot.waitExposed(window)
+        assert source._timer.interval() == source._update_interval
+
+        window.hide()
+        assert source._timer.interval() == source.KEEPALIVE_INTERVAL_MS
+
+
+class TestDashboardApp:
+    """Tests for DashboardApp startup sequencing."""
+
+    def _make_app(self, qapp):
+        """Build a DashboardApp around the test QApplication."""
+        from src.layouts import SplashScreen
+
+        config = Config()
+        config.display.fullscreen = False
+        dash = DashboardApp(config, use_mock=True)
+        dash.app = qapp
+        dash.splash = SplashScreen(config.splash_duration_ms)
+        return dash
+
+    def test_window_waits_for_probe(self, qapp):
+        """Splash finishing before the probe should defer the window."""
+        dash = self._make_app(qapp)
+
+        dash._on_splash_finished()
+        assert dash.window is None
+
+        dash._init_data_source(False)
+        assert dash.window is not None
+        dash.cleanup()
+
+    def test_window_shown_after_splash(self, qapp):
+        """A probe finishing first should leave the window to the splash."""
+        dash = self._make_app(qapp)
+
+        dash._init_data_source(False)
+        assert dash.window is None
+
+        dash._on_splash_finished()
+        assert dash.window is not None
+        dash.cleanup()
+
+
+class TestInitWorker:
+    """Tests for the background startup probe."""
+
+    def _run(self, qtbot, worker_args):
+        """Run an _InitWorker inline and return the reported CAN readiness."""
+        from src.core.app import _InitSignals, _InitWorker
+
+        signals = _InitSignals()
+        with qtbot.waitSignal(signals.probed, timeout=1000) as blocker:
+            _InitWorker(*worker_args, signals).run()
+        return blocker.args[0]
+
+    def test_forced_mock_skips_probe_and_warms_up(self, qtbot, monkeypatch):
+        """--mock should never probe CAN and should warm the kernels."""
+        from src.core import app
+
+        warmed = []
+        monkeypatch.setattr(app, "is_can_available", lambda: True)
+        monkeypatch.setattr(app, "warm_up_sim_kernels", lambda: warmed.append(1))
+
+        assert self._run(qtbot, (True, True)) is False
+        assert warmed == [1]
+
+    def test_failure_still_reports(self, qtbot, monkeypatch):
+        """A probe exception should report mock rather than hang the splash."""
+        from src.core import app
+
+        def fail():
+            raise OSError("probe failed")
+
+        monkeypatch.setattr(app, "is_can_available", fail)
+        monkeypatch.setattr(app, "warm_up_sim_kernels", lambda: None)
+
+        assert self._run(qtbot, (True, False)) is False
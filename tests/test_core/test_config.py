@@ -0,0 +1,143 @@
+"""Tests for configuration loading and saving."""
+
+import pickle
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from src.core.config import Config
+from src.core.constants import DEFAULT_CONFIG_PATH, GaugeId
+
+
+class TestConfig:
+    """Tests for Config."""
+
+    def test_defaults(self):
+        """Default config should include all gauges."""
+        config = Config()
+
+        assert config.display.width == 1920
+        assert config.can.base_id == 0x600
+        assert config.gauges[GaugeId.RPM].critical == 7200
+        assert len(config.gauges) == 8
+
+    def test_load_missing_file_uses_defaults(self, tmp_path):
+        """Missing config file should fall back to defaults."""
+        config = Config.load(tmp_path / "missing.yaml")
+        assert config.app_name == "RoboDash"
+
+    def test_load_default_file(self):
+        """Bundled default.yaml should load."""
+        config = Config.load(DEFAULT_CONFIG_PATH)
+
+        assert config.can.channel == "can0"
+        assert config.gauges[GaugeId.OIL_PRESSURE].warning_low == 1.0
+        assert len(config.gauges[GaugeId.RPM].zones) == 3
+
+    def test_save_load_roundtrip(self, tmp_path):
+        """Saved config should load back with the same values."""
+        path = tmp_path / "config.yaml"
+        config = Config()
+        config.can.channel = "vcan0"
+        config.display.fullscreen = False
+        config.display.opengl = True
+        gauges = list(config.gauges)
+        gauges[GaugeId.BOOST] = replace(gauges[GaugeId.BOOST], warning=1.5)
+        config.gauges = tuple(gauges)
+
+        config.save(path)
+        loaded = Config.load(path)
+
+        assert loaded.can.channel == "vcan0"
+        assert loaded.display.fullscreen is False
+        assert loaded.display.opengl is True
+        assert loaded.gauges[GaugeId.BOOST].warning == 1.5
+        assert loaded.gauges[GaugeId.RPM].zones == config.gauges[GaugeId.RPM].zones
+
+    def test_from_dict_partial_sections(self):
+        """Keys missing from a YAML section should keep their defaults."""
+        config = Config._from_dict(
+            {
+                "can": {"channel": "vcan0"},
+                "gauges": {"rpm": {"max": 9000}, "unknown": {"max": 1}},
+            }
+        )
+
+        assert config.can.channel == "vcan0"
+        assert config.can.bitrate == Config().can.bitrate
+        assert config.gauges[GaugeId.RPM].max == 9000
+        assert config.gauges_by_name["rpm"].critical == 7200
+        assert "unknown" not in config.gauges_by_name
+
+    def test_default_gauges_shared_not_mutated(self):
+        """Overrides should copy gauges instead of editing the shared defaults."""
+        defaults = Config()
+        config = Config._from_dict({"gauges": {"rpm": {"max": 9000}}})
+
+        assert defaults.gauges[GaugeId.BOOST] is config.gauges[GaugeId.BOOST]
+        assert defaults.gauges[GaugeId.RPM].max == 8000
+        assert Config().gauges[GaugeId.RPM].max == 8000
+
+    def test_default_gauges_immutable(self):
+        """Shared default gauges should reject in-place edits."""
+        config = Config()
+
+        with pytest.raises(FrozenInstanceError):
+            config.gauges[GaugeId.RPM].max = 9000
+        assert isinstance(config.gauges[GaugeId.RPM].zones, tuple)
+        assert Config().gauges[GaugeId.RPM].max == 8000
+
+    def test_gauges_survive_pickle(self):
+        """Frozen slotted gauges should round-trip through the cache pickle."""
+        gauge = Config().gauges[GaugeId.RPM]
+        assert pickle.loads(pickle.dumps(gauge)) == gauge
+
+    def test_load_writes_cache(self, tmp_path):
+        """Loading a config should write a pickle cache beside it."""
+        path = tmp_path / "config.yaml"
+        Config().save(path)
+
+        first = Config.load(path)
+        cached = Config.load(path)
+
+        assert len(list((tmp_path / ".cache").glob("*.pickle"))) == 1
+        assert cached == first
+
+    def test_cache_invalidated_on_edit(self, tmp_path):
+        """Editing the YAML should bypass and replace the stale cache."""
+        path = tmp_path / "config.yaml"
+        Config().save(path)
+        Config.load(path)
+
+        config = Config()
+        config.splash_duration_ms = 12345
+        config.save(path)
+
+        assert Config.load(path).splash_duration_ms == 12345
+        assert len(list((tmp_path / ".cache").glob("*.pickle"))) == 1
+
+    def test_to_dict_matches_fields(self):
+        """to_dict should cover every dataclass field."""
+        from dataclasses import asdict
+
+        config = Config()
+
+        assert config.display.to_dict() == asdict(config.display)
+        assert config.can.to_dict() == asdict(config.can)
+        assert config.units.to_dict() == asdict(config.units)
+        rpm = config.gauges[GaugeId.RPM]
+        expected = asdict(rpm)
+        expected["zones"] = [
+            {"start": start, "end": end, "color": color}
+            for start, end, color in rpm.zones
+        ]
+        assert rpm.to_dict() == expected
+
+    def test_section_configs_are_slotted(self):
+        """Section dataclasses should not carry a per-instance __dict__."""
+        config = Config()
+
+        assert not hasattr(config.display, "__dict__")
+        assert not hasattr(config.can, "__dict__")
+        assert not hasattr(config.units, "__dict__")
+        assert not hasattr(config.gauges[GaugeId.RPM], "__dict__")
@@ -0,0 +1,30 @@
+"""Tests for the command line entry point."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+
+def test_version_skips_qt_import():
+    """--version should exit before the Qt application is imported."""
+    code = (
+        "import sys\n"
+        "sys.argv = ['robodash', '--version']\n"
+        "from src.main import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('PyQt5' in sys.modules, 'src.core.app' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "RoboDash" in result.stdout
+    assert result.stdout.splitlines()[-1] == "False False"
@@ -0,0 +1,90 @@
+"""Tests for the CAN data source."""
+
+import time
+
+import pytest
+
+can = pytest.importorskip("can")
+
+from src.data.can_source import CANDataSource  # noqa: E402
+from src.data.models import VehicleState  # noqa: E402
+
+
+class TestCANDataSourceRing:
+    """Tests for the reader-to-GUI state handoff."""
+
+    def test_drain_emits_newest_state(self, qtbot):
+        """Draining should emit only the most recent queued state."""
+        source = CANDataSource()
+        received = []
+        source.data_updated.connect(received.append)
+
+        for gear in (1, 2, 3):
+            source._ring.append(VehicleState(gear=gear))
+        source._drain_ring()
+
+        assert [state.gear for state in received] == [3]
+        assert len(source._ring) == 0
+
+    def test_reader_hands_off_copies(self, qtbot):
+        """Queued states should not alias the decoder's reused buffers."""
+        source = CANDataSource(base_id=0x600)
+        frames = [(0x600 + frame, b"\x00" * 8) for _ in range(3) for frame in range(8)]
+
+        class FakeBus:
+            def recv(self, timeout=None):
+                if not frames:
+                    source._running = False
+                    return None
+                arbitration_id, data = frames.pop(0)
+                return can.Message(arbitration_id=arbitration_id, data=data)
+
+        source._bus = FakeBus()
+        source._running = True
+        source._read_loop()
+
+        assert len(source._ring) == 3
+        for state in source._ring:
+            assert state is not source._decoder._state
+        assert len({id(state) for state in source._ring}) == 3
+
+    def test_drain_without_states_emits_nothing(self, qtbot):
+        """An empty ring should not emit."""
+        source = CANDataSource()
+        received = []
+        source.data_updated.connect(received.append)
+
+        source._drain_ring()
+
+        assert received == []
+
+    def test_drain_updates_connection(self, qtbot):
+        """Draining should flip connection status from the reader's stamp."""
+        source = CANDataSource(timeout_ms=1000)
+        changes = []
+        source.connection_changed.connect(changes.append)
+
+        source._last_complete_ns = time.monotonic_ns()
+        source._drain_ring()
+        source._last_complete_ns -= 2_000_000_000
+        source._drain_ring()
+
+        assert changes == [True, False]
+
+
+class TestCANDataSourceFilters:
+    """Tests for the kernel receive filter."""
+
+    def test_filter_matches_emu_block(self, qtbot):
+        """An 8-aligned base ID should yield a single 0x7F8 mask filter."""
+        source = CANDataSource(base_id=0x600)
+
+        assert source._can_filters() == [
+            {"can_id": 0x600, "can_mask": 0x7F8, "extended": False}
+        ]
+
+    def test_unaligned_base_id_disables_filter(self, qtbot):
+        """A base ID the mask cannot express should receive everything."""
+        source = CANDataSource(base_id=0x603)
+
+        assert source._can_filters() is None
@@ -1,9 +1,12 @@
 """Tests for EMU Black protocol decoder."""
 
 import struct
+import time
+
+import pytest
 
 from src.data.emu_protocol import EMUProtocolDecoder
-from src.data.models import VehicleState
+from src.data.models import EngineFlags, VehicleState, WarningFlags
 
 
 class TestEMUProtocolDecoder:
@@ -58,6 +61,51 @@ class TestEMUProtocolDecoder:
         # Last frame should trigger state return
         assert isinstance(result, VehicleState)
 
+    def test_complete_sets_are_snapshots(self):
+        """Complete sets should return fresh snapshots and carry values forward."""
+        decoder = EMUProtocolDecoder()
+        frame0 = struct.pack("<HBbHH", 3000, 100, 25, 1500, 0)
+
+        def send_set():
+            decoder.process_message(0x600, frame0)
+            for i in range(1, 8):
+                result = decoder.process_message(0x600 + i, b"\x00" * 8)
+            return result
+
+        first = send_set()
+
+        # The working state keeps the last complete values
+        assert decoder._state is not first
+        assert decoder._state.rpm == 3000
+
+        second = send_set()
+        third = send_set()
+
+        assert len({id(first), id(second), id(third)}) == 3
+        assert first.rpm == 3000
+
+    def test_derived_values_survive_buffer_flip(self):
+        """Unchanged raw inputs should keep their derived values on each set."""
+        decoder = EMUProtocolDecoder()
+        frame0 = struct.pack("<HBbHH", 3000, 100, 25, 2000, 0)
+        frame1 = struct.pack("<HBxHH", 500, 35, 9000, 300)
+
+        def send_set():
+            decoder.process_message(0x600, frame0)
+            decoder.process_message(0x601, frame1)
+            for i in range(2, 8):
+                result = decoder.process_message(0x600 + i, b"\x00" * 8)
+            return result
+
+        first = send_set()
+        second = send_set()
+
+        assert second is not first
+        assert second.boost_pressure == first.boost_pressure
+        assert second.afr == first.afr
+        assert second.injector_duty == first.injector_duty
+        assert abs(second.boost_pressure - 0.987) < 0.001
+
     def test_frame_0_decoding(self):
         """Frame 0 should decode RPM, TPS, IAT, MAP correctly."""
         decoder = EMUProtocolDecoder()
@@ -87,6 +135,44 @@ class TestEMUProtocolDecoder:
         assert decoder._state.ignition_angle == 28
         assert decoder._state.battery_voltage == 13.8
 
+    def test_frame_1_decoding(self):
+        """Frame 1 should decode lambda, fuel pressure and injector duty."""
+        decoder = EMUProtocolDecoder()
+        decoder._state.rpm = 6000
+
+        # PW=5.00ms, target=0.85, lambda=1.0000, fuel=3.00 bar
+        frame1 = struct.pack("<HBxHH", 500, 35, 10000, 300)
+        decoder.process_message(0x601, frame1)
+
+        assert decoder._state.lambda_target == 0.85
+        assert decoder._state.lambda_value == 1.0
+        assert decoder._state.afr == 14.7
+        assert decoder._state.fuel_pressure == 3.0
+        assert abs(decoder._state.injector_duty - 25.0) < 0.01
+
+    def test_frame_3_and_4_decoding(self):
+        """Frames 3 and 4 should decode temperatures, oil pressure and EGTs."""
+        decoder = EMUProtocolDecoder()
+
+        decoder.process_message(0x603, struct.pack("<hhxxxx", 905, -105))
+        decoder.process_message(0x604, struct.pack("<HHHxx", 450, 820, 835))
+
+        assert abs(decoder._state.coolant_temp - 90.5) < 0.001
+        assert abs(decoder._state.oil_temp - -10.5) < 0.001
+        assert decoder._state.oil_pressure == 4.5
+        assert decoder._state.egt1 == 820
+        assert decoder._state.egt2 == 835
+
+    def test_frame_5_decoding(self):
+        """Frame 5 should decode engine and warning flags."""
+        decoder = EMUProtocolDecoder()
+
+        frame5 = struct.pack("<BHxxxxx", 0x05, 0x0102)
+        decoder.process_message(0x605, frame5)
+
+        assert decoder._state.flags == EngineFlags(0x05)
+        assert decoder._state.warnings == WarningFlags(0x0102)
+
     def test_boost_calculation(self):
         """Boost should be calculated from MAP."""
         decoder = EMUProtocolDecoder()
@@ -110,7 +196,7 @@ class TestEMUProtocolDecoder:
         decoder.reset()
 
         # Internal frame data should be cleared
-        assert len(decoder._frame_data) == 0
+        assert decoder._received_mask == 0
 
 
 class TestEMUProtocolDecoderTiming:
@@ -130,3 +216,14 @@ class TestEMUProtocolDecoderTiming:
             decoder.process_message(0x600 + i, b"\x00" * 8)
 
         assert decoder.is_receiving
+
+    def test_complete_set_stamped_with_monotonic_clock(self):
+        """Completed states should carry a monotonic nanosecond timestamp."""
+        decoder = EMUProtocolDecoder()
+        before = time.monotonic_ns()
+
+        for i in range(8):
+            state = decoder.process_message(0x600 + i, b"\x00" * 8)
+
+        assert before <= state.timestamp_ns <= time.monotonic_ns()
+        assert state.timestamp == pytest.approx(state.timestamp_ns * 1e-9)
@@ -1,5 +1,9 @@
 """Tests for mock data source."""
 
+import math
+
+import pytest
+
 from src.data.mock_source import MockDataSource
 from src.data.models import VehicleState
 
@@ -37,6 +41,28 @@ class TestMockDataSource:
 
         source.stop()
 
+    def test_emits_state_scalars(self, qtbot):
+        """Typed scalars should mirror the emitted VehicleState."""
+        source = MockDataSource(update_rate_hz=30)
+        states = []
+        source.data_updated.connect(states.append)
+
+        with qtbot.waitSignal(source.state_scalars, timeout=500) as blocker:
+            source.start()
+        source.stop()
+
+        state = states[-1]
+        assert blocker.args == [
+            state.rpm,
+            state.speed,
+            state.boost_pressure,
+            state.coolant_temp,
+            state.oil_temp,
+            state.oil_pressure,
+            state.afr,
+            state.battery_voltage,
+        ]
+
     def test_data_has_reasonable_values(self, qtbot):
         """Emitted data should have reasonable values."""
         source = MockDataSource(update_rate_hz=30)
@@ -122,3 +148,132 @@ class TestMockDataSourceConnection:
             source.stop()
 
         assert blocker.args[0] is False
+
+    def test_history_records_emitted_states(self):
+        """Enabled history should record every emitted state."""
+        source = MockDataSource(update_rate_hz=30)
+        history = source.enable_history(capacity=16)
+
+        source._emit_state(VehicleState(rpm=3000))
+        source._emit_state(VehicleState(rpm=3500))
+
+        assert source.history is history
+        assert list(history.channel("rpm")) == [3000, 3500]
+
+    def test_history_replaced_on_reenable(self):
+        """Re-enabling history should stop feeding the old ring."""
+        source = MockDataSource(update_rate_hz=30)
+        old = source.enable_history(capacity=16)
+        new = source.enable_history(capacity=16)
+
+        source._emit_state(VehicleState(rpm=3000))
+
+        assert len(old) == 0
+        assert list(new.channel("rpm")) == [3000]
+
+    def test_sensor_block_refills_on_wrap(self):
+        """Precomputed sensor channels should stay in range and refill."""
+        source = MockDataSource(update_rate_hz=30)
+        states = []
+        source.data_updated.connect(lambda state: states.append(state.copy()))
+
+        for _ in range(source._block_size + 1):
+            source._generate_data()
+
+        assert source._block_idx == 1
+        for state in states:
+            assert 23.0 <= state.intake_temp <= 27.0
+            assert 13.5 <= state.battery_voltage <= 14.1
+
+    def test_states_are_pooled(self):
+        """Emitted states should be recycled after POOL_SIZE ticks."""
+        source = MockDataSource(update_rate_hz=30)
+        states = []
+        source.data_updated.connect(states.append)
+
+        for _ in range(source.POOL_SIZE + 1):
+            source._generate_data()
+
+        assert states[0] is states[source.POOL_SIZE]
+        assert len({id(state) for state in states}) == source.POOL_SIZE
+
+    def test_throttle_cycle_tracks_sine(self):
+        """The rotated throttle cycle should match sin(0.3 * time)."""
+        source = MockDataSource(update_rate_hz=30)
+        source.data_updated.connect(lambda state: None)
+
+        for _ in range(1000):
+            source._generate_data()
+
+        assert source._time > 0
+        assert source._cycle_sin == pytest.approx(
+            math.sin(source._time * 0.3), abs=1e-6
+        )
+
+    def test_skips_simulation_without_consumers(self):
+        """Ticks with nothing connected should not advance the simulation."""
+        source = MockDataSource(update_rate_hz=30)
+
+        source._generate_data()
+
+        assert source._time == 0.0
+
+    def test_simulates_for_scalar_only_consumers(self):
+        """A consumer of state_scalars alone should keep the simulation running."""
+        source = MockDataSource(update_rate_hz=30)
+        rpms = []
+        source.state_scalars.connect(lambda rpm, *rest: rpms.append(rpm))
+
+        source._generate_data()
+
+        assert source._time > 0
+        assert len(rpms) == 1
+
+    def test_rpm_stays_float(self):
+        """Integer RPM inputs should be stored as float for the kernels."""
+        source = MockDataSource(update_rate_hz=30)
+
+        source.set_rpm(3000)
+        assert type(source._rpm) is float
+
+        source._gear = 3
+        source._shift_down()
+        assert type(source._rpm) is float
+
+    def test_tick_reuses_warm_kernel(self):
+        """A real tick should not compile a second step_rpm specialization."""
+        pytest.importorskip("numba")
+        from src.data import _sim_kernels
+
+        _sim_kernels.warm_up()
+        source = MockDataSource(update_rate_hz=30)
+        source.data_updated.connect(lambda state: None)
+        source.set_rpm(3000)
+
+        source._generate_data()
+
+        assert len(_sim_kernels.step_rpm.signatures) == 1
+
+    def test_afr_follows_load_bucket(self):
+        """AFR should be stoich at idle, richer at part and full throttle."""
+        source = MockDataSource()
+
+        for throttle, center in ((10.0, 14.7), (50.0, 13.5), (90.0, 11.5)):
+            source._throttle = throttle
+            assert source._calculate_afr() == center  # Noise row is zero
+
+        assert source._load_bucket() == 2
+
+    def test_sound_rpm_updates_throttled(self):
+        """Engine sound should only see rate-limited, audible RPM changes."""
+        source = MockDataSource(update_rate_hz=60)
+        calls = []
+        source._engine_sound = type("Sound", (), {"set_rpm": calls.append})()
+
+        source._rpm = 3000
+        source._update_rpm = lambda dt: None  # Hold RPM steady
+        for _ in range(6):
+            source._generate_data()
+
+        # 60 Hz ticks at 20 Hz sound updates; RPM never moves after the first
+        assert calls == [3000]
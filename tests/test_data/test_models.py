@@ -0,0 +1,73 @@
+"""Tests for vehicle state models."""
+
+import pytest
+
+from src.data.models import (
+    EngineFlags,
+    StateHistory,
+    VehicleState,
+    WarningFlags,
+)
+
+
+class TestVehicleState:
+    """Tests for VehicleState."""
+
+    def test_is_slotted(self):
+        """States should not carry a per-instance __dict__."""
+        assert not hasattr(VehicleState(), "__dict__")
+
+    def test_copy_is_independent(self):
+        """copy() should produce an equal but separate state."""
+        state = VehicleState(rpm=4500, gear=3)
+        clone = state.copy()
+
+        assert clone == state
+        clone.rpm = 1000
+        assert state.rpm == 4500
+
+    def test_construction_reads_no_clock(self):
+        """States are left unstamped until a source stamps them."""
+        assert VehicleState().timestamp_ns == 0
+
+    def test_flags_stored_as_ints(self):
+        """Flags are raw ints but wrap back into their IntFlag types."""
+        state = VehicleState(flags=0x08, warnings=0x0081)
+
+        assert state.engine_flags == EngineFlags.IDLE
+        assert WarningFlags.KNOCKING in state.warning_flags
+        assert state.has_warnings
+        assert state.has_sensor_faults
+
+    def test_alarm_is_not_sensor_fault(self):
+        """Alarm bits alone should not count as sensor faults."""
+        state = VehicleState(warnings=int(WarningFlags.OIL_PRESSURE))
+
+        assert state.has_warnings
+        assert not state.has_sensor_faults
+
+    def test_speed_mph(self):
+        """speed_mph should convert the km/h speed."""
+        assert VehicleState(speed=100.0).speed_mph == pytest.approx(62.1371)
+
+
+class TestStateHistory:
+    """Tests for StateHistory."""
+
+    def test_channel_before_wrap(self):
+        """Channels should return only the states appended so far."""
+        history = StateHistory(capacity=8)
+        for rpm in (1000, 2000, 3000):
+            history.append(VehicleState(rpm=rpm))
+
+        assert len(history) == 3
+        assert list(history.channel("rpm")) == [1000, 2000, 3000]
+
+    def test_channel_after_wrap(self):
+        """Once full, channels should hold the newest states oldest first."""
+        history = StateHistory(capacity=3)
+        for rpm in range(5):
+            history.append(VehicleState(rpm=rpm))
+
+        assert len(history) == 3
+        assert list(history.channel("rpm")) == [2, 3, 4]
@@ -0,0 +1,29 @@
+"""Tests for the mock simulation step kernels."""
+
+from src.data._sim_kernels import step_rpm, step_temperatures, step_throttle
+
+
+class TestSimKernels:
+    """Tests for the per-tick simulation steps."""
+
+    def test_full_lift_drops_throttle(self):
+        """A lift roll under the threshold should cut the throttle."""
+        throttle, accelerating = step_throttle(80.0, True, 0.5, 5000.0, 0.033, 0.0, 0.9)
+
+        assert throttle == 0.0
+        assert not accelerating
+
+    def test_rpm_respects_rev_limit(self):
+        """Full throttle should not push RPM past the rev limit."""
+        rpm = step_rpm(7490.0, 100.0, 1.0, 850.0, 7500.0, 0.0)
+
+        assert rpm == 7500.0
+
+    def test_temperatures_clamped(self):
+        """Temperatures should stay within their clamp range."""
+        coolant, oil = step_temperatures(
+            129.9, 149.9, 100.0, 7000.0, 6, 120.0, 1.0, 1 / 720000, 5.0, 5.0
+        )
+
+        assert coolant == 130.0
+        assert oil == 150.0
@@ -1,9 +1,11 @@
 """Tests for race layout."""
 
 import pytest
+from PyQt5.QtGui import QColor, QPalette
 
 from src.data.models import VehicleState
 from src.layouts.race_layout import RaceLayout
+from src.themes import get_current_theme
 
 
 class TestRaceLayout:
@@ -39,6 +41,16 @@ class TestRaceLayout:
         # Status
         assert layout.get_widget("status") is not None
 
+    def test_themeable_widgets_tracked(self, qtbot):
+        """Only widgets with refresh_theme should be cached for theming."""
+        layout = RaceLayout()
+        qtbot.addWidget(layout)
+
+        themeable = [w for w in layout._widgets.values() if hasattr(w, "refresh_theme")]
+        assert layout._themeable == themeable
+
+        layout.refresh_theme()
+
     def test_update_from_state(self, qtbot, sample_vehicle_state):
         """Layout should update from VehicleState."""
         layout = RaceLayout()
@@ -51,6 +63,46 @@ class TestRaceLayout:
         gear_widget = layout.get_widget("gear")
         assert gear_widget.gear == sample_vehicle_state.gear
 
+    def test_update_from_state_fans_out(self, qtbot, sample_vehicle_state):
+        """Every bound widget should receive its state field."""
+        layout = RaceLayout()
+        qtbot.addWidget(layout)
+        state = sample_vehicle_state
+
+        layout.update_from_state(state)
+
+        assert layout.get_widget("rpm_display").value == state.rpm
+        assert layout.get_widget("rpm_bar").value == state.rpm
+        # Rounded to the whole mph the display shows
+        assert layout.get_widget("speed").value == round(state.speed_mph)
+        assert layout.get_widget("boost").value == state.boost_pressure
+        assert layout.get_widget("oil_pressure").value == state.oil_pressure
+        assert layout.get_widget("oil_temp").value == state.oil_temp
+        assert layout.get_widget("coolant_temp").value == state.coolant_temp
+        assert layout.get_widget("afr").value == pytest.approx(state.afr)
+        assert layout.get_widget("fuel_level").value == state.fuel_level
+        assert layout.get_widget("battery").value == pytest.approx(
+            state.battery_voltage
+        )
+
+    def test_update_skips_undisplayed_changes(self, qtbot, sample_vehicle_state):
+        """Changes below a widget's display precision should not be written."""
+        layout = RaceLayout()
+        qtbot.addWidget(layout)
+        coolant = layout.get_widget("coolant_temp")
+        layout.update_from_state(sample_vehicle_state)
+
+        writes = []
+        coolant.value_changed.connect(writes.append)
+        state = sample_vehicle_state.copy()
+        state.coolant_temp += 0.2  # Coolant shows whole degrees
+        layout.update_from_state(state)
+        assert writes == []
+
+        state.coolant_temp += 1.0
+        layout.update_from_state(state)
+        assert writes == [round(state.coolant_temp)]
+
     def test_warning_indicators(self, qtbot, warning_vehicle_state):
         """Metric boxes should reflect warning values."""
         layout = RaceLayout()
@@ -78,6 +130,69 @@ class TestRaceLayout:
         layout.hide_connection_warning()
         assert "Connected" in status.text()
 
+    @pytest.fixture
+    def themed_app(self, qapp):
+        """Apply the theme stylesheet app-wide for the duration of a test."""
+        qapp.setStyleSheet(get_current_theme().to_stylesheet())
+        yield qapp
+        qapp.setStyleSheet("")
+
+    def test_connection_warning_styled_by_theme(self, qtbot, themed_app):
+        """Connection toggles should restyle via the app-wide theme sheet."""
+        layout = RaceLayout()
+        qtbot.addWidget(layout)
+        status = layout.get_widget("status")
+        assert status.objectName() == "ConnectionStatus"
+
+        layout.show_connection_warning()
+        assert status.property("warn") is True
+        assert status.palette().color(QPalette.WindowText) == QColor(
+            layout.theme.CRITICAL
+        )
+
+        layout.hide_connection_warning()
+        assert status.property("warn") is False
+        assert status.palette().color(QPalette.WindowText) == QColor(
+            layout.theme.ROBOTECHY_GREEN
+        )
+        assert status.styleSheet() == ""
+
+    def test_connection_warning_only_restyles_on_change(self, qtbot, monkeypatch):
+        """Repeated show/hide calls should not re-polish the status label."""
+        layout = RaceLayout()
+        qtbot.addWidget(layout)
+        calls = []
+        set_status_warn = layout._set_status_warn
+
+        def record(warn):
+            calls.append(warn)
+            set_status_warn(warn)
+
+        monkeypatch.setattr(layout, "_set_status_warn", record)
+
+        layout.hide_connection_warning()  # Starts connected
+        layout.show_connection_warning()
+        layout.show_connection_warning()
+        layout.hide_connection_warning()
+        assert calls == [True, False]
+
+    def test_right_panel_geometry(self, qtbot):
+        """Right panel cells should tile the panel without overlapping."""
+        layout = RaceLayout()
+        qtbot.addWidget(layout)
+        keys = ("oil_pressure", "oil_temp", "coolant_temp", "afr", "battery")
+        keys += ("boost", "fuel_level")
+        rects = [layout.get_widget(key).geometry() for key in keys]
+        panel = layout.get_widget("fuel_level").parentWidget()
+
+        for i, rect in enumerate(rects):
+            assert panel.rect().contains(rect)
+            assert rect.width() > 0 and rect.height() >= 100
+            assert not any(rect.intersects(other) for other in rects[i + 1 :])
+        # Fuel bar spans both columns
+        assert rects[-1].left() == rects[0].left()
+        assert rects[-1].right() == rects[1].right()
+
     def test_correct_dimensions(self, qtbot):
         """Layout should have correct dimensions for screen."""
         from src.core.constants import SCREEN_HEIGHT, SCREEN_WIDTH
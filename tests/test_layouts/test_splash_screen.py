@@ -0,0 +1,81 @@
+"""Tests for the splash screen."""
+
+from PyQt5.QtGui import QColor, QPixmap
+
+from src.layouts import splash_screen
+from src.layouts.splash_screen import SplashScreen
+
+
+class TestSplashScreen:
+    """Tests for SplashScreen."""
+
+    def test_scaled_logo_cached(self, qtbot, tmp_path):
+        """A logo should be decoded and scaled once per path and height."""
+        path = str(tmp_path / "logo.png")
+        source = QPixmap(40, 20)
+        source.fill(QColor("#9EFF11"))
+        assert source.save(path)
+
+        logo = splash_screen._scaled_logo(path, 10)
+        assert logo.height() == 10
+        assert logo.width() == 20
+        assert splash_screen._scaled_logo(path, 10) is logo
+        assert splash_screen._scaled_logo(path, 30).height() == 30
+
+    def test_frame_composited_with_centered_logo(self, qtbot, monkeypatch):
+        """The background and centered logo should be pre-composited."""
+        logo = QPixmap(100, 50)
+        monkeypatch.setattr(SplashScreen, "_load_logo", lambda self: None)
+        splash = SplashScreen(duration_ms=10)
+        qtbot.addWidget(splash)
+
+        logo.fill(QColor("#FFFFFF"))
+        splash._logo_pixmap = logo
+        splash._compose_frame()
+        assert splash._logo_x == (splash.width() - 100) // 2
+        assert splash._logo_y == (splash.height() - 50) // 2
+
+        frame = splash._frame.toImage()
+        assert frame.size() == splash.size()
+        background = QColor(splash._theme.BACKGROUND)
+        assert frame.pixelColor(0, 0) == background
+        assert frame.pixelColor(splash._logo_x, splash._logo_y) == QColor("#FFFFFF")
+
+    def test_placeholder_logo_prerendered(self, qtbot, monkeypatch):
+        """Without a logo file the placeholder R should be rendered once."""
+        monkeypatch.setattr(splash_screen, "ROBOTECHY_LOGO_EXISTS", False)
+        splash = SplashScreen(duration_ms=10)
+        qtbot.addWidget(splash)
+
+        assert splash._logo_pixmap is not None
+        assert splash._logo_pixmap.size() == splash.size()
+        assert (splash._logo_x, splash._logo_y) == (0, 0)
+        image = splash._logo_pixmap.toImage()
+        assert image.pixelColor(0, 0).alpha() == 0
+        assert not image.isGrayscale()  # Green R was drawn
+
+    def test_fades_animate_window_opacity(self, qtbot):
+        """Fades should animate the window opacity, not a graphics effect."""
+        splash = SplashScreen(duration_ms=10)
+        qtbot.addWidget(splash)
+
+        assert splash.graphicsEffect() is None
+        for anim in (splash._fade_in_anim, splash._fade_out_anim):
+            assert anim.targetObject() is splash
+            assert anim.propertyName() == b"windowOpacity"
+
+    def test_skip_during_fade_out_finishes_once(self, qtbot):
+        """Skipping mid fade-out should emit finished exactly once."""
+        splash = SplashScreen(duration_ms=10_000)
+        qtbot.addWidget(splash)
+        finished = []
+        splash.finished.connect(lambda: finished.append(True))
+
+        splash.start()
+        splash._start_fade_out()
+        splash.skip()
+        assert splash._fade_out_anim.duration() == 500
+
+        qtbot.waitUntil(lambda: bool(finished), timeout=2000)
+        qtbot.wait(600)  # Past the end of the original fade out
+        assert finished == [True]
@@ -0,0 +1 @@
+"""Theme tests."""
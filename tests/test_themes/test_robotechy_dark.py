@@ -0,0 +1,58 @@
+"""Tests for the Robotechy dark theme."""
+
+import pytest
+
+from src.themes.robotechy_dark import RobotechyDarkTheme
+
+
+class TestRobotechyDarkTheme:
+    """Tests for RobotechyDarkTheme."""
+
+    def test_stylesheet_uses_theme_colors(self):
+        """Stylesheet should be formatted from the theme's colors."""
+        theme = RobotechyDarkTheme(BACKGROUND="#123456")
+        stylesheet = theme.to_stylesheet()
+        assert "#123456" in stylesheet
+        assert theme.TEXT_PRIMARY in stylesheet
+
+    def test_stylesheet_is_cached(self):
+        """Repeat calls should return the same string object."""
+        theme = RobotechyDarkTheme()
+        assert theme.to_stylesheet() is theme.to_stylesheet()
+        assert RobotechyDarkTheme().to_stylesheet() == theme.to_stylesheet()
+
+    def test_rpm_zone_colors_cached(self):
+        """RPM zones should be an immutable table built once per theme."""
+        theme = RobotechyDarkTheme()
+        zones = theme.get_rpm_zone_colors()
+        assert zones is theme.get_rpm_zone_colors()
+        assert zones[0] == (0.0, 0.75, theme.RPM_ZONE_NORMAL)
+        assert zones[-1] == (0.85, 1.0, theme.RPM_ZONE_REDLINE)
+
+        custom = RobotechyDarkTheme(RPM_ZONE_REDLINE="#FF00FF")
+        assert custom.get_rpm_zone_colors()[-1][2] == "#FF00FF"
+
+    def test_boost_colors_cached(self):
+        """Boost colors should be a read-only mapping built once per theme."""
+        theme = RobotechyDarkTheme()
+        colors = theme.get_boost_colors()
+        assert colors is theme.get_boost_colors()
+        assert colors["vacuum"] == theme.BOOST_VACUUM
+        with pytest.raises(TypeError):
+            colors["boost"] = "#000000"
+
+    def test_threshold_color_fn(self):
+        """Threshold color functions should match the widget state rules."""
+        theme = RobotechyDarkTheme()
+        color = theme.make_threshold_color_fn(warning=105, critical=115, warning_low=12)
+        assert color(90) == theme.NORMAL
+        assert color(105) == theme.WARNING
+        assert color(115) == theme.CRITICAL
+        assert color(12) == theme.WARNING
+
+    def test_threshold_color_fn_without_thresholds(self):
+        """Unset thresholds should never trigger."""
+        theme = RobotechyDarkTheme()
+        color = theme.make_threshold_color_fn()
+        assert color(1e9) == theme.NORMAL
+        assert color(-1e9) == theme.NORMAL
@@ -0,0 +1,71 @@
+"""Tests for the theme manager."""
+
+import shutil
+
+import pytest
+
+from src.core import constants
+from src.themes.robotechy_dark import RobotechyDarkTheme
+from src.themes.theme_manager import ThemeManager
+
+
+@pytest.fixture
+def fonts_dir(tmp_path, monkeypatch):
+    """Fonts directory holding a loadable regular and a corrupt bold face."""
+    shutil.copy(constants.JAPANESE_ROBOT_TTF, tmp_path / "Roboto-Regular.ttf")
+    (tmp_path / "Roboto-Bold.ttf").write_bytes(b"not a font")
+    monkeypatch.setattr(constants, "FONTS_DIR", tmp_path)
+    return tmp_path
+
+
+class TestThemeManager:
+    """Tests for ThemeManager."""
+
+    def test_fonts_registered_from_memory_once(self, qapp, fonts_dir):
+        """Each font file should be registered once and its data kept."""
+        manager = ThemeManager()
+        manager._load_fonts()
+
+        assert list(manager._loaded_font_ids) == ["Roboto-Regular.ttf"]
+        assert manager._font_data["Roboto-Regular.ttf"].size() > 0
+
+        font_id = manager._loaded_font_ids["Roboto-Regular.ttf"]
+        manager._load_fonts()
+        assert manager._loaded_font_ids["Roboto-Regular.ttf"] == font_id
+
+    def test_failed_and_missing_fonts_not_retried(self, qapp, fonts_dir, caplog):
+        """Missing or failed font files should only be tried once."""
+        (fonts_dir / "Roboto-Regular.ttf").unlink()
+        manager = ThemeManager()
+        manager._load_fonts()
+
+        shutil.copy(constants.JAPANESE_ROBOT_TTF, fonts_dir / "Roboto-Regular.ttf")
+        caplog.clear()
+        manager._load_fonts()
+
+        assert manager._loaded_font_ids == {}
+        assert manager._fonts_attempted == {"Roboto-Regular.ttf", "Roboto-Bold.ttf"}
+        assert "Failed to load font" not in caplog.text
+
+    @pytest.fixture
+    def themed_app(self, qapp):
+        """Restore the default font and an empty stylesheet after a test."""
+        font = qapp.font()
+        yield qapp
+        qapp.setStyleSheet("")
+        qapp.setFont(font)
+
+    def test_unchanged_stylesheet_not_reapplied(self, themed_app, monkeypatch):
+        """Re-applying an identical theme should not reset the stylesheet."""
+        manager = ThemeManager()
+        manager.apply_to_application(themed_app)
+
+        calls = []
+        monkeypatch.setattr(themed_app, "setStyleSheet", calls.append)
+        manager.register_theme("copy", RobotechyDarkTheme())
+        manager.set_theme("copy")
+        assert calls == []
+
+        manager.register_theme("blue", RobotechyDarkTheme(BACKGROUND="#000080"))
+        manager.set_theme("blue")
+        assert len(calls) == 1 and "#000080" in calls[0]
@@ -0,0 +1,146 @@
+"""Tests for the engine sound synthesizer."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pygame")
+
+from src.utils.engine_sound import (  # noqa: E402
+    BUFFER_SIZE,
+    SAMPLE_RATE,
+    EngineSoundSynthesizer,
+)
+
+
+@pytest.fixture
+def synth():
+    """Synthesizer held at a steady 6000 RPM."""
+    synth = EngineSoundSynthesizer()
+    if not synth.is_enabled:
+        pytest.skip("audio device not available")
+    synth._rpm = synth._target_rpm = 6000.0
+    return synth
+
+
+class TestEngineSoundSynthesizer:
+    """Tests for EngineSoundSynthesizer."""
+
+    def test_buffer_shape_and_range(self, synth):
+        """Buffers should be float32 samples within +/-1.0."""
+        samples = synth._generate_samples(BUFFER_SIZE)
+
+        assert samples.shape == (BUFFER_SIZE,)
+        assert samples.dtype == np.float32
+        assert 0.2 < np.abs(samples).max() <= 1.0
+
+    def test_redline_plays_near_full_level(self, synth):
+        """Redline should peak near the 0.9 output level."""
+        synth._rpm = synth._target_rpm = synth.REDLINE_RPM
+        peak = max(
+            np.abs(synth._generate_samples(BUFFER_SIZE)).max() for _ in range(50)
+        )
+
+        assert 0.8 <= peak <= 1.0
+
+    def test_buffers_reuse_preallocated_memory(self, synth):
+        """Each buffer should be rendered into the same float32 array."""
+        first = synth._generate_samples(BUFFER_SIZE)
+        second = synth._generate_samples(BUFFER_SIZE)
+
+        assert first is second is synth._samples
+
+    def test_louder_at_higher_rpm(self, synth):
+        """The fixed gain should let RPM volume scaling come through."""
+        synth._rpm = synth._target_rpm = synth.IDLE_RPM
+        idle = np.sqrt(np.mean(synth._generate_samples(BUFFER_SIZE) ** 2))
+        synth._rpm = synth._target_rpm = synth.REDLINE_RPM
+        redline = np.sqrt(np.mean(synth._generate_samples(BUFFER_SIZE) ** 2))
+
+        assert redline > idle
+
+    @pytest.mark.parametrize("rpm", [2000.0, 4000.0, 6000.0])
+    def test_dominant_frequency_is_firing_rate(self, synth, rpm):
+        """The loudest component should be the firing frequency."""
+        synth._rpm = synth._target_rpm = rpm
+        samples = synth._generate_samples(BUFFER_SIZE)
+
+        spectrum = np.abs(np.fft.rfft(samples * np.hanning(BUFFER_SIZE)))
+        freqs = np.fft.rfftfreq(BUFFER_SIZE, 1.0 / SAMPLE_RATE)
+        firing_freq = rpm / 60.0 * synth.CYLINDERS / 2
+        bin_width = SAMPLE_RATE / BUFFER_SIZE
+        assert abs(freqs[np.argmax(spectrum)] - firing_freq) <= bin_width
+
+    def test_ring_buffers_view_sound_data(self, synth):
+        """Ring slots should write straight into their reusable Sounds."""
+        import pygame
+
+        synth.start()
+        try:
+            assert len(synth._ring) == len(synth._sounds)
+            for ring, sound in zip(synth._ring, synth._sounds):
+                assert ring.dtype == np.int16
+                assert np.shares_memory(ring, pygame.sndarray.samples(sound))
+        finally:
+            synth.stop()
+
+    def test_waveform_continuous_across_buffers(self, synth):
+        """Consecutive buffers should join without a phase jump."""
+        synth._rpm = synth._target_rpm = 3000.0
+        first = synth._generate_samples(BUFFER_SIZE).copy()
+        second = synth._generate_samples(BUFFER_SIZE)
+
+        seam = abs(float(second[0]) - float(first[-1]))
+        typical_step = float(np.abs(np.diff(first)).max())
+        assert seam <= typical_step * 1.5
+        assert np.all(
+            (synth._harmonic_phase >= 0) & (synth._harmonic_phase < 2 * np.pi)
+        )
+
+    def test_noise_windows_cycle_through_table(self, synth):
+        """Noise should come from successive windows of the static table."""
+        size = len(synth._noise)
+
+        first = synth._next_noise(BUFFER_SIZE)
+        second = synth._next_noise(BUFFER_SIZE)
+
+        np.testing.assert_array_equal(first, synth._noise[:BUFFER_SIZE])
+        np.testing.assert_array_equal(
+            second, synth._noise[BUFFER_SIZE : 2 * BUFFER_SIZE]
+        )
+
+        synth._noise_idx = size - 10
+        wrapped = synth._next_noise(BUFFER_SIZE)
+        np.testing.assert_array_equal(wrapped[:10], synth._noise[-10:])
+        np.testing.assert_array_equal(wrapped[10:], synth._noise[: BUFFER_SIZE - 10])
+        assert synth._noise_idx == BUFFER_SIZE - 10
+
+    def test_gear_sounds_prerendered_at_volume(self, synth):
+        """Gear change Sounds should be cached and rebuilt on volume change."""
+        import pygame
+
+        upshift = synth._upshift_sound
+        synth.play_gear_change(upshift=True)
+        assert synth._upshift_sound is upshift
+
+        synth.set_volume(0.25)
+        data = pygame.sndarray.samples(synth._upshift_sound)
+        expected = (synth._upshift_samples * 32767 * 0.25).astype(np.int16)
+        np.testing.assert_array_equal(data, expected)
+        assert np.abs(synth._downshift_samples).max() == pytest.approx(0.7)
+
+    def test_pop_fires_when_schedule_runs_out(self, synth):
+        """A due pop should add the template and schedule the next one."""
+        synth._rpm = synth._target_rpm = synth.IDLE_RPM
+        synth._noise[:] = 0.0
+        synth._pop_countdown = 10**9
+        quiet = synth._generate_samples(BUFFER_SIZE).copy()
+
+        synth._reset_phases()
+        synth._pop_countdown = 1
+        synth._pop_sign = 1
+        popped = synth._generate_samples(BUFFER_SIZE)
+
+        assert popped[0] - quiet[0] == pytest.approx(
+            0.3 * synth._norm_target * 0.6, rel=1e-3
+        )
+        assert synth._pop_countdown >= 0
@@ -0,0 +1,171 @@
+"""Tests for value smoothing utilities."""
+
+import numpy as np
+import pytest
+
+from src.data.models import VehicleState
+from src.utils.smoothing import (
+    ExponentialMovingAverage,
+    ValueSmoother,
+    _ema_vectorized,
+)
+
+
+class TestExponentialMovingAverage:
+    """Tests for ExponentialMovingAverage."""
+
+    def test_first_value_seeds_filter(self):
+        """First update should return the input unchanged."""
+        ema = ExponentialMovingAverage(alpha=0.5)
+        assert ema.update(10.0) == 10.0
+
+    def test_smoothing(self):
+        """Subsequent updates should blend toward the input."""
+        ema = ExponentialMovingAverage(alpha=0.5, initial_value=0.0)
+        assert ema.update(10.0) == 5.0
+        assert ema.update(10.0) == 7.5
+
+    def test_alpha_change_applies_after_seeding(self):
+        """Changing alpha should take effect on the fast update path."""
+        ema = ExponentialMovingAverage(alpha=0.5)
+        ema.update(0.0)
+        ema.alpha = 0.25
+
+        assert ema.update(8.0) == 2.0
+
+    def test_reset_reseeds_from_next_input(self):
+        """After an empty reset the next input should seed the filter again."""
+        ema = ExponentialMovingAverage(alpha=0.5, initial_value=0.0)
+        ema.update(10.0)
+        ema.reset()
+
+        assert ema.update(4.0) == 4.0
+        assert ema.update(8.0) == 6.0
+
+    def test_invalid_alpha(self):
+        """Alpha outside (0, 1] should be rejected."""
+        with pytest.raises(ValueError):
+            ExponentialMovingAverage(alpha=0.0)
+
+
+class TestValueSmoother:
+    """Tests for ValueSmoother."""
+
+    def test_update_matches_ema(self):
+        """Per-channel update should follow the EMA formula."""
+        smoother = ValueSmoother()
+        smoother.configure("rpm", alpha=0.5)
+
+        assert smoother.update("rpm", 1000) == 1000
+        assert smoother.update("rpm", 2000) == 1500
+        assert smoother.get("rpm") == 1500
+
+    def test_disabled_channel_passes_through(self):
+        """Disabled channels should return raw values."""
+        smoother = ValueSmoother()
+        smoother.configure("afr", enabled=False)
+
+        smoother.update("afr", 14.7)
+        assert smoother.update("afr", 11.0) == 11.0
+
+    def test_unknown_channel_uses_default_alpha(self):
+        """Unconfigured channels should be smoothed with alpha 0.3."""
+        smoother = ValueSmoother()
+
+        smoother.update("custom", 0.0)
+        assert smoother.update("custom", 10.0) == pytest.approx(3.0)
+
+    def test_reconfigure_after_update(self):
+        """Reconfiguring a channel should rebind its update function."""
+        smoother = ValueSmoother()
+        smoother.configure("rpm", alpha=0.5)
+        smoother.update("rpm", 0.0)
+
+        smoother.configure("rpm", alpha=0.25)
+        assert smoother.update("rpm", 8.0) == 2.0
+
+        smoother.configure("rpm", enabled=False)
+        assert smoother.update("rpm", 100.0) == 100.0
+
+    def test_new_channel_keeps_existing_state(self):
+        """Adding a channel should not lose other channels' filter state."""
+        smoother = ValueSmoother()
+        smoother.configure("rpm", alpha=0.5)
+        smoother.update("rpm", 0.0)
+
+        smoother.update("custom", 1.0)
+        assert smoother.update("rpm", 10.0) == 5.0
+        assert smoother.get("rpm") == 5.0
+
+    def test_reset(self):
+        """Reset should clear filter state."""
+        smoother = ValueSmoother()
+        smoother.update("rpm", 1000)
+
+        smoother.reset("rpm")
+        assert smoother.get("rpm") is None
+        assert smoother.update("rpm", 3000) == 3000
+
+        smoother.update("speed", 50)
+        smoother.reset()
+        assert smoother.get("speed") is None
+
+    def test_smooth_state_matches_per_channel_update(self):
+        """smooth_state should agree with updating each channel separately."""
+        batch = ValueSmoother()
+        single = ValueSmoother()
+
+        for rpm, coolant in ((1000, 80.0), (3000, 90.0), (6000, 95.0)):
+            state = VehicleState(rpm=rpm, coolant_temp=coolant, gear=3)
+            smoothed = batch.smooth_state(state)
+
+        assert smoothed.gear == 3
+        for rpm in (1000, 3000, 6000):
+            expected_rpm = single.update("rpm", rpm)
+        for coolant in (80.0, 90.0, 95.0):
+            expected_coolant = single.update("coolant_temp", coolant)
+
+        assert smoothed.rpm == int(expected_rpm)
+        assert smoothed.coolant_temp == pytest.approx(expected_coolant)
+        assert batch.get("coolant_temp") == pytest.approx(expected_coolant)
+
+    def test_smooth_state_keeps_field_positions(self):
+        """The first smoothed state should equal its input field for field."""
+        state = VehicleState(
+            rpm=4200,
+            speed=88.0,
+            gear=4,
+            boost_pressure=0.9,
+            oil_pressure=4.5,
+            egt2=650.0,
+            afr=12.8,
+            lambda_target=0.85,
+            tps=64.0,
+            battery_voltage=13.9,
+            fuel_level=42.0,
+            timestamp_ns=123,
+        )
+
+        smoothed = ValueSmoother().smooth_state(state)
+
+        assert smoothed == state
+
+
+class TestEmaKernel:
+    """Tests for the multi-channel EMA update."""
+
+    def test_vectorized_matches_kernel_rules(self):
+        """The NumPy EMA fallback should seed, blend and pass through per channel."""
+        values = np.array([0.0, 10.0, 10.0, 5.0])
+        raw = np.array([4.0, 20.0, 20.0, 7.0])
+        alphas = np.full(4, 0.5)
+        enabled = np.array([True, True, False, False])
+        primed = np.array([False, True, True, False])
+        out = np.zeros(4)
+
+        _ema_vectorized(values, raw, alphas, enabled, primed, out)
+
+        # Seeded, blended, then two disabled channels passed through raw
+        np.testing.assert_array_equal(out, [4.0, 15.0, 20.0, 7.0])
+        np.testing.assert_array_equal(values, [4.0, 15.0, 10.0, 5.0])
+        np.testing.assert_array_equal(primed, [True, True, True, False])
@@ -0,0 +1,56 @@
+"""Tests for metric box widget."""
+
+import pytest
+from PyQt5.QtGui import QColor
+
+from src.widgets.metric_box import MetricBox
+
+
+class TestMetricBox:
+    """Tests for MetricBox widget."""
+
+    @pytest.mark.parametrize(
+        "value,state", [(50, "normal"), (105, "warning"), (120, "critical")]
+    )
+    def test_value_color_follows_thresholds(self, qtbot, value, state):
+        """Value color should track the threshold state."""
+        box = MetricBox("Coolant Temp")
+        qtbot.addWidget(box)
+        box.set_range(0, 140)
+        box.set_thresholds(warning=105, critical=115)
+
+        box.value = value
+        expected = {
+            "normal": box.theme.NORMAL,
+            "warning": box.theme.WARNING,
+            "critical": box.theme.CRITICAL,
+        }[state]
+        assert box.get_value_state() == state
+        assert box.get_value_color_hex() == expected
+        assert box.get_value_color().name().upper() == expected
+
+    def test_thresholds_can_be_cleared(self, qtbot):
+        """Clearing thresholds should return the color to normal."""
+        box = MetricBox("Battery")
+        qtbot.addWidget(box)
+        box.set_range(10, 16)
+        box.set_thresholds(warning_low=12.0)
+        box.value = 11.0
+        assert box.get_value_color_hex() == box.theme.WARNING
+
+        box.set_thresholds()
+        assert box.get_value_color_hex() == box.theme.NORMAL
+
+    def test_theme_colors_follow_refresh(self, qtbot, monkeypatch):
+        """Cached paint colors should be re-resolved on theme refresh."""
+        from src.themes.robotechy_dark import RobotechyDarkTheme
+        from src.widgets import base_widget
+
+        box = MetricBox("Oil Temp")
+        qtbot.addWidget(box)
+        assert box._label_color == QColor(box.theme.BOX_LABEL)
+
+        theme = RobotechyDarkTheme(BOX_LABEL="#123456")
+        monkeypatch.setattr(base_widget, "get_current_theme", lambda: theme)
+        box.refresh_theme()
+        assert box._label_color == QColor("#123456")